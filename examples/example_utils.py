@@ -0,0 +1,108 @@
+"""
+Shared Helpers for the MCP Appium Examples
+==========================================
+
+JSON helpers that use orjson when it is installed, and a minimal command line
+parser for examples that keep start-up cheap by not importing argparse.
+
+The examples import this module as a sibling, e.g.:
+    from example_utils import format_json, json_loads
+"""
+
+import json
+import sys
+from types import SimpleNamespace
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+# orjson (optional) speeds up encoding/decoding and pretty-printing of JSON
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize an object to compact JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def json_loads(data: Any) -> Any:
+    """Deserialize JSON from str or bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def format_json(obj: Any) -> str:
+    """Pretty-print an object as JSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2)
+
+
+def _usage_error(usage: str, message: str):
+    """Print the usage line and an error message, then exit with status 2."""
+    prog = usage.split()[1]
+    sys.stderr.write(usage.split("\n", 1)[0] + f"\n{prog}: error: {message}\n")
+    sys.exit(2)
+
+
+def parse_options(
+    argv: Optional[List[str]],
+    usage: str,
+    options: Mapping[str, str],
+    defaults: Dict[str, Any],
+    choices: Optional[Mapping[str, Sequence[str]]] = None
+) -> SimpleNamespace:
+    """
+    Parse ``--flag value`` / ``--flag=value`` options the way argparse would.
+    
+    Args:
+        argv: Arguments to parse (default: sys.argv[1:])
+        usage: Help text; its first line is the usage line printed on errors
+        options: Flag -> attribute name
+        defaults: Attribute name -> default value
+        choices: Optional attribute name -> allowed values
+    
+    Returns:
+        SimpleNamespace: The parsed options
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    opts = dict(defaults)
+    
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ("-h", "--help"):
+            sys.stdout.write(usage)
+            sys.exit(0)
+        
+        flag, has_value, value = arg.partition("=")
+        key = options.get(flag)
+        if key is None:
+            _usage_error(usage, f"unrecognized arguments: {arg}")
+        
+        if not has_value:
+            i += 1
+            if i >= len(argv):
+                _usage_error(usage, f"argument {flag}: expected one argument")
+            value = argv[i]
+        
+        opts[key] = value
+        i += 1
+    
+    flags = {key: flag for flag, key in options.items()}
+    for key, allowed in (choices or {}).items():
+        if opts[key] not in allowed:
+            quoted = ", ".join(f"'{choice}'" for choice in allowed)
+            _usage_error(
+                usage,
+                f"argument {flags[key]}: invalid choice: '{opts[key]}' (choose from {quoted})"
+            )
+    
+    return SimpleNamespace(**opts)
@@ -11,41 +11,312 @@ It shows how to:
 """
 
 import os
-import sys
-import argparse
 import json
 import base64
+import hashlib
+import threading
 import time
-from typing import Dict, Any, List
+from collections import OrderedDict
+from pathlib import Path
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from example_utils import json_dumps, json_loads, parse_options
+
+# ijson (optional) lets large tool responses be written to disk while parsing
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 # Default server URL
 DEFAULT_SERVER_URL = "http://localhost:5000"
 
-def parse_args():
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(description="MCP Appium MCP Protocol Example")
+# File extensions for generated test scripts, by language
+_LANG_EXT = {
+    "python": "py",
+    "java": "java",
+    "javascript": "js",
+    "csharp": "cs",
+    "ruby": "rb"
+}
+
+# Static desired capabilities per platform
+_PLATFORM_CAPS = {
+    "android": {
+        "platformName": "Android",
+        "automationName": "UiAutomator2",
+        "newCommandTimeout": 300,
+        "deviceName": "Android Emulator",
+        "appPackage": "com.saucelabs.mydemoapp.android",
+        "appActivity": ".MainActivity"
+    },
+    "ios": {
+        "platformName": "iOS",
+        "automationName": "XCUITest",
+        "newCommandTimeout": 300,
+        "deviceName": "iPhone Simulator",
+        "platformVersion": "15.0"
+    }
+}
+
+# Default app per platform: the Sauce Labs Demo app for Android and a
+# placeholder path for iOS
+_DEFAULT_APP = {
+    "android": "app_tests/sauce_labs_demo/sauce_labs_demo.apk",
+    "ios": "app_tests/sample_ios_app.app"
+}
+
+# Working directory captured once for resolving relative app paths
+_CWD = os.getcwd()
+
+def _abspath(path: str) -> str:
+    """Resolve a path against the working directory captured at import."""
+    return os.path.normpath(path if os.path.isabs(path) else os.path.join(_CWD, path))
+
+# (connect, read) timeout for MCP tool calls, in seconds
+REQUEST_TIMEOUT = (3.05, 30)
+
+# Tools that only read device or AI state, so replaying their request is harmless
+READ_ONLY_TOOLS = frozenset([
+    "take_screenshot",
+    "get_page_source",
+    "find_element",
+    "describe_screen",
+    "suggest_test_actions",
+    "analyze_app_structure",
+    "interpret_command",
+    "generate_test_script"
+])
+
+# Shared HTTP sessions so sequential MCP tool calls reuse pooled connections:
+# one for read-only tools and one for tools that act on the device
+_SESSION = requests.Session()
+_SESSION.headers.update({"Content-Type": "application/json"})
+_ACTION_SESSION = requests.Session()
+_ACTION_SESSION.headers.update({"Content-Type": "application/json"})
+
+# Transport-level retry defaults for transient MCP server errors. 500 is not
+# retried because the tool may already have acted on the device.
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+def configure_retries(
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    backoff_factor: float = DEFAULT_RETRY_BACKOFF_FACTOR
+):
+    """
+    Configure transport-level retries with exponential backoff for MCP calls.
     
-    parser.add_argument(
-        "--server-url",
-        default=os.environ.get("MCP_SERVER_URL", DEFAULT_SERVER_URL),
-        help=f"URL of the MCP server (default: {DEFAULT_SERVER_URL})"
-    )
+    Retries happen inside urllib3, so call_mcp_tool only sees the final
+    response. Read-only tools are also retried on 429/502/503/504 responses.
+    Tools that act on the device (tap, input, swipe, ...) are only retried
+    when the connection could not be opened: a 502/504 from a gateway may
+    arrive after the server already ran the action, and replaying it would
+    run it twice. Values typically come from an AIModelConfig's
+    ``max_retries`` and ``retry_backoff_factor``.
     
-    parser.add_argument(
-        "--platform",
-        choices=["android", "ios"],
-        default="android",
-        help="Mobile platform (default: android)"
+    Args:
+        max_retries: Maximum number of retry attempts
+        backoff_factor: Exponential backoff factor for retry delays
+    """
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
     )
+    _SESSION.mount("http://", adapter)
+    _SESSION.mount("https://", adapter)
+    
+    action_adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=0,
+            status=0,
+            other=0,
+            backoff_factor=backoff_factor
+        )
+    )
+    _ACTION_SESSION.mount("http://", action_adapter)
+    _ACTION_SESSION.mount("https://", action_adapter)
+
+configure_retries()
+
+
+# Tools whose results only depend on their arguments. describe_screen and
+# suggest_test_actions take no arguments, so their results cannot be told
+# apart across screens, and generate_test_script is not cached either.
+CACHEABLE_TOOLS = frozenset([
+    "analyze_app_structure",
+    "interpret_command"
+])
+
+# Tools that change the device state and therefore invalidate cached results
+STATE_CHANGING_TOOLS = frozenset([
+    "connect_to_device",
+    "tap_element",
+    "input_text",
+    "swipe",
+    "press_back"
+])
+
+# Size of the base64 slices decoded per write when saving screenshots
+# (must be a multiple of 4 so each slice decodes independently)
+SCREENSHOT_CHUNK_SIZE = 64 * 1024
+
+# Default time-to-live for cached tool results, in seconds
+CACHE_TTL = 600
+
+
+class _MCPCache:
+    """
+    In-memory LRU cache for idempotent MCP tool results.
+    
+    Entries expire after their TTL and the least recently accessed entries
+    are evicted once either the entry count or the memory budget is exceeded.
+    Values are stored serialized, so every hit returns a fresh copy that the
+    caller can modify without touching the cache.
+    """
     
-    parser.add_argument(
-        "--app",
-        help="Path to the mobile app to test"
+    def __init__(self, max_entries: int = 256, max_memory: int = 16 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_memory = max_memory
+        self._entries = OrderedDict()
+        self._memory = 0
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "hit_rate": 0.0}
+    
+    def _update_hit_rate(self):
+        total = self.stats["hits"] + self.stats["misses"]
+        self.stats["hit_rate"] = self.stats["hits"] / total if total else 0.0
+    
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+        self._memory -= entry["size"]
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached value, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry["expires_at"] < time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.stats["misses"] += 1
+                self._update_hit_rate()
+                return None
+            
+            entry["last_accessed"] = time.monotonic()
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            self._update_hit_rate()
+            data = entry["data"]
+        
+        return json_loads(data)
+    
+    def set(self, key: str, value: Dict[str, Any], ttl: int = CACHE_TTL):
+        """Store a value, evicting least recently accessed entries as needed."""
+        data = json_dumps(value)
+        size = len(data)
+        if size > self.max_memory:
+            return
+        
+        now = time.monotonic()
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = {
+                "data": data,
+                "size": size,
+                "expires_at": now + ttl,
+                "last_accessed": now
+            }
+            self._memory += size
+            
+            while len(self._entries) > self.max_entries or self._memory > self.max_memory:
+                self._remove(next(iter(self._entries)))
+                self.stats["evictions"] += 1
+    
+    def clear(self):
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self._memory = 0
+
+
+_CACHE = _MCPCache()
+
+def _cache_key(server_url: str, tool_name: str, params: Dict[str, Any]) -> str:
+    """Build a stable cache key for a tool call."""
+    raw = json.dumps(
+        {"server": server_url, "name": tool_name, "arguments": params},
+        sort_keys=True
     )
+    return hashlib.blake2b(raw.encode("utf-8")).hexdigest()
+
+
+# Command line options: flag -> attribute name
+_OPTIONS = {
+    "--server-url": "server_url",
+    "--platform": "platform",
+    "--app": "app"
+}
+
+_PLATFORMS = ("android", "ios")
+
+_USAGE = f"""usage: mcp_example.py [-h] [--server-url SERVER_URL] [--platform {{android,ios}}] [--app APP]
+
+MCP Appium MCP Protocol Example
+
+options:
+  -h, --help            show this help message and exit
+  --server-url SERVER_URL
+                        URL of the MCP server (default: {DEFAULT_SERVER_URL})
+  --platform {{android,ios}}
+                        Mobile platform (default: android)
+  --app APP             Path to the mobile app to test
+"""
+
+def parse_args(argv: Optional[List[str]] = None) -> SimpleNamespace:
+    """
+    Parse command line arguments.
     
-    return parser.parse_args()
+    A minimal parser is used instead of argparse to keep start-up cheap
+    for scripted invocations.
+    
+    Args:
+        argv: Arguments to parse (default: sys.argv[1:])
+    
+    Returns:
+        Namespace with server_url, platform and app attributes
+    """
+    return parse_options(
+        argv,
+        _USAGE,
+        _OPTIONS,
+        {
+            "server_url": os.environ.get("MCP_SERVER_URL", DEFAULT_SERVER_URL),
+            "platform": "android",
+            "app": None
+        },
+        {"platform": _PLATFORMS}
+    )
 
 def call_mcp_tool(server_url: str, tool_name: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
     """
@@ -62,22 +333,123 @@ def call_mcp_tool(server_url: str, tool_name: str, params: Dict[str, Any] = None
     if params is None:
         params = {}
     
+    if tool_name in STATE_CHANGING_TOOLS:
+        _CACHE.clear()
+    
+    cache_key = None
+    if tool_name in CACHEABLE_TOOLS:
+        cache_key = _cache_key(server_url, tool_name, params)
+        cached = _CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+    
     payload = {
         "name": tool_name,
         "arguments": params
     }
     
     try:
-        response = requests.post(
+        session = _SESSION if tool_name in READ_ONLY_TOOLS else _ACTION_SESSION
+        response = session.post(
             f"{server_url}/mcp/tool",
-            json=payload,
-            headers={"Content-Type": "application/json"}
+            data=json_dumps(payload),
+            timeout=REQUEST_TIMEOUT
         )
         response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        result = json_loads(response.content)
+    except (requests.exceptions.RequestException, ValueError) as e:
         print(f"Error calling MCP tool: {str(e)}")
         return {"error": str(e)}
+    
+    if cache_key is not None and result.get("status") == "success":
+        _CACHE.set(cache_key, result)
+    return result
+
+def call_mcp_tool_to_file(
+    server_url: str,
+    tool_name: str,
+    params: Dict[str, Any],
+    field: str,
+    filename: str
+) -> Dict[str, Any]:
+    """
+    Call an MCP tool and write one (large) string field of its result to a file.
+    
+    With ijson available the response body is parsed incrementally, so the
+    full JSON document is never buffered. The written field is replaced by
+    ``<field>_path`` in the returned result.
+    
+    Args:
+        server_url: URL of the MCP server
+        tool_name: Name of the tool to call
+        params: Parameters for the tool
+        field: Name of the result field to write to the file
+        filename: Path of the output file
+    
+    Returns:
+        Dictionary with the tool result, without the written field
+    """
+    if not IJSON_AVAILABLE:
+        result = dict(call_mcp_tool(server_url, tool_name, params))
+        if result.get("status") == "success":
+            Path(filename).write_bytes(result.pop(field, "").encode("utf-8"))
+            result[f"{field}_path"] = filename
+        return result
+    
+    payload = {
+        "name": tool_name,
+        "arguments": params
+    }
+    
+    try:
+        session = _SESSION if tool_name in READ_ONLY_TOOLS else _ACTION_SESSION
+        with session.post(
+            f"{server_url}/mcp/tool",
+            data=json_dumps(payload),
+            timeout=REQUEST_TIMEOUT,
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            
+            result = {}
+            for key, value in ijson.kvitems(response.raw, ""):
+                if key == field:
+                    Path(filename).write_bytes(value.encode("utf-8"))
+                    result[f"{field}_path"] = filename
+                else:
+                    result[key] = value
+            return result
+    except (requests.exceptions.RequestException, ijson.JSONError) as e:
+        print(f"Error calling MCP tool: {str(e)}")
+        return {"error": str(e)}
+
+def call_mcp_tools_batch(
+    server_url: str,
+    specs: List[Tuple[str, Dict[str, Any]]]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Call several independent MCP tools concurrently.
+    
+    Each call goes through call_mcp_tool on the shared session from a thread
+    pool, so batched calls get the same retry and cache handling.
+    
+    Args:
+        server_url: URL of the MCP server
+        specs: List of (tool_name, params) pairs
+    
+    Returns:
+        Dictionary mapping each tool name to its result
+    """
+    if not specs:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=min(8, len(specs))) as executor:
+        futures = {
+            executor.submit(call_mcp_tool, server_url, name, params): name
+            for name, params in specs
+        }
+        return {futures[future]: future.result() for future in as_completed(futures)}
 
 def get_capabilities(args) -> Dict[str, Any]:
     """
@@ -89,30 +461,8 @@ def get_capabilities(args) -> Dict[str, Any]:
     Returns:
         Dict: Desired capabilities
     """
-    capabilities = {
-        "platformName": args.platform.capitalize(),
-        "automationName": "UiAutomator2" if args.platform == "android" else "XCUITest",
-        "newCommandTimeout": 300
-    }
-    
-    # Use the Sauce Labs Demo app as default for Android
-    if args.platform == "android" and not args.app:
-        capabilities["app"] = os.path.abspath("app_tests/sauce_labs_demo/sauce_labs_demo.apk")
-    # Use a sample app path for iOS (this is just a placeholder)
-    elif args.platform == "ios" and not args.app:
-        capabilities["app"] = os.path.abspath("app_tests/sample_ios_app.app")
-    # Use the specified app path
-    elif args.app:
-        capabilities["app"] = os.path.abspath(args.app)
-    
-    # Additional platform-specific capabilities
-    if args.platform == "android":
-        capabilities["deviceName"] = "Android Emulator"
-        capabilities["appPackage"] = "com.saucelabs.mydemoapp.android"
-        capabilities["appActivity"] = ".MainActivity"
-    else:  # iOS
-        capabilities["deviceName"] = "iPhone Simulator"
-        capabilities["platformVersion"] = "15.0"
+    capabilities = _PLATFORM_CAPS[args.platform].copy()
+    capabilities["app"] = _abspath(args.app or _DEFAULT_APP[args.platform])
     
     return capabilities
 
@@ -151,11 +501,30 @@ def take_and_save_screenshot(server_url: str, filename: str = "screenshot.png")
     """
     print("Taking screenshot...")
     result = call_mcp_tool(server_url, "take_screenshot")
+    return save_screenshot_result(result, filename)
+
+def save_screenshot_result(result: Dict[str, Any], filename: str = "screenshot.png") -> bool:
+    """
+    Save the result of a take_screenshot call to a file.
+    
+    Args:
+        result: Result of the take_screenshot tool
+        filename: Name of the file to save the screenshot to
     
+    Returns:
+        True if successful, False otherwise
+    """
     if result.get("status") == "success":
-        # Save the screenshot to a file
+        # Decode and write the screenshot in slices so the full decoded
+        # image never has to be held in memory next to its base64 form
+        encoded = result.get("screenshot", "")
+        
+        # Drop line breaks of wrapped base64 so every slice stays 4-character aligned
+        encoded = "".join(encoded.split())
+        
         with open(filename, "wb") as f:
-            f.write(base64.b64decode(result.get("screenshot")))
+            for start in range(0, len(encoded), SCREENSHOT_CHUNK_SIZE):
+                f.write(base64.b64decode(encoded[start:start + SCREENSHOT_CHUNK_SIZE]))
         print(f"Screenshot saved to {filename}")
         return True
     else:
@@ -174,7 +543,18 @@ def describe_current_screen(server_url: str) -> str:
     """
     print("Getting AI description of the current screen...")
     result = call_mcp_tool(server_url, "describe_screen")
+    return print_screen_description(result)
+
+def print_screen_description(result: Dict[str, Any]) -> str:
+    """
+    Print the result of a describe_screen call.
+    
+    Args:
+        result: Result of the describe_screen tool
     
+    Returns:
+        The screen description
+    """
     if result.get("status") == "success":
         description = result.get("description", "No description available")
         print("\nScreen Description:")
@@ -198,7 +578,18 @@ def get_test_suggestions(server_url: str) -> List[Dict[str, Any]]:
     """
     print("Getting AI test suggestions for the current screen...")
     result = call_mcp_tool(server_url, "suggest_test_actions")
+    return print_test_suggestions(result)
+
+def print_test_suggestions(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Print the result of a suggest_test_actions call.
     
+    Args:
+        result: Result of the suggest_test_actions tool
+    
+    Returns:
+        A list of test suggestions
+    """
     if result.get("status") == "success":
         suggestions = result.get("suggestions", [])
         print("\nTest Suggestions:")
@@ -245,6 +636,11 @@ def interpret_natural_language_command(server_url: str, command: str) -> Dict[st
         print(f"Failed to interpret command: {result.get('message')}")
         return {}
 
+def _test_script_filename(language: str) -> str:
+    """Build a timestamped file name for a generated test script."""
+    file_extension = _LANG_EXT.get(language, "txt")
+    return f"generated_test_{time.time_ns() // 1_000_000_000}.{file_extension}"
+
 def generate_test_script(server_url: str, test_goal: str, language: str = "python") -> str:
     """
     Generate a test script using AI.
@@ -268,15 +664,7 @@ def generate_test_script(server_url: str, test_goal: str, language: str = "pytho
         script = result.get("script", "")
         
         # Save the script to a file
-        file_extension = {
-            "python": "py",
-            "java": "java",
-            "javascript": "js",
-            "csharp": "cs",
-            "ruby": "rb"
-        }.get(language, "txt")
-        
-        filename = f"generated_test_{int(time.time())}.{file_extension}"
+        filename = _test_script_filename(language)
         with open(filename, "w") as f:
             f.write(script)
         
@@ -286,6 +674,39 @@ def generate_test_script(server_url: str, test_goal: str, language: str = "pytho
         print(f"Failed to generate test script: {result.get('message')}")
         return ""
 
+def save_generated_test_script(server_url: str, test_goal: str, language: str = "python") -> str:
+    """
+    Generate a test script using AI and save it to a file.
+    
+    Unlike generate_test_script, the script is written straight from the
+    response stream and is not returned in memory.
+    
+    Args:
+        server_url: URL of the MCP server
+        test_goal: Description of what to test
+        language: Programming language for the script
+    
+    Returns:
+        Path of the saved test script, or an empty string on failure
+    """
+    print(f"Generating {language} test script for goal: '{test_goal}'...")
+    
+    filename = _test_script_filename(language)
+    result = call_mcp_tool_to_file(
+        server_url,
+        "generate_test_script",
+        {"test_goal": test_goal, "language": language},
+        "script",
+        filename
+    )
+    
+    if result.get("status") == "success" and result.get("script_path"):
+        print(f"\nGenerated test script saved to {filename}")
+        return filename
+    else:
+        print(f"Failed to generate test script: {result.get('message')}")
+        return ""
+
 def execute_tap(server_url: str, by: str, value: str) -> bool:
     """
     Tap an element on the screen.
@@ -335,6 +756,49 @@ def input_text_to_element(server_url: str, by: str, value: str, text: str) -> bo
         print(f"Failed to input text: {result.get('message')}")
         return False
 
+def _do_tap(server_url: str, params: Dict[str, Any]) -> bool:
+    """Handle a "tap" action."""
+    return execute_tap(server_url, params.get("by"), params.get("value"))
+
+def _do_input(server_url: str, params: Dict[str, Any]) -> bool:
+    """Handle an "input" action."""
+    return input_text_to_element(
+        server_url, 
+        params.get("by"), 
+        params.get("value"), 
+        params.get("text")
+    )
+
+def _do_swipe(server_url: str, params: Dict[str, Any]) -> bool:
+    """Handle a "swipe" action."""
+    print("Swiping on screen...")
+    result = call_mcp_tool(
+        server_url,
+        "swipe",
+        {
+            "start_x": params.get("start_x"),
+            "start_y": params.get("start_y"),
+            "end_x": params.get("end_x"),
+            "end_y": params.get("end_y"),
+            "duration": params.get("duration", 500)
+        }
+    )
+    return result.get("status") == "success"
+
+def _do_back(server_url: str, params: Dict[str, Any]) -> bool:
+    """Handle a "back" action."""
+    print("Pressing back button...")
+    result = call_mcp_tool(server_url, "press_back")
+    return result.get("status") == "success"
+
+# Action handlers keyed by the AI-interpreted action type
+_HANDLERS = {
+    "tap": _do_tap,
+    "input": _do_input,
+    "swipe": _do_swipe,
+    "back": _do_back
+}
+
 def execute_action(server_url: str, action: Dict[str, Any]) -> bool:
     """
     Execute an action based on the AI interpretation.
@@ -347,38 +811,13 @@ def execute_action(server_url: str, action: Dict[str, Any]) -> bool:
         True if successful, False otherwise
     """
     action_type = action.get("action")
-    params = action.get("parameters", {})
-    
-    if action_type == "tap":
-        return execute_tap(server_url, params.get("by"), params.get("value"))
-    elif action_type == "input":
-        return input_text_to_element(
-            server_url, 
-            params.get("by"), 
-            params.get("value"), 
-            params.get("text")
-        )
-    elif action_type == "swipe":
-        print("Swiping on screen...")
-        result = call_mcp_tool(
-            server_url,
-            "swipe",
-            {
-                "start_x": params.get("start_x"),
-                "start_y": params.get("start_y"),
-                "end_x": params.get("end_x"),
-                "end_y": params.get("end_y"),
-                "duration": params.get("duration", 500)
-            }
-        )
-        return result.get("status") == "success"
-    elif action_type == "back":
-        print("Pressing back button...")
-        result = call_mcp_tool(server_url, "press_back")
-        return result.get("status") == "success"
-    else:
+    handler = _HANDLERS.get(action_type)
+    
+    if handler is None:
         print(f"Unknown action type: {action_type}")
         return False
+    
+    return handler(server_url, action.get("parameters", {}))
 
 def run_demo(server_url: str, capabilities: Dict[str, Any]):
     """
@@ -388,6 +827,8 @@ def run_demo(server_url: str, capabilities: Dict[str, Any]):
         server_url: URL of the MCP server
         capabilities: Appium capabilities
     """
+    is_android = capabilities["platformName"].lower() == "android"
+    
     # Step 1: Connect to the device
     result = connect_to_device(server_url, capabilities)
     if result.get("status") != "success":
@@ -398,17 +839,20 @@ def run_demo(server_url: str, capabilities: Dict[str, Any]):
     print("Waiting for app to load...")
     time.sleep(5)
     
-    # Step 3: Take a screenshot
-    take_and_save_screenshot(server_url)
-    
-    # Step 4: Get a description of the current screen
-    describe_current_screen(server_url)
-    
-    # Step 5: Get test suggestions
-    get_test_suggestions(server_url)
+    # Steps 3-5: Take a screenshot, describe the screen and get test suggestions.
+    # These are independent read-only queries, so dispatch them concurrently.
+    print("Taking screenshot, describing screen and getting test suggestions...")
+    results = call_mcp_tools_batch(server_url, [
+        ("take_screenshot", {}),
+        ("describe_screen", {}),
+        ("suggest_test_actions", {})
+    ])
+    save_screenshot_result(results["take_screenshot"])
+    print_screen_description(results["describe_screen"])
+    print_test_suggestions(results["suggest_test_actions"])
     
     # Step 6: Demonstrate natural language command interpretation
-    if capabilities["platformName"].lower() == "android":
+    if is_android:
         # For Sauce Labs Demo app on Android
         command = "Tap on the first product in the list"
         interpreted = interpret_natural_language_command(server_url, command)
@@ -422,10 +866,16 @@ def run_demo(server_url: str, capabilities: Dict[str, Any]):
             describe_current_screen(server_url)
     
     # Step 7: Generate a test script
-    if capabilities["platformName"].lower() == "android":
+    if is_android:
         # For Sauce Labs Demo app on Android
         test_goal = "Test the product details page functionality"
-        generate_test_script(server_url, test_goal)
+        save_generated_test_script(server_url, test_goal)
+    
+    stats = _CACHE.stats
+    print(
+        f"MCP cache: {stats['hits']} hits, {stats['misses']} misses "
+        f"(hit rate {stats['hit_rate']:.0%})"
+    )
 
 def main():
     """Run the MCP Appium MCP Protocol example."""
@@ -23,6 +23,12 @@ from mcp_appium.config import configure_logging
 configure_logging("DEBUG")
 logger = logging.getLogger(__name__)
 
+# Public methods of AppiumClient; static for the class, so computed once
+_CLIENT_PUBLIC_METHODS = tuple(
+    name for name, value in vars(AppiumClient).items()
+    if not name.startswith('_') and callable(value)
+)
+
 def demonstrate_ai_integration():
     """Demonstrate AI integration functionality using mock data."""
     logger.info("Demonstrating AI integration without server connection")
@@ -38,18 +44,19 @@ def demonstrate_ai_integration():
     )
     
     # We won't actually call the AI providers, just show the setup
-    print("\n=== AI Integration Configuration ===")
-    print(f"Timeout: {config.timeout} seconds")
-    print(f"Max retries: {config.max_retries}")
-    print(f"Retry delay: {config.retry_delay} seconds")
-    print(f"Backoff factor: {config.retry_backoff_factor}")
-    print(f"Temperature: {config.temperature}")
-    print(f"Max tokens: {config.max_tokens}")
+    lines = [
+        "\n=== AI Integration Configuration ===",
+        f"Timeout: {config.timeout} seconds",
+        f"Max retries: {config.max_retries}",
+        f"Retry delay: {config.retry_delay} seconds",
+        f"Backoff factor: {config.retry_backoff_factor}",
+        f"Temperature: {config.temperature}",
+        f"Max tokens: {config.max_tokens}"
+    ]
     
     # Display supported AI providers
-    print("\n=== Supported AI Providers ===")
-    for provider in AIProvider:
-        print(f"- {provider.value}")
+    lines.append("\n=== Supported AI Providers ===")
+    lines.extend(f"- {provider.value}" for provider in AIProvider)
     
     # Mock test data
     mock_app_info = {
@@ -75,40 +82,35 @@ def demonstrate_ai_integration():
     }
     
     # Display example app info
-    print("\n=== Mock App Structure for Analysis ===")
-    print(json.dumps(mock_app_info, indent=2))
+    lines.append("\n=== Mock App Structure for Analysis ===")
+    lines.append(json.dumps(mock_app_info, indent=2))
     
     # Display example test goals
-    print("\n=== Example Test Goals ===")
+    lines.append("\n=== Example Test Goals ===")
     test_goals = [
         "Test the login functionality with valid credentials",
         "Verify that error messages appear for invalid login attempts",
         "Test the logout functionality from the home screen"
     ]
-    for goal in test_goals:
-        print(f"- {goal}")
+    lines.extend(f"- {goal}" for goal in test_goals)
     
     # Demonstrate supported programming languages
-    print("\n=== Supported Programming Languages for Code Generation ===")
+    lines.append("\n=== Supported Programming Languages for Code Generation ===")
     languages = ["python", "java", "javascript", "csharp", "ruby", "robot"]
-    for lang in languages:
-        print(f"- {lang}")
+    lines.extend(f"- {lang}" for lang in languages)
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def demonstrate_client_structure():
     """Demonstrate the client structure without connecting to a server."""
     logger.info("Demonstrating client structure without server connection")
     
-    # Create a client (but don't connect)
-    client = AppiumClient()
-    
     # Display available client methods
-    print("\n=== Available Client Methods ===")
-    methods = [method for method in dir(client) if not method.startswith('_')]
-    for method in methods:
-        print(f"- {method}")
+    lines = ["\n=== Available Client Methods ==="]
+    lines.extend(f"- {method}" for method in _CLIENT_PUBLIC_METHODS)
     
     # Show example capabilities
-    print("\n=== Example Capabilities ===")
+    lines.append("\n=== Example Capabilities ===")
     android_caps = {
         "platformName": "Android",
         "appium:automationName": "UiAutomator2",
@@ -124,13 +126,13 @@ def demonstrate_client_structure():
         "appium:app": "/path/to/app.ipa"
     }
     
-    print("Android Capabilities:")
-    print(json.dumps(android_caps, indent=2))
-    print("\niOS Capabilities:")
-    print(json.dumps(ios_caps, indent=2))
+    lines.append("Android Capabilities:")
+    lines.append(json.dumps(android_caps, indent=2))
+    lines.append("\niOS Capabilities:")
+    lines.append(json.dumps(ios_caps, indent=2))
     
     # Display example session commands
-    print("\n=== Example Session Commands ===")
+    lines.append("\n=== Example Session Commands ===")
     session_commands = [
         "find_element(strategy, selector)",
         "find_elements(strategy, selector)",
@@ -142,8 +144,9 @@ def demonstrate_client_structure():
         "back()",
         "get_page_source()"
     ]
-    for cmd in session_commands:
-        print(f"- {cmd}")
+    lines.extend(f"- {cmd}" for cmd in session_commands)
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     """Run the mock example."""
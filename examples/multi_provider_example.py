@@ -8,56 +8,143 @@ interpreting natural language commands for mobile testing.
 """
 
 import os
-import json
 import logging
-import argparse
-from typing import Dict, Any
+import xml.etree.ElementTree as ET
+from types import SimpleNamespace
+from typing import Dict, Any, List, Optional
 
 from mcp_appium.ai_integration import (
     AIProvider, MCPAIIntegration, AIModelConfig,
     AIProviderError, AIConnectionError, AIAuthenticationError
 )
+from mcp_appium.utils import summarize_page_source
+
+from example_utils import format_json, parse_options
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def parse_args():
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(description='Run MCP Appium multi-provider AI integration example')
-    parser.add_argument('--provider', default='openai', 
-                        choices=['openai', 'gemini', 'huggingface'],
-                        help='AI provider to use (openai, gemini, huggingface)')
-    parser.add_argument('--model', help='Model name to use (optional)')
-    return parser.parse_args()
-
-def get_sample_context() -> Dict:
+def canonicalize_page_source(page_source: str) -> str:
     """
-    Get a sample context for demonstration.
+    Canonicalize a page source XML string (C14N 2.0, insignificant whitespace stripped).
     
+    Args:
+        page_source: Raw page source XML
+        
     Returns:
-        Dict: A dictionary with sample app context
+        str: Minified, canonical page source
     """
-    # Create a sample page source for a login screen
-    page_source = """
-    <hierarchy>
-      <node class="android.widget.FrameLayout" package="com.example.app" content-desc="">
-        <node class="android.widget.LinearLayout">
-          <node class="android.widget.FrameLayout" content-desc="Login Screen">
-            <node class="android.widget.EditText" resource-id="com.example.app:id/username" text="" hint="Username" />
-            <node class="android.widget.EditText" resource-id="com.example.app:id/password" text="" hint="Password" />
-            <node class="android.widget.Button" resource-id="com.example.app:id/login_button" text="Login" />
-            <node class="android.widget.TextView" resource-id="com.example.app:id/signup_link" text="Sign Up" />
-            <node class="android.widget.TextView" resource-id="com.example.app:id/forgot_password" text="Forgot Password?" />
+    return ET.canonicalize(page_source.strip(), strip_text=True)
+
+# Sample page sources, parsed and canonicalized once at import so every AI call
+# reuses the same minified string
+LOGIN_SCREEN_SOURCE = canonicalize_page_source("""
+<hierarchy>
+  <node class="android.widget.FrameLayout" package="com.example.app" content-desc="">
+    <node class="android.widget.LinearLayout">
+      <node class="android.widget.FrameLayout" content-desc="Login Screen">
+        <node class="android.widget.EditText" resource-id="com.example.app:id/username" text="" hint="Username" />
+        <node class="android.widget.EditText" resource-id="com.example.app:id/password" text="" hint="Password" />
+        <node class="android.widget.Button" resource-id="com.example.app:id/login_button" text="Login" />
+        <node class="android.widget.TextView" resource-id="com.example.app:id/signup_link" text="Sign Up" />
+        <node class="android.widget.TextView" resource-id="com.example.app:id/forgot_password" text="Forgot Password?" />
+      </node>
+    </node>
+  </node>
+</hierarchy>
+""")
+
+# One line per labelled element, sent instead of the raw XML where the model
+# only needs to know what is on screen
+LOGIN_SCREEN_SUMMARY = summarize_page_source(LOGIN_SCREEN_SOURCE)
+
+HOME_SCREEN_SOURCE = canonicalize_page_source("""
+<hierarchy>
+  <node class="android.widget.FrameLayout" package="com.example.app">
+    <node class="android.widget.LinearLayout">
+      <node class="android.widget.FrameLayout" content-desc="Home Screen">
+        <node class="android.widget.TextView" resource-id="com.example.app:id/welcome_message" text="Welcome, User!" />
+        <node class="android.widget.RecyclerView" resource-id="com.example.app:id/items_list">
+          <node class="android.widget.LinearLayout">
+            <node class="android.widget.TextView" text="Item 1" />
+          </node>
+          <node class="android.widget.LinearLayout">
+            <node class="android.widget.TextView" text="Item 2" />
           </node>
         </node>
+        <node class="android.widget.Button" resource-id="com.example.app:id/logout_button" text="Logout" />
       </node>
-    </hierarchy>
+    </node>
+  </node>
+</hierarchy>
+""")
+
+class _LazyJson:
+    """Defer JSON pretty-printing until a log record is actually emitted."""
+    
+    __slots__ = ("obj",)
+    
+    def __init__(self, obj: Any):
+        self.obj = obj
+    
+    def __str__(self) -> str:
+        return format_json(self.obj)
+
+# Command line options: flag -> attribute name
+_OPTIONS = {
+    "--provider": "provider",
+    "--model": "model"
+}
+
+_PROVIDERS = ("openai", "gemini", "huggingface")
+
+_USAGE = """usage: multi_provider_example.py [-h] [--provider {openai,gemini,huggingface}] [--model MODEL]
+
+Run MCP Appium multi-provider AI integration example
+
+options:
+  -h, --help            show this help message and exit
+  --provider {openai,gemini,huggingface}
+                        AI provider to use (openai, gemini, huggingface)
+  --model MODEL         Model name to use (optional)
+"""
+
+def parse_args(argv: Optional[List[str]] = None) -> SimpleNamespace:
     """
+    Parse command line arguments.
+    
+    A minimal parser is used instead of argparse to keep start-up cheap
+    for scripted invocations.
+    
+    Args:
+        argv: Arguments to parse (default: sys.argv[1:])
+        
+    Returns:
+        SimpleNamespace: Parsed provider and model
+    """
+    return parse_options(
+        argv,
+        _USAGE,
+        _OPTIONS,
+        {"provider": "openai", "model": None},
+        {"provider": _PROVIDERS}
+    )
+
+def get_sample_context() -> Dict:
+    """
+    Get a sample context for demonstration.
+    
+    Returns:
+        Dict: A dictionary with sample app context
+    """
+    # Use the pre-canonicalized sample page source for a login screen
+    page_source = LOGIN_SCREEN_SOURCE
     
     # Create a sample context
     return {
         "page_source": page_source,
+        "page_summary": LOGIN_SCREEN_SUMMARY,
         "current_context": "NATIVE_APP",
         "platform_name": "Android",
         "device_info": "Pixel 4 API 30",
@@ -82,66 +169,48 @@ def run_ai_commands(mcp_ai: MCPAIIntegration, context: Dict):
     ]
     
     for command in commands:
-        logger.info(f"\nCommand: \"{command}\"")
+        logger.info("\nCommand: \"%s\"", command)
         try:
             result = mcp_ai.interpret_command(command, context)
-            logger.info(f"Interpreted as: {json.dumps(result, indent=2)}")
+            logger.info("Interpreted as: %s", _LazyJson(result))
         except Exception as e:
-            logger.error(f"Error interpreting command: {e}")
+            logger.error("Error interpreting command: %s", e)
     
     # 2. Get screen description
     logger.info("\n=== Getting screen description ===")
     try:
-        description = mcp_ai.describe_screen(context["page_source"])
-        logger.info(f"Screen description:\n{description}")
+        description = mcp_ai.describe_screen(context["page_summary"])
+        logger.info("Screen description:\n%s", description)
     except Exception as e:
-        logger.error(f"Error describing screen: {e}")
+        logger.error("Error describing screen: %s", e)
     
     # 3. Get test action suggestions
     logger.info("\n=== Getting test action suggestions ===")
     try:
-        suggestions = mcp_ai.suggest_test_actions(context["page_source"])
-        logger.info(f"Test action suggestions:")
-        for i, suggestion in enumerate(suggestions, 1):
-            logger.info(f"{i}. {suggestion}")
+        suggestions = mcp_ai.suggest_test_actions(context["page_summary"])
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Test action suggestions:")
+            for i, suggestion in enumerate(suggestions, 1):
+                logger.info("%d. %s", i, suggestion)
     except Exception as e:
-        logger.error(f"Error getting test suggestions: {e}")
+        logger.error("Error getting test suggestions: %s", e)
     
     # 4. Analyze app structure and generate test script
     logger.info("\n=== Analyzing app structure ===")
     try:
-        # Create a sample for another screen (post-login)
-        home_screen = """
-        <hierarchy>
-          <node class="android.widget.FrameLayout" package="com.example.app">
-            <node class="android.widget.LinearLayout">
-              <node class="android.widget.FrameLayout" content-desc="Home Screen">
-                <node class="android.widget.TextView" resource-id="com.example.app:id/welcome_message" text="Welcome, User!" />
-                <node class="android.widget.RecyclerView" resource-id="com.example.app:id/items_list">
-                  <node class="android.widget.LinearLayout">
-                    <node class="android.widget.TextView" text="Item 1" />
-                  </node>
-                  <node class="android.widget.LinearLayout">
-                    <node class="android.widget.TextView" text="Item 2" />
-                  </node>
-                </node>
-                <node class="android.widget.Button" resource-id="com.example.app:id/logout_button" text="Logout" />
-              </node>
-            </node>
-          </node>
-        </hierarchy>
-        """
+        # Use the sample for another screen (post-login)
+        home_screen = HOME_SCREEN_SOURCE
         
         app_analysis = mcp_ai.analyze_app_structure([context["page_source"], home_screen])
-        logger.info(f"App analysis: {json.dumps(app_analysis, indent=2)}")
+        logger.info("App analysis: %s", _LazyJson(app_analysis))
         
         logger.info("\n=== Generating test script ===")
         test_goal = "Test the login functionality with valid and invalid credentials"
         test_script = mcp_ai.generate_test_script(app_analysis, test_goal)
-        logger.info(f"Generated test script:\n{test_script}")
+        logger.info("Generated test script:\n%s", test_script)
         
     except Exception as e:
-        logger.error(f"Error analyzing app structure or generating test script: {e}")
+        logger.error("Error analyzing app structure or generating test script: %s", e)
 
 def check_env_variables(provider: str):
     """
@@ -19,18 +19,23 @@ Note: For Docker setup, make sure Ollama service is included in the docker-compo
 """
 
 import argparse
-import json
+import asyncio
 import logging
 import os
 import sys
 import time
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
-# Add the parent directory to the Python path
-parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.append(parent_dir)
+# Add the parent directory to the path so we can import the mcp_appium package,
+# unless it is already importable (e.g. installed or run from the repo root)
+_PARENT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PARENT not in sys.path:
+    sys.path.insert(0, _PARENT)
 
 from mcp_appium.ai_integration import MCPAIIntegration, AIProvider, AIModelConfig
+from mcp_appium.utils import xml_to_compact_json
+
+from example_utils import format_json
 
 # Configure logging
 logging.basicConfig(
@@ -39,9 +44,70 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Sample XML from an Android screen (simplified), converted once at import to
+# a compact JSON UI tree that is shared by every demo
+PAGE_SOURCE = xml_to_compact_json("""
+<hierarchy rotation="0">
+  <android.widget.FrameLayout bounds="[0,0][1080,2400]">
+    <android.widget.LinearLayout bounds="[0,0][1080,2400]">
+      <android.widget.FrameLayout bounds="[0,81][1080,2400]">
+        <android.widget.FrameLayout bounds="[0,0][1080,2319]">
+          <android.view.ViewGroup bounds="[0,0][1080,2319]">
+            <android.view.ViewGroup bounds="[0,0][1080,2319]">
+              <android.widget.TextView bounds="[43,66][402,156]" text="Products" />
+              <android.widget.ImageView bounds="[978,66][1036,156]" content-desc="Cart with items" />
+              <android.view.ViewGroup bounds="[0,177][1080,2319]">
+                <android.widget.ScrollView bounds="[0,0][1080,2142]">
+                  <android.view.ViewGroup bounds="[0,0][1080,1708]">
+                    <android.view.ViewGroup bounds="[0,0][1080,1708]">
+                      <android.view.ViewGroup bounds="[42,0][519,650]">
+                        <android.widget.ImageView bounds="[42,22][519,354]" content-desc="Sauce Labs Backpack" />
+                        <android.widget.TextView bounds="[42,376][519,431]" text="Sauce Labs Backpack" />
+                        <android.widget.TextView bounds="[42,443][519,480]" text="$29.99" />
+                      </android.view.ViewGroup>
+                      <android.view.ViewGroup bounds="[561,0][1038,650]">
+                        <android.widget.ImageView bounds="[561,22][1038,354]" content-desc="Sauce Labs Bike Light" />
+                        <android.widget.TextView bounds="[561,376][1038,431]" text="Sauce Labs Bike Light" />
+                        <android.widget.TextView bounds="[561,443][1038,480]" text="$9.99" />
+                      </android.view.ViewGroup>
+                      <android.view.ViewGroup bounds="[42,692][519,1342]">
+                        <android.widget.ImageView bounds="[42,714][519,1046]" content-desc="Sauce Labs Bolt T-Shirt" />
+                        <android.widget.TextView bounds="[42,1068][519,1123]" text="Sauce Labs Bolt T-Shirt" />
+                        <android.widget.TextView bounds="[42,1135][519,1172]" text="$15.99" />
+                      </android.view.ViewGroup>
+                    </android.view.ViewGroup>
+                  </android.view.ViewGroup>
+                </android.widget.ScrollView>
+              </android.view.ViewGroup>
+            </android.view.ViewGroup>
+          </android.view.ViewGroup>
+        </android.widget.FrameLayout>
+      </android.widget.FrameLayout>
+    </android.widget.LinearLayout>
+  </android.widget.FrameLayout>
+</hierarchy>
+""")
 
-def parse_args() -> argparse.Namespace:
-    """Parse command line arguments."""
+# How long Ollama keeps the model (and its prompt cache) loaded between requests
+KEEP_ALIVE = "10m"
+
+# Quantization levels offered by --quant. 4-bit Q4_K_M weights roughly double
+# tokens/sec versus fp16 on CPU and halve VRAM on GPU, with negligible quality
+# loss for these short, structured generations.
+QUANTIZATIONS = ("q4_K_M", "q5_K_M", "q8_0")
+DEFAULT_MODEL = "mistral:7b-instruct-q4_K_M"
+
+# Natural language commands to interpret against the sample screen
+DEMO_COMMANDS = [
+    "Click on the Sauce Labs Backpack",
+    "Check the price of the Bike Light",
+    "Go to the shopping cart",
+    "Scroll down to see more products"
+]
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser."""
     parser = argparse.ArgumentParser(description="Ollama Example for MCP Appium")
     
     parser.add_argument(
@@ -54,8 +120,14 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--model",
         type=str,
-        default="mistral:7b-instruct",
-        help="Ollama model to use (default: mistral:7b-instruct)"
+        default=DEFAULT_MODEL,
+        help=f"Ollama model to use (default: {DEFAULT_MODEL})"
+    )
+    
+    parser.add_argument(
+        "--quant",
+        choices=QUANTIZATIONS,
+        help="Quantization of --model to use, replacing any in its tag (e.g. q8_0)"
     )
     
     parser.add_argument(
@@ -72,10 +144,69 @@ def parse_args() -> argparse.Namespace:
         help="Maximum number of tokens to generate (default: 1024)"
     )
     
-    return parser.parse_args()
+    parser.add_argument(
+        "--timeout",
+        type=int,
+        default=30,
+        help="Seconds to wait for each Ollama request; raise for long generations (default: 30)"
+    )
+    
+    parser.add_argument(
+        "--separate",
+        action="store_true",
+        help="Run the description, suggestions and interpretations as separate concurrent requests"
+    )
+    
+    parser.add_argument(
+        "--num-parallel",
+        type=int,
+        default=os.environ.get("OLLAMA_NUM_PARALLEL", "4"),
+        help="Maximum concurrent requests; match the server's OLLAMA_NUM_PARALLEL (default: 4)"
+    )
+    
+    return parser
+
+
+# Built once at import and reused by every parse_args() call
+_PARSER = _build_parser()
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    return _PARSER.parse_args()
+
+
+def model_tag(model: str, quant: Optional[str] = None) -> str:
+    """
+    Build the Ollama model tag for a quantization level.
+    
+    Args:
+        model: Ollama model, e.g. "mistral:7b-instruct" or "mistral:7b-instruct-q4_K_M"
+        quant: Optional quantization level from QUANTIZATIONS
+        
+    Returns:
+        str: The model tag, e.g. "mistral:7b-instruct-q8_0"
+    """
+    if not quant:
+        return model
+    
+    for known in QUANTIZATIONS:
+        if model.endswith(f"-{known}"):
+            model = model[:-len(known) - 1]
+            break
+    
+    separator = "-" if ":" in model else ":"
+    return f"{model}{separator}{quant}"
 
 
-def create_mcp_ai_integration(ollama_host: str, model: str, temperature: float, max_tokens: int) -> MCPAIIntegration:
+def create_mcp_ai_integration(
+    ollama_host: str,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    max_connections: int = 8,
+    timeout: int = 30
+) -> MCPAIIntegration:
     """
     Create and initialize an MCPAIIntegration instance with Ollama.
     
@@ -84,6 +215,8 @@ def create_mcp_ai_integration(ollama_host: str, model: str, temperature: float,
         model: Name of the model to use
         temperature: Temperature for generation
         max_tokens: Maximum tokens to generate
+        max_connections: Size of the keep-alive connection pool to Ollama
+        timeout: Seconds to wait for each request
         
     Returns:
         MCPAIIntegration: The configured AI integration instance
@@ -92,8 +225,10 @@ def create_mcp_ai_integration(ollama_host: str, model: str, temperature: float,
     config = AIModelConfig(
         temperature=temperature,
         max_tokens=max_tokens,
-        timeout=120,  # Longer timeout for local models which might be slower
-        max_retries=2
+        timeout=timeout,
+        max_retries=2,  # Total attempts: one retry, and only for retryable errors
+        keep_alive=KEEP_ALIVE,
+        max_connections=max_connections
     )
     
     try:
@@ -113,147 +248,112 @@ def create_mcp_ai_integration(ollama_host: str, model: str, temperature: float,
         raise
 
 
-def demonstrate_screen_description(mcp_ai: MCPAIIntegration):
+async def demonstrate_screen_description(
+    mcp_ai: MCPAIIntegration,
+    semaphore: asyncio.Semaphore,
+    page_source: str = PAGE_SOURCE
+) -> str:
     """
     Demonstrate the screen description functionality.
     
     Args:
         mcp_ai: The MCPAIIntegration instance
+        semaphore: Semaphore bounding concurrent Ollama requests
+        page_source: Page source of the screen (default: the shared sample)
+        
+    Returns:
+        str: The screen description
     """
-    # Sample XML from an Android screen (simplified)
-    page_source = """
-    <hierarchy rotation="0">
-      <android.widget.FrameLayout bounds="[0,0][1080,2400]">
-        <android.widget.LinearLayout bounds="[0,0][1080,2400]">
-          <android.widget.FrameLayout bounds="[0,81][1080,2400]">
-            <android.widget.FrameLayout bounds="[0,0][1080,2319]">
-              <android.view.ViewGroup bounds="[0,0][1080,2319]">
-                <android.view.ViewGroup bounds="[0,0][1080,2319]">
-                  <android.widget.TextView bounds="[43,66][402,156]" text="Products" />
-                  <android.widget.ImageView bounds="[978,66][1036,156]" content-desc="Cart with items" />
-                  <android.view.ViewGroup bounds="[0,177][1080,2319]">
-                    <android.widget.ScrollView bounds="[0,0][1080,2142]">
-                      <android.view.ViewGroup bounds="[0,0][1080,1708]">
-                        <android.view.ViewGroup bounds="[0,0][1080,1708]">
-                          <android.view.ViewGroup bounds="[42,0][519,650]">
-                            <android.widget.ImageView bounds="[42,22][519,354]" content-desc="Sauce Labs Backpack" />
-                            <android.widget.TextView bounds="[42,376][519,431]" text="Sauce Labs Backpack" />
-                            <android.widget.TextView bounds="[42,443][519,480]" text="$29.99" />
-                          </android.view.ViewGroup>
-                          <android.view.ViewGroup bounds="[561,0][1038,650]">
-                            <android.widget.ImageView bounds="[561,22][1038,354]" content-desc="Sauce Labs Bike Light" />
-                            <android.widget.TextView bounds="[561,376][1038,431]" text="Sauce Labs Bike Light" />
-                            <android.widget.TextView bounds="[561,443][1038,480]" text="$9.99" />
-                          </android.view.ViewGroup>
-                          <android.view.ViewGroup bounds="[42,692][519,1342]">
-                            <android.widget.ImageView bounds="[42,714][519,1046]" content-desc="Sauce Labs Bolt T-Shirt" />
-                            <android.widget.TextView bounds="[42,1068][519,1123]" text="Sauce Labs Bolt T-Shirt" />
-                            <android.widget.TextView bounds="[42,1135][519,1172]" text="$15.99" />
-                          </android.view.ViewGroup>
-                        </android.view.ViewGroup>
-                      </android.view.ViewGroup>
-                    </android.widget.ScrollView>
-                  </android.view.ViewGroup>
-                </android.view.ViewGroup>
-              </android.view.ViewGroup>
-            </android.widget.FrameLayout>
-          </android.widget.FrameLayout>
-        </android.widget.LinearLayout>
-      </android.widget.FrameLayout>
-    </hierarchy>
-    """
-    
     logger.info("Generating screen description using Ollama...")
-    description = mcp_ai.describe_screen(page_source)
+    async with semaphore:
+        return await mcp_ai.adescribe_screen(page_source)
+
+
+def print_screen_description(description: str):
+    """
+    Print a screen description.
     
+    Args:
+        description: The screen description
+    """
     logger.info("\n--- Screen Description ---\n")
     print(description)
     print("\n-------------------------\n")
 
 
-def demonstrate_test_suggestions(mcp_ai: MCPAIIntegration):
+async def demonstrate_test_suggestions(
+    mcp_ai: MCPAIIntegration,
+    semaphore: asyncio.Semaphore,
+    page_source: str = PAGE_SOURCE
+) -> List[str]:
     """
     Demonstrate the test suggestion functionality.
     
     Args:
         mcp_ai: The MCPAIIntegration instance
+        semaphore: Semaphore bounding concurrent Ollama requests
+        page_source: Page source of the screen (default: the shared sample)
+        
+    Returns:
+        List[str]: The suggested test actions
     """
-    # Use the same page source from above
-    page_source = """
-    <hierarchy rotation="0">
-      <android.widget.FrameLayout bounds="[0,0][1080,2400]">
-        <android.widget.LinearLayout bounds="[0,0][1080,2400]">
-          <android.widget.FrameLayout bounds="[0,81][1080,2400]">
-            <android.widget.FrameLayout bounds="[0,0][1080,2319]">
-              <android.view.ViewGroup bounds="[0,0][1080,2319]">
-                <android.view.ViewGroup bounds="[0,0][1080,2319]">
-                  <android.widget.TextView bounds="[43,66][402,156]" text="Products" />
-                  <android.widget.ImageView bounds="[978,66][1036,156]" content-desc="Cart with items" />
-                  <android.view.ViewGroup bounds="[0,177][1080,2319]">
-                    <android.widget.ScrollView bounds="[0,0][1080,2142]">
-                      <android.view.ViewGroup bounds="[0,0][1080,1708]">
-                        <android.view.ViewGroup bounds="[0,0][1080,1708]">
-                          <android.view.ViewGroup bounds="[42,0][519,650]">
-                            <android.widget.ImageView bounds="[42,22][519,354]" content-desc="Sauce Labs Backpack" />
-                            <android.widget.TextView bounds="[42,376][519,431]" text="Sauce Labs Backpack" />
-                            <android.widget.TextView bounds="[42,443][519,480]" text="$29.99" />
-                          </android.view.ViewGroup>
-                          <android.view.ViewGroup bounds="[561,0][1038,650]">
-                            <android.widget.ImageView bounds="[561,22][1038,354]" content-desc="Sauce Labs Bike Light" />
-                            <android.widget.TextView bounds="[561,376][1038,431]" text="Sauce Labs Bike Light" />
-                            <android.widget.TextView bounds="[561,443][1038,480]" text="$9.99" />
-                          </android.view.ViewGroup>
-                          <android.view.ViewGroup bounds="[42,692][519,1342]">
-                            <android.widget.ImageView bounds="[42,714][519,1046]" content-desc="Sauce Labs Bolt T-Shirt" />
-                            <android.widget.TextView bounds="[42,1068][519,1123]" text="Sauce Labs Bolt T-Shirt" />
-                            <android.widget.TextView bounds="[42,1135][519,1172]" text="$15.99" />
-                          </android.view.ViewGroup>
-                        </android.view.ViewGroup>
-                      </android.view.ViewGroup>
-                    </android.widget.ScrollView>
-                  </android.view.ViewGroup>
-                </android.view.ViewGroup>
-              </android.view.ViewGroup>
-            </android.widget.FrameLayout>
-          </android.widget.FrameLayout>
-        </android.widget.LinearLayout>
-      </android.widget.FrameLayout>
-    </hierarchy>
-    """
-    
     logger.info("Generating test suggestions using Ollama...")
-    suggestions = mcp_ai.suggest_test_actions(page_source)
+    async with semaphore:
+        return await mcp_ai.asuggest_test_actions(page_source)
+
+
+def print_test_suggestions(suggestions: List[str]):
+    """
+    Print suggested test actions.
     
+    Args:
+        suggestions: The suggested test actions
+    """
     logger.info("\n--- Test Suggestions ---\n")
     for i, suggestion in enumerate(suggestions, 1):
         print(f"{i}. {suggestion}")
     print("\n-------------------------\n")
 
 
-def demonstrate_command_interpretation(mcp_ai: MCPAIIntegration):
+async def demonstrate_command_interpretation(
+    mcp_ai: MCPAIIntegration,
+    semaphore: asyncio.Semaphore
+) -> List[Tuple[str, Dict[str, Any]]]:
     """
     Demonstrate the command interpretation functionality.
     
+    All commands are sent to Ollama concurrently.
+    
     Args:
         mcp_ai: The MCPAIIntegration instance
+        semaphore: Semaphore bounding concurrent Ollama requests
+        
+    Returns:
+        List[Tuple[str, Dict[str, Any]]]: Each command with its interpretation
     """
-    # Natural language commands to interpret
-    commands = [
-        "Click on the Sauce Labs Backpack",
-        "Check the price of the Bike Light",
-        "Go to the shopping cart",
-        "Scroll down to see more products"
-    ]
-    
     logger.info("Interpreting natural language commands using Ollama...")
     
-    for cmd in commands:
+    async def interpret(cmd: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await mcp_ai.ainterpret_command(cmd)
+    
+    results = await asyncio.gather(*[interpret(cmd) for cmd in DEMO_COMMANDS])
+    return list(zip(DEMO_COMMANDS, results))
+
+
+def print_command_interpretations(interpretations: List[Tuple[str, Dict[str, Any]]]):
+    """
+    Print interpreted commands.
+    
+    Args:
+        interpretations: Each command with its interpretation
+    """
+    for cmd, result in interpretations:
         logger.info(f"\nInterpreting: '{cmd}'")
-        result = mcp_ai.interpret_command(cmd)
         
         if result.get("status") == "success":
             print(f"Action: {result.get('action')}")
-            print(f"Parameters: {json.dumps(result.get('parameters', {}), indent=2)}")
+            print(f"Parameters: {format_json(result.get('parameters', {}))}")
         else:
             print(f"Error: {result.get('message')}")
             if 'raw_response' in result:
@@ -262,26 +362,82 @@ def demonstrate_command_interpretation(mcp_ai: MCPAIIntegration):
         print("-------------------------")
 
 
+async def run_fused_demo(
+    mcp_ai: MCPAIIntegration,
+    page_source: str = PAGE_SOURCE,
+    commands: List[str] = DEMO_COMMANDS
+):
+    """
+    Run all demonstrations with a single combined Ollama request.
+    
+    The screen description, test suggestions and command interpretations
+    come back in one JSON object, so the page source is processed once.
+    
+    Args:
+        mcp_ai: The MCPAIIntegration instance
+        page_source: Page source of the screen (default: the shared sample)
+        commands: Natural language commands to interpret
+    """
+    logger.info("Describing the screen, suggesting tests and interpreting commands using Ollama...")
+    result = await mcp_ai.adescribe_suggest_and_interpret(page_source, commands)
+    
+    print_screen_description(result["description"])
+    print_test_suggestions(result["suggestions"])
+    print_command_interpretations(list(result["interpretations"].items()))
+
+
+async def run_demos(mcp_ai: MCPAIIntegration, num_parallel: int = 4):
+    """
+    Run all demonstrations in one concurrent round of Ollama requests.
+    
+    Ollama's chat endpoint takes a single conversation per request, so the
+    prompts are issued concurrently over the shared async client and the
+    results are printed in order once they are all available.
+    
+    Args:
+        mcp_ai: The MCPAIIntegration instance
+        num_parallel: Maximum number of concurrent requests
+    """
+    semaphore = asyncio.Semaphore(max(1, num_parallel))
+    
+    description, suggestions, interpretations = await asyncio.gather(
+        demonstrate_screen_description(mcp_ai, semaphore),
+        demonstrate_test_suggestions(mcp_ai, semaphore),
+        demonstrate_command_interpretation(mcp_ai, semaphore)
+    )
+    
+    print_screen_description(description)
+    print_test_suggestions(suggestions)
+    print_command_interpretations(interpretations)
+
+
 def main():
     """Run the Ollama integration example."""
     args = parse_args()
+    model = model_tag(args.model, args.quant)
     
     logger.info("Starting Ollama integration example")
     logger.info(f"Ollama host: {args.ollama_host}")
-    logger.info(f"Model: {args.model}")
+    logger.info(f"Model: {model}")
     
     try:
         mcp_ai = create_mcp_ai_integration(
             ollama_host=args.ollama_host,
-            model=args.model,
+            model=model,
             temperature=args.temperature,
-            max_tokens=args.max_tokens
+            max_tokens=args.max_tokens,
+            max_connections=args.num_parallel,
+            timeout=args.timeout
         )
         
+        # Load the model before the demos so the first request doesn't pay for it
+        mcp_ai.model.warm_up()
+        
         # Demonstrate various functionalities
-        demonstrate_screen_description(mcp_ai)
-        demonstrate_test_suggestions(mcp_ai)
-        demonstrate_command_interpretation(mcp_ai)
+        if args.separate:
+            asyncio.run(run_demos(mcp_ai, args.num_parallel))
+        else:
+            asyncio.run(run_fused_demo(mcp_ai))
         
         logger.info("Ollama integration example completed successfully")
         
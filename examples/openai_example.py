@@ -10,11 +10,14 @@ import argparse
 import logging
 import os
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 
-# Add the parent directory to the path so we can import the mcp_appium package
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add the parent directory to the path so we can import the mcp_appium package,
+# unless it is already importable (e.g. installed or run from the repo root)
+_PARENT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PARENT not in sys.path:
+    sys.path.insert(0, _PARENT)
 
 from mcp_appium.openai_integration import MCPOpenAIIntegration
 
@@ -27,8 +30,8 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def parse_args():
-    """Parse command line arguments."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser."""
     parser = argparse.ArgumentParser(description='MCP Appium OpenAI Integration Example')
     
     parser.add_argument(
@@ -49,7 +52,16 @@ def parse_args():
         help='Path to the mobile app (.apk or .ipa)'
     )
     
-    return parser.parse_args()
+    return parser
+
+
+# Built once at import and reused by every parse_args() call
+_PARSER = _build_parser()
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    return _PARSER.parse_args()
 
 
 def get_capabilities(args) -> Dict[str, Any]:
@@ -98,18 +110,23 @@ def run_natural_language_commands(mcp: MCPOpenAIIntegration):
     Args:
         mcp: The MCPOpenAIIntegration instance
     """
-    # Let OpenAI describe what's on the screen
-    print("\n=== Current Screen Description ===")
-    description = mcp.describe_current_screen()
-    print(description)
-    
-    # Get suggestions for testing
-    print("\n=== Suggested Test Actions ===")
-    suggestions = mcp.suggest_test_actions()
-    for i, suggestion in enumerate(suggestions, 1):
-        print(f"{i}. {suggestion}")
+    # The description and suggestions only read the current screen, so both
+    # OpenAI requests are in flight at once
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        description_future = executor.submit(mcp.describe_current_screen)
+        suggestions_future = executor.submit(mcp.suggest_test_actions)
+        
+        # Let OpenAI describe what's on the screen
+        print("\n=== Current Screen Description ===")
+        print(description_future.result())
+        
+        # Get suggestions for testing
+        print("\n=== Suggested Test Actions ===")
+        for i, suggestion in enumerate(suggestions_future.result(), 1):
+            print(f"{i}. {suggestion}")
     
-    # Execute some natural language commands
+    # Execute some natural language commands. These run in order, since each
+    # one is interpreted against the screen the previous one left behind.
     commands = [
         "Find and click on the Display settings option",
         "Go back to the main settings screen",
@@ -123,8 +140,8 @@ def run_natural_language_commands(mcp: MCPOpenAIIntegration):
         print(f"Result: {result['status']}")
         print(f"Message: {result.get('message', 'No message')}")
         
-        # Brief pause to allow the UI to update
-        time.sleep(1)
+        # Let the UI settle before the next command reads the screen
+        mcp.wait_for_idle(timeout=1.0)
 
 
 def main():
@@ -6,17 +6,26 @@ This module demonstrates how to use only the OpenAI aspects of the MCP Appium in
 This is useful for testing the natural language processing without an Appium server.
 """
 
+import asyncio
+import hashlib
 import os
-import json
 import logging
 import sys
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
-# Add the parent directory to the path so we can import the mcp_appium package
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add the parent directory to the path so we can import the mcp_appium package,
+# unless it is already importable (e.g. installed or run from the repo root)
+_PARENT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PARENT not in sys.path:
+    sys.path.insert(0, _PARENT)
 
 # Import OpenAI directly
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+from mcp_appium.utils import xml_to_compact_json
+
+from example_utils import format_json, json_loads
 
 # Set up logging
 logging.basicConfig(
@@ -31,15 +40,111 @@ if not api_key:
     logger.error("OpenAI API key not found in environment variables")
     sys.exit(1)
 
-# Initialize OpenAI client
-openai_client = OpenAI(api_key=api_key)
+# Initialize OpenAI client with a keep-alive pool sized for the concurrent
+# requests in main(), so each request reuses an open TLS connection
+openai_client = AsyncOpenAI(
+    api_key=api_key,
+    http_client=DefaultAsyncHttpxClient(
+        limits=httpx.Limits(max_connections=8, max_keepalive_connections=8)
+    )
+)
 
 # The newest OpenAI model is "gpt-4o" which was released May 13, 2024.
 # do not change this unless explicitly requested by the user
 DEFAULT_MODEL = "gpt-4o"
 
 
-def process_command(command: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
+# Screen descriptions and suggestions already fetched, keyed by request kind
+# and a digest of the page source
+_SCREEN_CACHE: Dict[Tuple[str, str], Any] = {}
+
+
+def _screen_cache_key(kind: str, page_source: str) -> Tuple[str, str]:
+    """Return the cache key for a describe/suggest request on a page source."""
+    return kind, hashlib.blake2b(page_source.encode("utf-8"), digest_size=16).hexdigest()
+
+# Sample page source for demonstration, converted once at import to a compact
+# JSON UI tree to keep prompts small
+PAGE_SOURCE = xml_to_compact_json("""
+<android.widget.FrameLayout>
+    <android.widget.LinearLayout>
+        <android.widget.TextView text="Welcome to MCP Appium Demo" />
+        <android.widget.Button text="Login" content-desc="login_button" />
+        <android.widget.EditText hint="Username" content-desc="username_field" />
+        <android.widget.EditText hint="Password" content-desc="password_field" />
+        <android.widget.CheckBox text="Remember me" checked="false" />
+    </android.widget.LinearLayout>
+</android.widget.FrameLayout>
+""")
+
+
+# System prompts are module-level constants so every request sends a
+# byte-identical prefix, which lets OpenAI's automatic prompt caching reuse it
+_SYSTEM_PROMPT_COMMAND = """
+You are an expert in mobile app testing with Appium.
+Your job is to interpret natural language commands and convert them into structured Appium commands.
+
+Return a JSON object with the following structure:
+{
+    "action": "<appium_action>",
+    "parameters": {
+        "<param_name>": "<param_value>",
+        ...
+    }
+}
+
+Available actions and their parameters:
+1. find_element: {"by": "<locator_strategy>", "value": "<locator_value>"}
+2. find_elements: {"by": "<locator_strategy>", "value": "<locator_value>"}
+3. click_element: {"element_id": "<element_id>"}
+4. send_keys: {"element_id": "<element_id>", "text": "<text_to_send>"}
+5. get_text: {"element_id": "<element_id>"}
+6. back: {}
+7. screenshot: {}
+8. get_contexts: {}
+9. switch_to_context: {"context_name": "<context_name>"}
+10. execute_script: {"script": "<javascript_code>", "args": [<arg1>, <arg2>, ...]}
+
+Locator strategies include: "id", "accessibility id", "class name", "xpath", "css selector" (for web contexts),
+"ios predicate string" (for iOS), "android uiautomator" (for Android).
+
+Before responding, analyze the current app state from the provided context (if available).
+"""
+
+_SYSTEM_PROMPT_DESCRIBE = """
+You are an expert in mobile app testing and analysis.
+Your task is to provide a detailed description of the current screen in the mobile app.
+Focus on:
+1. The main UI elements visible (buttons, text fields, labels, etc.)
+2. The purpose of the screen (login, settings, dashboard, etc.)
+3. The possible actions a user could take on this screen
+4. Any notable features or issues with the UI
+
+Be concise but comprehensive.
+"""
+
+_SYSTEM_PROMPT_SUGGEST = """
+You are an expert in mobile app testing.
+Based on the current screen, suggest a list of test actions that would be appropriate.
+Return a JSON array of strings, each containing a natural language test action.
+Focus on:
+1. Functional testing (buttons, inputs, navigation)
+2. Edge cases
+3. User experience testing
+4. Possible regression tests
+
+Limit your suggestions to 5-7 specific actions.
+"""
+
+
+def _log_cached_tokens(response: Any) -> None:
+    """Log how many prompt tokens OpenAI served from its prompt cache."""
+    details = getattr(response.usage, "prompt_tokens_details", None) if response.usage else None
+    if details is not None:
+        logger.debug(f"Prompt cache: {details.cached_tokens} of {response.usage.prompt_tokens} prompt tokens cached")
+
+
+async def process_command(command: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
     """
     Process a natural language command using OpenAI.
     
@@ -55,53 +160,9 @@ def process_command(command: str, context: Dict[str, Any] = None) -> Dict[str, A
     
     # Default context if none provided
     if context is None:
-        context = {
-            "page_source": """
-            <android.widget.FrameLayout>
-                <android.widget.LinearLayout>
-                    <android.widget.TextView text="Welcome to MCP Appium Demo" />
-                    <android.widget.Button text="Login" content-desc="login_button" />
-                    <android.widget.EditText hint="Username" content-desc="username_field" />
-                    <android.widget.EditText hint="Password" content-desc="password_field" />
-                    <android.widget.CheckBox text="Remember me" checked="false" />
-                </android.widget.LinearLayout>
-            </android.widget.FrameLayout>
-            """
-        }
+        context = {"page_source": PAGE_SOURCE}
     
     try:
-        # Prepare the prompt
-        system_prompt = """
-        You are an expert in mobile app testing with Appium.
-        Your job is to interpret natural language commands and convert them into structured Appium commands.
-        
-        Return a JSON object with the following structure:
-        {
-            "action": "<appium_action>",
-            "parameters": {
-                "<param_name>": "<param_value>",
-                ...
-            }
-        }
-        
-        Available actions and their parameters:
-        1. find_element: {"by": "<locator_strategy>", "value": "<locator_value>"}
-        2. find_elements: {"by": "<locator_strategy>", "value": "<locator_value>"}
-        3. click_element: {"element_id": "<element_id>"}
-        4. send_keys: {"element_id": "<element_id>", "text": "<text_to_send>"}
-        5. get_text: {"element_id": "<element_id>"}
-        6. back: {}
-        7. screenshot: {}
-        8. get_contexts: {}
-        9. switch_to_context: {"context_name": "<context_name>"}
-        10. execute_script: {"script": "<javascript_code>", "args": [<arg1>, <arg2>, ...]}
-        
-        Locator strategies include: "id", "accessibility id", "class name", "xpath", "css selector" (for web contexts),
-        "ios predicate string" (for iOS), "android uiautomator" (for Android).
-        
-        Before responding, analyze the current app state from the provided context (if available).
-        """
-        
         # Add context information to the user prompt
         context_info = ""
         if context.get("page_source"):
@@ -111,18 +172,20 @@ def process_command(command: str, context: Dict[str, Any] = None) -> Dict[str, A
         user_prompt = f"App state context:{context_info}\n\nCommand to interpret: {command}"
         
         # Call OpenAI API
-        response = openai_client.chat.completions.create(
+        response = await openai_client.chat.completions.create(
             model=DEFAULT_MODEL,
             messages=[
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": _SYSTEM_PROMPT_COMMAND},
                 {"role": "user", "content": user_prompt}
             ],
             response_format={"type": "json_object"}
         )
         
+        _log_cached_tokens(response)
+        
         # Extract and parse the response
         result_text = response.choices[0].message.content
-        result = json.loads(result_text)
+        result = json_loads(result_text)
         
         # Validate the response format
         if "action" not in result or "parameters" not in result:
@@ -146,7 +209,7 @@ def process_command(command: str, context: Dict[str, Any] = None) -> Dict[str, A
         return {"status": "error", "message": str(e)}
 
 
-def describe_screen(page_source: str) -> str:
+async def describe_screen(page_source: str) -> str:
     """
     Use OpenAI to describe a screen from page source.
     
@@ -156,35 +219,29 @@ def describe_screen(page_source: str) -> str:
     Returns:
         str: A detailed description of the screen
     """
+    cache_key = _screen_cache_key("describe", page_source)
+    if cache_key in _SCREEN_CACHE:
+        return _SCREEN_CACHE[cache_key]
+    
     try:
-        # Prepare the prompt
-        system_prompt = """
-        You are an expert in mobile app testing and analysis.
-        Your task is to provide a detailed description of the current screen in the mobile app.
-        Focus on:
-        1. The main UI elements visible (buttons, text fields, labels, etc.)
-        2. The purpose of the screen (login, settings, dashboard, etc.)
-        3. The possible actions a user could take on this screen
-        4. Any notable features or issues with the UI
-        
-        Be concise but comprehensive.
-        """
-        
         user_prompt = f"Here is the page source of the current screen:\n\n{page_source}"
         
         # Call OpenAI API
-        response = openai_client.chat.completions.create(
+        response = await openai_client.chat.completions.create(
             model=DEFAULT_MODEL,
             messages=[
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": _SYSTEM_PROMPT_DESCRIBE},
                 {"role": "user", "content": user_prompt}
             ]
         )
         
+        _log_cached_tokens(response)
+        
         # Extract the description
         description = response.choices[0].message.content
         logger.info("Generated screen description using OpenAI")
         
+        _SCREEN_CACHE[cache_key] = description
         return description
         
     except Exception as e:
@@ -192,7 +249,7 @@ def describe_screen(page_source: str) -> str:
         return f"Error generating description: {str(e)}"
 
 
-def suggest_test_actions(page_source: str) -> list:
+async def suggest_test_actions(page_source: str) -> list:
     """
     Use OpenAI to suggest test actions based on screen content.
     
@@ -202,36 +259,28 @@ def suggest_test_actions(page_source: str) -> list:
     Returns:
         list: A list of suggested test actions
     """
+    cache_key = _screen_cache_key("suggest", page_source)
+    if cache_key in _SCREEN_CACHE:
+        return list(_SCREEN_CACHE[cache_key])
+    
     try:
-        # Prepare the prompt
-        system_prompt = """
-        You are an expert in mobile app testing.
-        Based on the current screen, suggest a list of test actions that would be appropriate.
-        Return a JSON array of strings, each containing a natural language test action.
-        Focus on:
-        1. Functional testing (buttons, inputs, navigation)
-        2. Edge cases
-        3. User experience testing
-        4. Possible regression tests
-        
-        Limit your suggestions to 5-7 specific actions.
-        """
-        
         user_prompt = f"Current page source:\n\n{page_source}"
         
         # Call OpenAI API
-        response = openai_client.chat.completions.create(
+        response = await openai_client.chat.completions.create(
             model=DEFAULT_MODEL,
             messages=[
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": _SYSTEM_PROMPT_SUGGEST},
                 {"role": "user", "content": user_prompt}
             ],
             response_format={"type": "json_object"}
         )
         
+        _log_cached_tokens(response)
+        
         # Extract and parse the response
         result_text = response.choices[0].message.content
-        result = json.loads(result_text)
+        result = json_loads(result_text)
         
         if isinstance(result, list):
             suggestions = result
@@ -239,12 +288,13 @@ def suggest_test_actions(page_source: str) -> list:
             suggestions = result["suggestions"]
         else:
             suggestions = []
-            for key, value in result.items():
+            for value in result.values():
                 if isinstance(value, str):
                     suggestions.append(value)
         
         logger.info(f"Generated {len(suggestions)} test action suggestions using OpenAI")
         
+        _SCREEN_CACHE[cache_key] = list(suggestions)
         return suggestions
         
     except Exception as e:
@@ -252,32 +302,15 @@ def suggest_test_actions(page_source: str) -> list:
         return [f"Error generating suggestions: {str(e)}"]
 
 
-def main():
+async def main():
     """
     Run the standalone OpenAI example.
+    
+    All OpenAI requests are independent, so they are issued concurrently.
     """
     try:
         # Sample page source for demonstration
-        page_source = """
-        <android.widget.FrameLayout>
-            <android.widget.LinearLayout>
-                <android.widget.TextView text="Welcome to MCP Appium Demo" />
-                <android.widget.Button text="Login" content-desc="login_button" />
-                <android.widget.EditText hint="Username" content-desc="username_field" />
-                <android.widget.EditText hint="Password" content-desc="password_field" />
-                <android.widget.CheckBox text="Remember me" checked="false" />
-            </android.widget.LinearLayout>
-        </android.widget.FrameLayout>
-        """
-        
-        print("\n=== Describing Current Screen ===")
-        description = describe_screen(page_source)
-        print(description)
-        
-        print("\n=== Suggesting Test Actions ===")
-        suggestions = suggest_test_actions(page_source)
-        for i, suggestion in enumerate(suggestions, 1):
-            print(f"{i}. {suggestion}")
+        page_source = PAGE_SOURCE
         
         # Test some natural language commands
         test_commands = [
@@ -288,14 +321,28 @@ def main():
             "Take a screenshot of the login screen"
         ]
         
+        context = {"page_source": page_source}
+        cmd_tasks = [process_command(command, context) for command in test_commands]
+        description, suggestions, cmd_results = await asyncio.gather(
+            describe_screen(page_source),
+            suggest_test_actions(page_source),
+            asyncio.gather(*cmd_tasks)
+        )
+        
+        print("\n=== Describing Current Screen ===")
+        print(description)
+        
+        print("\n=== Suggesting Test Actions ===")
+        for i, suggestion in enumerate(suggestions, 1):
+            print(f"{i}. {suggestion}")
+        
         print("\n=== Processing Natural Language Commands ===")
-        for command in test_commands:
+        for command, result in zip(test_commands, cmd_results):
             print(f"\nCommand: '{command}'")
-            result = process_command(command, {"page_source": page_source})
             print(f"Status: {result['status']}")
             if result['status'] == 'success':
                 print(f"Action: {result['action']}")
-                print(f"Parameters: {json.dumps(result['parameters'], indent=2)}")
+                print(f"Parameters: {format_json(result['parameters'])}")
             else:
                 print(f"Error: {result['message']}")
         
@@ -307,4 +354,4 @@ def main():
 
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(asyncio.run(main()))
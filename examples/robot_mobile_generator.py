@@ -11,33 +11,118 @@ for any given mobile application. It provides a generic framework to:
 
 Example usage:
     python robot_mobile_generator.py --app ../app_tests/sauce_labs_demo/sauce_labs_demo.apk --output ../data/generated_tests/swaglabs_tests.robot
+    python robot_mobile_generator.py --apps-dir ../app_tests/apks --output ../data/generated_tests --workers 4
 """
 
 import os
 import sys
 import argparse
+import functools
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import logging
 import re
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional
+
+# androguard (optional) reads the launcher activity from the APK manifest
+try:
+    from androguard.core.apk import APK
+    ANDROGUARD_AVAILABLE = True
+except ImportError:
+    try:
+        from androguard.core.bytecodes.apk import APK
+        ANDROGUARD_AVAILABLE = True
+    except ImportError:
+        ANDROGUARD_AVAILABLE = False
+
+# Resolve this script's location once
+_HERE = Path(__file__).resolve().parent
+_ROOT = _HERE.parent
 
 # Add the parent directory to the path to allow importing mcp_appium
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(str(_ROOT))
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# Module logger; handlers are configured in main() when run as a script
 logger = logging.getLogger("robot_mobile_generator")
 
-# Path to store generated tests
-DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
-ROBOT_DIR = os.path.join(DATA_DIR, "generated_tests")
+# Path to store generated tests (created on demand in main)
+DATA_DIR = _ROOT / "data"
+ROBOT_DIR = DATA_DIR / "generated_tests"
+
+# Runs of characters not allowed in a Robot-friendly app name
+_APP_NAME_RE = re.compile(r'[^a-z0-9_]+')
+
+# Single-attribute XPaths that map onto a direct AppiumLibrary locator strategy
+# (the quoted value may not contain its quote, so "[@a='x' and @b='y']" is not matched)
+_CONTENT_DESC_XPATH_RE = re.compile(r"//[\w.]+\[@content-desc=(['\"])((?:(?!\1).)+)\1\]")
+_RESOURCE_ID_XPATH_RE = re.compile(r"//[\w.]+\[@resource-id=(['\"])((?:(?!\1).)+)\1\]")
+
+
+def _accessibility_id(locator: str) -> Optional[str]:
+    """
+    Get the accessibility ID a locator resolves to, if any.
+    
+    Args:
+        locator: Locator from the app configuration
+        
+    Returns:
+        Optional[str]: The accessibility ID, or None for other locator strategies
+    """
+    locator = _optimize_locator(locator)
+    if locator.startswith("accessibility_id="):
+        return locator[len("accessibility_id="):]
+    return None
 
-# Create directories if they don't exist
-os.makedirs(ROBOT_DIR, exist_ok=True)
 
-# Default test data for common apps
-APP_CONFIGS = {
+def _optimize_locator(locator: str) -> str:
+    """
+    Rewrite a single-attribute XPath to a faster AppiumLibrary locator.
+    
+    ``//Class[@content-desc='X']`` becomes ``accessibility_id=X`` and
+    ``//Class[@resource-id='Y']`` becomes ``id=Y``, which the driver resolves
+    directly instead of walking the whole UI tree. Anything else is returned
+    unchanged.
+    
+    Args:
+        locator: Locator from the app configuration
+        
+    Returns:
+        str: The equivalent direct locator, or the original one
+    """
+    match = _CONTENT_DESC_XPATH_RE.fullmatch(locator)
+    if match:
+        return f"accessibility_id={match.group(2)}"
+    
+    match = _RESOURCE_ID_XPATH_RE.fullmatch(locator)
+    if match:
+        return f"id={match.group(2)}"
+    
+    return locator
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Make a configuration value read-only so it can be shared and cached safely.
+    
+    Args:
+        value: Dict, list or scalar from a configuration literal
+        
+    Returns:
+        Any: A MappingProxyType for dicts, a tuple for lists, or the value itself
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Default test data for common apps, with selectors already in their fastest
+# locator form
+APP_CONFIGS = _freeze({
     "sauce_labs_demo": {
+        "app_activity": "com.swaglabsmobileapp.MainActivity",
         "login": {
             "username_field": "test-Username",
             "password_field": "test-Password",
@@ -45,55 +130,183 @@ APP_CONFIGS = {
             "credentials": [
                 {"username": "standard_user", "password": "secret_sauce"}
             ],
-            "success_indicator": "//android.view.ViewGroup[@content-desc='test-Inventory page']"
+            "success_indicator": "accessibility_id=test-Inventory page"
         },
         "product_page": {
-            "products_container": "//android.widget.ScrollView[@content-desc='test-PRODUCTS']",
-            "product_item": "//android.view.ViewGroup[@content-desc='test-Item']",
-            "add_to_cart_button": "//android.view.ViewGroup[@content-desc='test-ADD TO CART']",
-            "product_name": "//android.widget.TextView[@content-desc='test-Item title']",
-            "cart_button": "//android.view.ViewGroup[@content-desc='test-Cart']"
+            "products_container": "accessibility_id=test-PRODUCTS",
+            "product_item": "accessibility_id=test-Item",
+            "add_to_cart_button": "accessibility_id=test-ADD TO CART",
+            "product_name": "accessibility_id=test-Item title",
+            "cart_button": "accessibility_id=test-Cart"
         },
         "checkout": {
-            "checkout_button": "//android.view.ViewGroup[@content-desc='test-CHECKOUT']",
-            "first_name_field": "//android.widget.EditText[@content-desc='test-First Name']",
-            "last_name_field": "//android.widget.EditText[@content-desc='test-Last Name']",
-            "postal_code_field": "//android.widget.EditText[@content-desc='test-Zip/Postal Code']",
-            "continue_button": "//android.view.ViewGroup[@content-desc='test-CONTINUE']",
-            "finish_button": "//android.view.ViewGroup[@content-desc='test-FINISH']",
+            "checkout_button": "accessibility_id=test-CHECKOUT",
+            "first_name_field": "accessibility_id=test-First Name",
+            "last_name_field": "accessibility_id=test-Last Name",
+            "postal_code_field": "accessibility_id=test-Zip/Postal Code",
+            "continue_button": "accessibility_id=test-CONTINUE",
+            "finish_button": "accessibility_id=test-FINISH",
             "success_message": "//android.widget.TextView[@text='THANK YOU FOR YOU ORDER']"
         }
     }
+})
+
+# Predefined configurations, longest app ID first so the most specific match wins
+_APP_CONFIG_INDEX = tuple(sorted(APP_CONFIGS.items(), key=lambda kv: -len(kv[0])))
+
+# Configuration used when no predefined configuration matches the app
+_GENERIC_CONFIG = _freeze({
+    "login": {
+        "username_field": "//android.widget.EditText[1]",
+        "password_field": "//android.widget.EditText[2]",
+        "login_button": "//android.widget.Button[contains(@text, 'Login') or contains(@text, 'Sign in')]"
+    }
+})
+
+# Robot variable, config key and default locator for each selector section
+_LOGIN_VARS = (
+    ("USERNAME_FIELD", "username_field", "//android.widget.EditText[1]"),
+    ("PASSWORD_FIELD", "password_field", "//android.widget.EditText[2]"),
+    ("LOGIN_BUTTON", "login_button", '//android.widget.Button[@text="Login"]')
+)
+
+_PRODUCT_VARS = (
+    ("PRODUCTS_CONTAINER", "products_container", "//android.widget.ScrollView"),
+    ("PRODUCT_ITEM", "product_item", "//android.view.ViewGroup"),
+    ("ADD_TO_CART_BUTTON", "add_to_cart_button", '//android.widget.Button[contains(@text,"Add")]'),
+    ("PRODUCT_NAME", "product_name", "//android.widget.TextView"),
+    ("CART_BUTTON", "cart_button", '//android.widget.Button[contains(@text,"Cart")]')
+)
+
+_CHECKOUT_VARS = (
+    ("CHECKOUT_BUTTON", "checkout_button", '//android.widget.Button[contains(@text,"Checkout")]'),
+    ("FIRST_NAME_FIELD", "first_name_field", "//android.widget.EditText[1]"),
+    ("LAST_NAME_FIELD", "last_name_field", "//android.widget.EditText[2]"),
+    ("POSTAL_CODE_FIELD", "postal_code_field", "//android.widget.EditText[3]"),
+    ("CONTINUE_BUTTON", "continue_button", '//android.widget.Button[contains(@text,"Continue")]'),
+    ("FINISH_BUTTON", "finish_button", '//android.widget.Button[contains(@text,"Finish")]'),
+    ("SUCCESS_MESSAGE", "success_message", '//android.widget.TextView[contains(@text,"Thank")]')
+)
+
+# Platform name, automation engine and device name per target platform
+PLATFORMS = {
+    "android": ("Android", "UiAutomator2", "Android Emulator"),
+    "ios": ("iOS", "XCUITest", "iPhone Simulator")
 }
 
+# Appium server and desired capabilities lines of the variables section, per platform
+_CAPS_BLOCKS = {
+    platform: (
+        "${APPIUM_SERVER}    http://localhost:4723/wd/hub\n"
+        "\n"
+        "# Appium Desired Capabilities\n"
+        f"${{PLATFORM_NAME}}    {platform_name}\n"
+        f"${{AUTOMATION_NAME}}    {automation_name}\n"
+        f"${{DEVICE_NAME}}    {device_name}"
+    )
+    for platform, (platform_name, automation_name, device_name) in PLATFORMS.items()
+}
+
+# Platform-independent part of the Open Application keyword
+_OPEN_APPLICATION_KEYWORD = (
+    "Open Application\n"
+    "    AppiumLibrary.Open Application    ${APPIUM_SERVER}\n"
+    "    ...    platformName=${PLATFORM_NAME}\n"
+    "    ...    automationName=${AUTOMATION_NAME}\n"
+    "    ...    deviceName=${DEVICE_NAME}\n"
+    "    ...    app=${APP_PATH}\n"
+    "    ...    newCommandTimeout=60"
+)
+
+# Fixed keyword bodies emitted for the sections present in the app configuration
+_LOGIN_KEYWORD = (
+    "Login\n"
+    "    [Arguments]    ${username}=${USERNAME}    ${password}=${PASSWORD}\n"
+    "    Wait Until Element Is Visible    ${USERNAME_FIELD}    timeout=30s\n"
+    "    Input Text    ${USERNAME_FIELD}    ${username}\n"
+    "    Input Text    ${PASSWORD_FIELD}    ${password}\n"
+    "    Click Element    ${LOGIN_BUTTON}"
+)
+
+_ADD_PRODUCT_KEYWORD_HEAD = (
+    "Add Product To Cart\n"
+    "    [Arguments]    ${index}=0\n"
+    "    Wait Until Element Is Visible    ${PRODUCTS_CONTAINER}    timeout=10s"
+)
+
+_GO_TO_CART_KEYWORD = (
+    "Go To Cart\n"
+    "    Click Element    ${CART_BUTTON}\n"
+)
+
+_COMPLETE_CHECKOUT_KEYWORD = (
+    "Complete Checkout\n"
+    "    [Arguments]    ${first_name}=John    ${last_name}=Doe    ${postal_code}=12345\n"
+    "    Wait Until Element Is Visible    ${CHECKOUT_BUTTON}    timeout=10s\n"
+    "    Click Element    ${CHECKOUT_BUTTON}\n"
+    "    Wait Until Element Is Visible    ${FIRST_NAME_FIELD}    timeout=10s\n"
+    "    Input Text    ${FIRST_NAME_FIELD}    ${first_name}\n"
+    "    Input Text    ${LAST_NAME_FIELD}    ${last_name}\n"
+    "    Input Text    ${POSTAL_CODE_FIELD}    ${postal_code}\n"
+    "    Click Element    ${CONTINUE_BUTTON}\n"
+    "    Wait Until Element Is Visible    ${FINISH_BUTTON}    timeout=10s\n"
+    "    Click Element    ${FINISH_BUTTON}\n"
+    "    Wait Until Element Is Visible    ${SUCCESS_MESSAGE}    timeout=10s\n"
+)
+
+# Key under which the generic configuration is cached
+_GENERIC_CONFIG_KEY = "__generic__"
+
 
 class RobotMobileGenerator:
     """Generator for Robot Framework mobile test scripts using AppiumLibrary."""
     
-    def __init__(self, app_path: str, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, app_path: str, config: Optional[Dict[str, Any]] = None, platform: str = "android"):
         """
         Initialize the Robot Framework mobile test generator.
         
         Args:
             app_path: Path to the mobile app APK to test
             config: Optional configuration for the specific app
+            platform: Target platform, "android" or "ios" (default: android)
         """
+        if platform not in PLATFORMS:
+            raise ValueError(f"Unsupported platform: {platform}. Supported platforms: {list(PLATFORMS)}")
+        
         self.app_path = app_path
+        self.platform = platform
+        self._launch_activity = None
         self.app_name = self._extract_app_name(app_path)
+        # Set by _get_config for shared (predefined or generic) configurations
+        self.config_key = None
         self.config = self._get_config(config)
     
     def _extract_app_name(self, app_path: str) -> str:
         """Extract the app name from the APK path."""
-        # Get the filename without extension
-        app_file = os.path.basename(app_path)
-        app_name = os.path.splitext(app_file)[0]
+        # Get the lowercased filename without extension
+        stem = os.path.splitext(os.path.basename(app_path))[0].lower()
+        
+        # Collapse anything that is not a valid identifier character to "_"
+        return _APP_NAME_RE.sub('_', stem).strip('_')
+    
+    def _extract_launch_activity(self) -> Optional[str]:
+        """
+        Get the launcher activity of the APK, reading its manifest at most once.
         
-        # Clean up the name
-        app_name = app_name.lower().replace(" ", "_")
+        Returns:
+            Optional[str]: The main activity, or None if it cannot be determined
+        """
+        if self._launch_activity is None:
+            self._launch_activity = ""
+            if ANDROGUARD_AVAILABLE:
+                try:
+                    self._launch_activity = APK(self.app_path).get_main_activity() or ""
+                except Exception as e:
+                    logger.warning("Could not read launcher activity from %s: %s", self.app_path, e)
         
-        return app_name
+        return self._launch_activity or None
     
-    def _get_config(self, config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    def _get_config(self, config: Optional[Dict[str, Any]]) -> Mapping[str, Any]:
         """
         Get configuration for the app.
         
@@ -101,26 +314,23 @@ class RobotMobileGenerator:
             config: Custom configuration (optional)
             
         Returns:
-            Dict: Configuration for the app
+            Mapping: Configuration for the app (read-only unless custom)
         """
         if config:
             return config
         
         # Try to find a matching configuration
-        for app_id, app_config in APP_CONFIGS.items():
-            if app_id in self.app_name:
-                logger.info(f"Using predefined configuration for {app_id}")
-                return app_config
+        name = self.app_name
+        hit = next(((app_id, app_config) for app_id, app_config in _APP_CONFIG_INDEX if app_id in name), None)
+        if hit is not None:
+            logger.info("Using predefined configuration for %s", hit[0])
+            self.config_key = hit[0]
+            return hit[1]
         
         # Return a generic configuration
         logger.info("Using generic configuration")
-        return {
-            "login": {
-                "username_field": "//android.widget.EditText[1]",
-                "password_field": "//android.widget.EditText[2]",
-                "login_button": "//android.widget.Button[contains(@text, 'Login') or contains(@text, 'Sign in')]"
-            }
-        }
+        self.config_key = _GENERIC_CONFIG_KEY
+        return _GENERIC_CONFIG
     
     def generate_robot_suite(self, output_file: str) -> bool:
         """
@@ -133,221 +343,327 @@ class RobotMobileGenerator:
             bool: True if generation was successful, False otherwise
         """
         try:
-            # Generate the suite
-            suite_header = self._generate_suite_header()
-            settings_section = self._generate_settings_section()
-            variables_section = self._generate_variables_section()
-            keywords_section = self._generate_keywords_section()
-            test_cases = self._generate_test_cases()
-            
-            # Combine all sections
-            robot_suite = f"{suite_header}\n\n{settings_section}\n\n{variables_section}\n\n{keywords_section}\n\n{test_cases}"
+            data = self._suite_text().encode("utf-8")
             
-            # Write to file
-            with open(output_file, 'w') as f:
-                f.write(robot_suite)
+            # Write the whole suite in a single buffered write
+            with open(output_file, 'wb', buffering=max(1 << 16, len(data))) as f:
+                f.write(data)
             
-            logger.info(f"Generated Robot Framework mobile test suite: {output_file}")
+            logger.info("Generated Robot Framework mobile test suite: %s", output_file)
             return True
             
         except Exception as e:
-            logger.error(f"Error generating Robot Framework mobile test suite: {str(e)}")
+            logger.error("Error generating Robot Framework mobile test suite: %s", e)
             return False
     
+    def _suite_text(self) -> str:
+        """
+        Get the suite text, reusing it for apps already generated with a shared config.
+        
+        Custom configurations are always generated afresh.
+        """
+        if self.config_key is None:
+            return self._build_robot_suite()
+        return _build_suite_text(self.app_path, self.config_key, self.platform)
+    
+    def _build_robot_suite(self) -> str:
+        """Generate the text of the complete Robot Framework test suite."""
+        # Generate the suite
+        suite_header = self._generate_suite_header()
+        settings_section = self._generate_settings_section()
+        variables_section = self._generate_variables_section()
+        keywords_section = self._generate_keywords_section()
+        test_cases = self._generate_test_cases()
+        
+        # Combine all sections
+        return "\n\n".join([suite_header, settings_section, variables_section, keywords_section, test_cases])
+    
     def _generate_suite_header(self) -> str:
         """Generate the suite header with documentation."""
-        header = f"# Robot Framework Mobile Tests for {self.app_name}\n"
-        header += f"# Generated by MCP Appium Robot Mobile Generator"
-        return header
+        parts = [
+            f"# Robot Framework Mobile Tests for {self.app_name}",
+            "# Generated by MCP Appium Robot Mobile Generator"
+        ]
+        return "\n".join(parts)
     
     def _generate_settings_section(self) -> str:
         """Generate the settings section."""
-        settings = "*** Settings ***\n"
-        settings += f"Documentation     Automated mobile tests for {self.app_name}\n"
-        settings += "Library           AppiumLibrary\n"
-        settings += "Suite Setup       Open Application\n"
-        settings += "Suite Teardown    Close Application\n"
-        return settings
+        parts = [
+            "*** Settings ***",
+            f"Documentation     Automated mobile tests for {self.app_name}",
+            "Library           AppiumLibrary",
+            "Suite Setup       Open Application",
+            "Suite Teardown    Close Application",
+            "Test Teardown     Run Keyword If Test Failed    Capture Page Screenshot",
+            ""
+        ]
+        return "\n".join(parts)
     
     def _generate_variables_section(self) -> str:
         """Generate the variables section."""
-        variables = "*** Variables ***\n"
-        variables += f"${'APP_PATH'}    {self.app_path}\n"
+        parts = ["*** Variables ***"]
+        parts.append(f"${{APP_PATH}}    {self.app_path}")
         
-        # Add appium server details
-        variables += "${APPIUM_SERVER}    http://localhost:4723/wd/hub\n"
-        
-        # Add appium desired capabilities
-        variables += "\n# Appium Desired Capabilities\n"
-        variables += "${PLATFORM_NAME}    Android\n"
-        variables += "${AUTOMATION_NAME}    UiAutomator2\n"
-        variables += "${DEVICE_NAME}    Android Emulator\n"
+        # Add appium server details and desired capabilities
+        parts.append(_CAPS_BLOCKS[self.platform])
         
         # Add app-specific variables based on config
-        if "login" in self.config:
-            login_config = self.config["login"]
-            variables += f"\n# Login selectors\n"
-            username_field = login_config.get('username_field', '//android.widget.EditText[1]')
-            password_field = login_config.get('password_field', '//android.widget.EditText[2]')
-            login_button = login_config.get('login_button', '//android.widget.Button[@text="Login"]')
-            
-            variables += f"${{'USERNAME_FIELD'}}    {username_field}\n"
-            variables += f"${{'PASSWORD_FIELD'}}    {password_field}\n"
-            variables += f"${{'LOGIN_BUTTON'}}    {login_button}\n"
-            
+        login_config = self._emit_section(parts, "login", "Login selectors", _LOGIN_VARS)
+        if login_config is not None:
             # Add credentials if available
             if "credentials" in login_config and login_config["credentials"]:
                 cred = login_config["credentials"][0]
-                variables += f"${'USERNAME'}    {cred.get('username', 'username')}\n"
-                variables += f"${'PASSWORD'}    {cred.get('password', 'password')}\n"
+                parts.append(f"${{USERNAME}}    {cred.get('username', 'username')}")
+                parts.append(f"${{PASSWORD}}    {cred.get('password', 'password')}")
             else:
-                variables += "${'USERNAME'}    username\n"
-                variables += "${'PASSWORD'}    password\n"
+                parts.append("${USERNAME}    username")
+                parts.append("${PASSWORD}    password")
         
-        # Add product page selectors if available
-        if "product_page" in self.config:
-            product_config = self.config["product_page"]
-            variables += f"\n# Product page selectors\n"
-            products_container = product_config.get('products_container', '//android.widget.ScrollView')
-            product_item = product_config.get('product_item', '//android.view.ViewGroup')
-            add_to_cart_button = product_config.get('add_to_cart_button', '//android.widget.Button[contains(@text,"Add")]')
-            product_name = product_config.get('product_name', '//android.widget.TextView')
-            cart_button = product_config.get('cart_button', '//android.widget.Button[contains(@text,"Cart")]')
-            
-            variables += f"${{'PRODUCTS_CONTAINER'}}    {products_container}\n"
-            variables += f"${{'PRODUCT_ITEM'}}    {product_item}\n"
-            variables += f"${{'ADD_TO_CART_BUTTON'}}    {add_to_cart_button}\n"
-            variables += f"${{'PRODUCT_NAME'}}    {product_name}\n"
-            variables += f"${{'CART_BUTTON'}}    {cart_button}\n"
+        self._emit_section(parts, "product_page", "Product page selectors", _PRODUCT_VARS)
+        self._emit_section(parts, "checkout", "Checkout selectors", _CHECKOUT_VARS)
         
-        # Add checkout selectors if available
-        if "checkout" in self.config:
-            checkout_config = self.config["checkout"]
-            variables += f"\n# Checkout selectors\n"
-            checkout_button = checkout_config.get('checkout_button', '//android.widget.Button[contains(@text,"Checkout")]')
-            first_name_field = checkout_config.get('first_name_field', '//android.widget.EditText[1]')
-            last_name_field = checkout_config.get('last_name_field', '//android.widget.EditText[2]')
-            postal_code_field = checkout_config.get('postal_code_field', '//android.widget.EditText[3]')
-            continue_button = checkout_config.get('continue_button', '//android.widget.Button[contains(@text,"Continue")]')
-            finish_button = checkout_config.get('finish_button', '//android.widget.Button[contains(@text,"Finish")]')
-            success_message = checkout_config.get('success_message', '//android.widget.TextView[contains(@text,"Thank")]')
+        parts.append("")
+        return "\n".join(parts)
+    
+    def _emit_section(self, parts: List[str], section: str, header: str,
+                      var_defs: tuple) -> Optional[Mapping[str, Any]]:
+        """
+        Append the selector variables of one config section.
+        
+        Args:
+            parts: Lines of the variables section being built
+            section: Config section name, e.g. "login"
+            header: Comment line introducing the selectors
+            var_defs: (variable, config key, default locator) triples
             
-            variables += f"${{'CHECKOUT_BUTTON'}}    {checkout_button}\n"
-            variables += f"${{'FIRST_NAME_FIELD'}}    {first_name_field}\n"
-            variables += f"${{'LAST_NAME_FIELD'}}    {last_name_field}\n"
-            variables += f"${{'POSTAL_CODE_FIELD'}}    {postal_code_field}\n"
-            variables += f"${{'CONTINUE_BUTTON'}}    {continue_button}\n"
-            variables += f"${{'FINISH_BUTTON'}}    {finish_button}\n"
-            variables += f"$SUCCESS_MESSAGE    {success_message}\n"
+        Returns:
+            Optional[Mapping]: The section config, or None if the app has none
+        """
+        section_config = self.config.get(section)
+        if section_config is None:
+            return None
         
-        return variables
+        parts.append("")
+        parts.append(f"# {header}")
+        parts.extend(
+            f"${{{var}}}    {_optimize_locator(section_config.get(key, default))}"
+            for var, key, default in var_defs
+        )
+        return section_config
     
     def _generate_keywords_section(self) -> str:
         """Generate the keywords section with reusable keywords."""
-        keywords = "*** Keywords ***\n"
+        parts = ["*** Keywords ***"]
         
         # Open Application keyword
-        keywords += "Open Application\n"
-        keywords += "    AppiumLibrary.Open Application    ${APPIUM_SERVER}\n"
-        keywords += "    ...    platformName=${PLATFORM_NAME}\n"
-        keywords += "    ...    automationName=${AUTOMATION_NAME}\n"
-        keywords += "    ...    deviceName=${DEVICE_NAME}\n"
-        keywords += "    ...    app=${APP_PATH}\n"
-        keywords += "    ...    newCommandTimeout=60\n"
-        keywords += "    ...    appActivity=com.swaglabsmobileapp.MainActivity\n\n"
+        parts.append(_OPEN_APPLICATION_KEYWORD)
+        
+        # Without a known activity, UiAutomator2 resolves the launcher activity itself
+        if self.platform == "android":
+            app_activity = self.config.get("app_activity") or self._extract_launch_activity()
+            if app_activity:
+                parts.append(f"    ...    appActivity={app_activity}")
+        parts.append("")
         
         # Login keyword
         if "login" in self.config:
-            keywords += "Login\n"
-            keywords += "    [Arguments]    ${username}=${'USERNAME'}    ${password}=${'PASSWORD'}\n"
-            keywords += "    Wait Until Element Is Visible    ${'USERNAME_FIELD'}    timeout=30s\n"
-            keywords += "    Input Text    ${'USERNAME_FIELD'}    ${username}\n"
-            keywords += "    Input Text    ${'PASSWORD_FIELD'}    ${password}\n"
-            keywords += "    Click Element    ${'LOGIN_BUTTON'}\n"
+            parts.append(_LOGIN_KEYWORD)
             
             # Add a wait for success indicator if available
             if "success_indicator" in self.config["login"]:
-                success_selector = self.config["login"]["success_indicator"]
-                keywords += f"    Wait Until Element Is Visible    {success_selector}    timeout=10s\n"
+                success_selector = _optimize_locator(self.config["login"]["success_indicator"])
+                parts.append(f"    Wait Until Element Is Visible    {success_selector}    timeout=10s")
             
-            keywords += "\n"
+            parts.append("")
         
         # Add to cart keyword if product page config exists
         if "product_page" in self.config:
-            keywords += "Add Product To Cart\n"
-            keywords += "    [Arguments]    ${index}=1\n"
-            keywords += "    Wait Until Element Is Visible    ${'PRODUCTS_CONTAINER'}    timeout=10s\n"
-            keywords += "    ${product_elements}=    Get WebElements    ${'PRODUCT_ITEM'}\n"
-            keywords += "    ${product}=    Get From List    ${product_elements}    ${index}\n"
-            keywords += "    ${product_name}=    Get Text    ${product}${'PRODUCT_NAME'}\n"
-            keywords += "    Click Element    ${product}${'ADD_TO_CART_BUTTON'}\n"
-            keywords += "    [Return]    ${product_name}\n\n"
-            
-            keywords += "Go To Cart\n"
-            keywords += "    Click Element    ${'CART_BUTTON'}\n\n"
+            parts.append(_ADD_PRODUCT_KEYWORD_HEAD)
+            parts.extend(self._product_in_list_steps())
+            parts.append("    [Return]    ${product_name}")
+            parts.append("")
+            parts.append(_GO_TO_CART_KEYWORD)
         
         # Checkout keywords if checkout config exists
         if "checkout" in self.config:
-            keywords += "Complete Checkout\n"
-            keywords += "    [Arguments]    ${first_name}=John    ${last_name}=Doe    ${postal_code}=12345\n"
-            keywords += "    Wait Until Element Is Visible    ${'CHECKOUT_BUTTON'}    timeout=10s\n"
-            keywords += "    Click Element    ${'CHECKOUT_BUTTON'}\n"
-            keywords += "    Wait Until Element Is Visible    ${'FIRST_NAME_FIELD'}    timeout=10s\n"
-            keywords += "    Input Text    ${'FIRST_NAME_FIELD'}    ${first_name}\n"
-            keywords += "    Input Text    ${'LAST_NAME_FIELD'}    ${last_name}\n"
-            keywords += "    Input Text    ${'POSTAL_CODE_FIELD'}    ${postal_code}\n"
-            keywords += "    Click Element    ${'CONTINUE_BUTTON'}\n"
-            keywords += "    Wait Until Element Is Visible    ${'FINISH_BUTTON'}    timeout=10s\n"
-            keywords += "    Click Element    ${'FINISH_BUTTON'}\n"
+            parts.append(_COMPLETE_CHECKOUT_KEYWORD)
+        
+        parts.append("")
+        return "\n".join(parts)
+    
+    def _product_in_list_steps(self) -> List[str]:
+        """
+        Generate the steps reading and adding the product at ``${index}`` (0-based).
+        
+        When the product item, name and add-to-cart selectors are accessibility
+        IDs, a single UiAutomator (Android) or class chain (iOS) query locates
+        the child of the indexed item directly. XPath selectors are indexed in
+        the XPath itself, so only the requested item is resolved. Only other
+        locator strategies fall back to fetching every item and indexing in Robot.
+        
+        Returns:
+            List[str]: Keyword steps setting ``${product_name}``
+        """
+        product_config = self.config["product_page"]
+        defaults = {key: default for _, key, default in _PRODUCT_VARS}
+        item_loc, name_loc, add_loc = (
+            _optimize_locator(product_config.get(key, defaults[key]))
+            for key in ("product_item", "product_name", "add_to_cart_button")
+        )
+        item_id, name_id, add_id = (
+            _accessibility_id(loc) for loc in (item_loc, name_loc, add_loc)
+        )
+        
+        if item_id and name_id and add_id:
+            if self.platform == "android":
+                return [
+                    f'    ${{item}}=    Set Variable    android=new UiSelector().description("{item_id}").instance(${{index}})',
+                    f'    ${{product_name}}=    Get Text    ${{item}}.childSelector(new UiSelector().description("{name_id}"))',
+                    f'    Click Element    ${{item}}.childSelector(new UiSelector().description("{add_id}"))'
+                ]
             
-            # Add a wait for success message if available
-            keywords += f"    Wait Until Element Is Visible    $SUCCESS_MESSAGE    timeout=10s\n\n"
+            # Class chain indexes are 1-based
+            return [
+                "    ${position}=    Evaluate    ${index} + 1",
+                f'    ${{item}}=    Set Variable    chain=**/*[`name == "{item_id}"`][${{position}}]',
+                f'    ${{product_name}}=    Get Text    ${{item}}/**/*[`name == "{name_id}"`]',
+                f'    Click Element    ${{item}}/**/*[`name == "{add_id}"`]'
+            ]
+        
+        if all(loc.startswith(("/", "(")) for loc in (item_loc, name_loc, add_loc)):
+            # XPath indexes are 1-based
+            return [
+                "    ${position}=    Evaluate    ${index} + 1",
+                "    ${item}=    Set Variable    xpath=(${PRODUCT_ITEM})[${position}]",
+                "    ${product_name}=    Get Text    ${item}${PRODUCT_NAME}",
+                "    Click Element    ${item}${ADD_TO_CART_BUTTON}"
+            ]
         
-        return keywords
+        return [
+            "    ${product_elements}=    Get WebElements    ${PRODUCT_ITEM}",
+            "    ${product}=    Get From List    ${product_elements}    ${index}",
+            "    ${product_name}=    Get Text    ${product}${PRODUCT_NAME}",
+            "    Click Element    ${product}${ADD_TO_CART_BUTTON}"
+        ]
     
     def _generate_test_cases(self) -> str:
         """Generate test cases for the mobile app."""
-        test_cases = "*** Test Cases ***\n"
+        parts = ["*** Test Cases ***"]
         
         # Login test
         if "login" in self.config:
-            test_cases += "Verify Login\n"
-            test_cases += "    Login\n"
+            parts.append("Verify Login")
+            parts.append("    Login")
             
             # Add success verification if available
             if "success_indicator" in self.config["login"]:
-                success_selector = self.config["login"]["success_indicator"]
-                test_cases += f"    Element Should Be Visible    {success_selector}\n\n"
+                success_selector = _optimize_locator(self.config["login"]["success_indicator"])
+                parts.append(f"    Element Should Be Visible    {success_selector}")
             else:
-                test_cases += "    # Verify login success based on page content\n\n"
+                parts.append("    # Verify login success based on page content")
+            parts.append("")
         
         # Product browsing and cart test
         if "product_page" in self.config:
-            test_cases += "Add Product To Cart\n"
-            test_cases += "    Login\n"
-            test_cases += "    ${product_name}=    Add Product To Cart\n"
-            test_cases += "    Go To Cart\n"
-            test_cases += "    Page Should Contain Text    ${product_name}\n\n"
+            parts.append("Add Product To Cart")
+            parts.append("    Login")
+            parts.append("    ${product_name}=    Add Product To Cart")
+            parts.append("    Go To Cart")
+            parts.append("    Page Should Contain Text    ${product_name}")
+            parts.append("")
         
         # Complete checkout test
         if "checkout" in self.config:
-            test_cases += "Complete Checkout Process\n"
-            test_cases += "    Login\n"
-            test_cases += "    Add Product To Cart\n"
-            test_cases += "    Go To Cart\n"
-            test_cases += "    Complete Checkout\n"
-            test_cases += f"    Element Should Be Visible    $SUCCESS_MESSAGE\n\n"
+            parts.append("Complete Checkout Process")
+            parts.append("    Login")
+            parts.append("    Add Product To Cart")
+            parts.append("    Go To Cart")
+            parts.append("    Complete Checkout")
+            parts.append("    Element Should Be Visible    ${SUCCESS_MESSAGE}")
+            parts.append("")
         
         # Generic test for any app
-        test_cases += "Take Screenshot\n"
-        test_cases += "    Capture Page Screenshot\n\n"
+        parts.append("Verify App Elements")
+        parts.append("    Page Should Contain Element    ${USERNAME_FIELD}")
+        parts.append("    Page Should Contain Element    ${PASSWORD_FIELD}")
+        parts.append("    Page Should Contain Element    ${LOGIN_BUTTON}")
+        
+        parts.append("")
+        return "\n".join(parts)
+
+
+@functools.lru_cache(maxsize=32)
+def _build_suite_text(app_path: str, config_key: str, platform: str) -> str:
+    """
+    Generate the suite text for an app using a predefined or generic configuration.
+    
+    Args:
+        app_path: Path to the mobile app APK to test
+        config_key: App ID in APP_CONFIGS, or _GENERIC_CONFIG_KEY
+        platform: Target platform, "android" or "ios"
+        
+    Returns:
+        str: The complete Robot Framework test suite
+    """
+    config = _GENERIC_CONFIG if config_key == _GENERIC_CONFIG_KEY else APP_CONFIGS[config_key]
+    return RobotMobileGenerator(app_path, config, platform)._build_robot_suite()
+
+
+def generator_worker(apk_path: str, out_dir: str, platform: str = "android") -> bool:
+    """
+    Generate the test suite for one APK into a directory (process pool entry point).
+    
+    Args:
+        apk_path: Path to the mobile app APK to test
+        out_dir: Directory to save the generated Robot Framework test suite in
+        platform: Target platform, "android" or "ios"
         
-        test_cases += "Verify App Elements\n"
-        test_cases += "    Page Should Contain Element    ${'USERNAME_FIELD'}\n"
-        test_cases += "    Page Should Contain Element    ${'PASSWORD_FIELD'}\n"
-        test_cases += "    Page Should Contain Element    ${'LOGIN_BUTTON'}\n"
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    app_name = os.path.splitext(os.path.basename(apk_path))[0]
+    output_file = os.path.join(out_dir, f"{app_name}_mobile_tests.robot")
+    return RobotMobileGenerator(apk_path, platform=platform).generate_robot_suite(output_file)
+
+
+def generate_all(apps_dir: str, out_dir: Path, platform: str = "android",
+                 workers: Optional[int] = None) -> int:
+    """
+    Generate test suites for every APK in a directory in parallel.
+    
+    Args:
+        apps_dir: Directory containing the APKs
+        out_dir: Directory to save the generated Robot Framework test suites in
+        platform: Target platform, "android" or "ios"
+        workers: Number of worker processes (default: CPU count)
         
-        return test_cases
+    Returns:
+        int: Number of APKs that could not be generated
+    """
+    apks = [str(apk) for apk in sorted(Path(apps_dir).glob("*.apk")) if apk.stat().st_size > 0]
+    if not apks:
+        logger.warning("No APK files found in %s", apps_dir)
+        return 0
+    
+    failures = 0
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = {
+            executor.submit(generator_worker, apk, str(out_dir), platform): apk
+            for apk in apks
+        }
+        for future in as_completed(futures):
+            apk = futures[future]
+            try:
+                success = future.result()
+            except Exception as e:
+                logger.error("Error generating tests for %s: %s", apk, e)
+                success = False
+            if not success:
+                failures += 1
+    
+    logger.info("Generated Robot Framework mobile tests for %d of %d APKs in %s",
+                len(apks) - failures, len(apks), out_dir)
+    return failures
 
 
 def parse_args():
@@ -356,19 +672,38 @@ def parse_args():
     parser.add_argument("--app", type=str, help="Path to the mobile app APK to test", 
                         default="../app_tests/sauce_labs_demo/sauce_labs_demo.apk")
     parser.add_argument("--output", type=str, help="Path to save the generated Robot Framework tests")
+    parser.add_argument("--platform", choices=list(PLATFORMS), default="android",
+                        help="Target platform of the app (default: android)")
+    parser.add_argument("--apps-dir", type=str,
+                        help="Generate tests for every APK in this directory (--output is then a directory)")
+    parser.add_argument("--workers", type=int,
+                        help="Number of worker processes for --apps-dir (default: CPU count)")
     
     return parser.parse_args()
 
 
 def main():
     """Main function."""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     args = parse_args()
     
+    # Bulk mode: one suite per APK in the directory
+    if args.apps_dir:
+        out_dir = Path(args.output) if args.output else ROBOT_DIR
+        out_dir.mkdir(parents=True, exist_ok=True)
+        return 1 if generate_all(args.apps_dir, out_dir, args.platform, args.workers) else 0
+    
     app_path = args.app
     
-    # Ensure the APK file exists
-    if not os.path.exists(app_path):
-        logger.error(f"APK file not found: {app_path}")
+    # Ensure the APK file exists and is not empty
+    try:
+        app_stat = os.stat(app_path)
+    except OSError:
+        logger.error("APK file not found: %s", app_path)
+        return 1
+    
+    if app_stat.st_size == 0:
+        logger.error("APK is empty: %s", app_path)
         return 1
     
     # Determine output file path
@@ -377,17 +712,18 @@ def main():
     else:
         # Extract app name for the filename
         app_name = os.path.splitext(os.path.basename(app_path))[0]
-        output_file = os.path.join(ROBOT_DIR, f"{app_name}_mobile_tests.robot")
+        output_file = ROBOT_DIR / f"{app_name}_mobile_tests.robot"
     
     # Ensure output directory exists
-    os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+    out = Path(output_file)
+    out.parent.mkdir(parents=True, exist_ok=True)
     
     # Create generator and generate tests
-    generator = RobotMobileGenerator(app_path)
-    success = generator.generate_robot_suite(output_file)
+    generator = RobotMobileGenerator(app_path, platform=args.platform)
+    success = generator.generate_robot_suite(out)
     
     if success:
-        logger.info(f"Successfully generated Robot Framework mobile tests: {output_file}")
+        logger.info("Successfully generated Robot Framework mobile tests: %s", out)
     else:
         logger.error("Failed to generate Robot Framework mobile tests")
         return 1
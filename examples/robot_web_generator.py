@@ -13,12 +13,15 @@ Example usage:
     python robot_web_generator.py --url https://www.saucedemo.com/ --output ../data/generated_tests/saucedemo_tests.robot
 """
 
+import io
 import os
 import sys
 import argparse
+import functools
 import logging
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, TextIO
+from urllib.parse import urlparse
 
 # Add the parent directory to the path to allow importing mcp_appium
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -66,6 +69,177 @@ WEBSITE_CONFIGS = {
 }
 
 
+# Default selectors for each config section, used when the config leaves one out
+_SELECTOR_DEFAULTS = {
+    "login": {
+        "username_selector": "input[type='text']",
+        "password_selector": "input[type='password']",
+        "login_button_selector": "button[type='submit']"
+    },
+    "product_page": {
+        "product_item_selector": ".product",
+        "add_to_cart_selector": "button.add-to-cart",
+        "product_name_selector": ".product-name",
+        "cart_button": "a.cart"
+    },
+    "checkout": {
+        "checkout_button_selector": "button.checkout",
+        "first_name_selector": "input[name='firstName']",
+        "last_name_selector": "input[name='lastName']",
+        "postal_code_selector": "input[name='postalCode']",
+        "continue_button_selector": "button.continue",
+        "finish_button_selector": "button.finish",
+        "success_message_selector": ".success-message"
+    }
+}
+
+# Config section, header and (Robot variable, selector key) pairs of the variables section
+_SELECTOR_VARS = (
+    ("login", "", (
+        ("USERNAME_SELECTOR", "username_selector"),
+        ("PASSWORD_SELECTOR", "password_selector"),
+        ("LOGIN_BUTTON_SELECTOR", "login_button_selector")
+    )),
+    ("product_page", "\n# Product page selectors\n", (
+        ("PRODUCT_ITEM_SELECTOR", "product_item_selector"),
+        ("ADD_TO_CART_SELECTOR", "add_to_cart_selector"),
+        ("PRODUCT_NAME_SELECTOR", "product_name_selector"),
+        ("CART_BUTTON", "cart_button")
+    )),
+    ("checkout", "\n# Checkout selectors\n", (
+        ("CHECKOUT_BUTTON_SELECTOR", "checkout_button_selector"),
+        ("FIRST_NAME_SELECTOR", "first_name_selector"),
+        ("LAST_NAME_SELECTOR", "last_name_selector"),
+        ("POSTAL_CODE_SELECTOR", "postal_code_selector"),
+        ("CONTINUE_BUTTON_SELECTOR", "continue_button_selector"),
+        ("FINISH_BUTTON_SELECTOR", "finish_button_selector"),
+        ("SUCCESS_MESSAGE_SELECTOR", "success_message_selector")
+    ))
+)
+
+# Configuration used when no predefined configuration matches the website
+_GENERIC_CONFIG = {
+    "login": {
+        "username_selector": "input[type='text']",
+        "password_selector": "input[type='password']",
+        "login_button_selector": "button[type='submit']"
+    }
+}
+
+# Key under which the generic configuration's suite template is cached
+_GENERIC_CONFIG_KEY = "__generic__"
+
+# Stands in for the URL in cached suite templates
+_URL_PLACEHOLDER = "\x00URL\x00"
+
+# Subdomain suffixes of the configured websites, longest (most specific) first
+_DOMAIN_SUFFIXES = tuple(sorted(("." + domain for domain in WEBSITE_CONFIGS), key=len, reverse=True))
+
+# Section templates filled with str.format_map; Robot's own ${...} variables are
+# written as ${{...}} so the formatter leaves them alone
+_SUITE_HEADER_TEMPLATE = """\
+# Robot Framework Web Tests for {url}
+# Generated by MCP Appium Robot Web Generator"""
+
+_SETTINGS_TEMPLATE = """\
+*** Settings ***
+Documentation     Automated web tests for {url}
+Library           Browser
+Suite Setup       Setup Browser
+Suite Teardown    Close Browser    ALL
+"""
+
+_SETUP_BROWSER_TEMPLATE = """\
+Setup Browser
+    New Browser    chromium    headless=False
+    New Context    viewport={{'width': 1280, 'height': 720}}
+    New Page    {url}
+
+"""
+
+_LOGIN_KEYWORD_TEMPLATE = """\
+Login
+    [Arguments]    ${{username}}=${{USERNAME}}    ${{password}}=${{PASSWORD}}
+    Fill Text    ${{USERNAME_SELECTOR}}    ${{username}}
+    Fill Text    ${{PASSWORD_SELECTOR}}    ${{password}}
+    Click    ${{LOGIN_BUTTON_SELECTOR}}
+{login_wait}
+"""
+
+_PRODUCT_KEYWORDS_TEMPLATE = """\
+Add Product To Cart
+    [Arguments]    ${{index}}=0
+    ${{products}}=    Get Elements    ${{PRODUCT_ITEM_SELECTOR}}
+    ${{product}}=    Get From List    ${{products}}    ${{index}}
+    ${{product_name}}=    Get Text    ${{product}} >> ${{PRODUCT_NAME_SELECTOR}}
+    Click    ${{product}} >> ${{ADD_TO_CART_SELECTOR}}
+    [Return]    ${{product_name}}
+
+Go To Cart
+    Click    ${{CART_BUTTON}}
+
+"""
+
+_CHECKOUT_KEYWORD_TEMPLATE = """\
+Complete Checkout
+    [Arguments]    ${{first_name}}=John    ${{last_name}}=Doe    ${{postal_code}}=12345
+    Click    ${{CHECKOUT_BUTTON_SELECTOR}}
+    Fill Text    ${{FIRST_NAME_SELECTOR}}    ${{first_name}}
+    Fill Text    ${{LAST_NAME_SELECTOR}}    ${{last_name}}
+    Fill Text    ${{POSTAL_CODE_SELECTOR}}    ${{postal_code}}
+    Click    ${{CONTINUE_BUTTON_SELECTOR}}
+    Click    ${{FINISH_BUTTON_SELECTOR}}
+    Wait For Elements State    ${{SUCCESS_MESSAGE_SELECTOR}}    visible    timeout=10s
+
+"""
+
+_LOGIN_TEST_TEMPLATE = """\
+Verify Login
+    Login
+{login_check}
+"""
+
+_PRODUCT_TEST_TEMPLATE = """\
+Add Product To Cart
+    Login
+    ${{product_name}}=    Add Product To Cart
+    Go To Cart
+    Get Text    ${{PRODUCT_NAME_SELECTOR}}    ==    ${{product_name}}
+
+"""
+
+_CHECKOUT_TEST_TEMPLATE = """\
+Complete Checkout Process
+    Login
+    Add Product To Cart
+    Go To Cart
+    Complete Checkout
+    Get Text    ${{SUCCESS_MESSAGE_SELECTOR}}
+
+"""
+
+_GENERIC_TESTS = """\
+Verify Page Title
+    ${title}=    Get Title
+    Log    Page title: ${title}
+
+Take Screenshot of Homepage
+    Take Screenshot
+"""
+
+# Keyword and test case templates emitted for each config section present
+_KEYWORD_TEMPLATES = {
+    "login": _LOGIN_KEYWORD_TEMPLATE,
+    "product_page": _PRODUCT_KEYWORDS_TEMPLATE,
+    "checkout": _CHECKOUT_KEYWORD_TEMPLATE
+}
+
+_TEST_CASE_TEMPLATES = {
+    "login": _LOGIN_TEST_TEMPLATE,
+    "product_page": _PRODUCT_TEST_TEMPLATE,
+    "checkout": _CHECKOUT_TEST_TEMPLATE
+}
+
 class RobotWebGenerator:
     """Generator for Robot Framework web test scripts using Browser Library."""
     
@@ -78,14 +252,13 @@ class RobotWebGenerator:
             config: Optional configuration for the specific website
         """
         self.url = url
-        self.domain = self._extract_domain(url)
+        self._parsed = urlparse(url)
+        self.domain = self._parsed.netloc
+        # Set by _get_config for shared (predefined or generic) configurations
+        self.config_key = None
         self.config = self._get_config(config)
-    
-    def _extract_domain(self, url: str) -> str:
-        """Extract the domain from a URL."""
-        from urllib.parse import urlparse
-        parsed_url = urlparse(url)
-        return parsed_url.netloc
+        self._sel = self._resolve_selectors()
+        self._fmt = self._build_format_values()
     
     def _get_config(self, config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -100,21 +273,52 @@ class RobotWebGenerator:
         if config:
             return config
         
-        # Try to find a matching configuration
-        for domain, domain_config in WEBSITE_CONFIGS.items():
-            if domain in self.domain:
-                logger.info(f"Using predefined configuration for {domain}")
-                return domain_config
+        # Try to find a matching configuration, by host name so that a port,
+        # user info or upper-case letters in the URL do not prevent a match
+        host = self._parsed.hostname or ""
+        domain = host if host in WEBSITE_CONFIGS else next(
+            (suffix[1:] for suffix in _DOMAIN_SUFFIXES if host.endswith(suffix)), None
+        )
+        if domain is not None:
+            logger.info(f"Using predefined configuration for {domain}")
+            self.config_key = domain
+            return WEBSITE_CONFIGS[domain]
         
         # Return a generic configuration
         logger.info("Using generic configuration")
-        return {
-            "login": {
-                "username_selector": "input[type='text']",
-                "password_selector": "input[type='password']",
-                "login_button_selector": "button[type='submit']"
-            }
-        }
+        self.config_key = _GENERIC_CONFIG_KEY
+        return _GENERIC_CONFIG
+    
+    def _resolve_selectors(self) -> Dict[str, str]:
+        """
+        Resolve every selector of the configured sections, falling back to defaults.
+        
+        Returns:
+            Dict[str, str]: Selector values keyed by config key
+        """
+        selectors = {}
+        for section, defaults in _SELECTOR_DEFAULTS.items():
+            section_config = self.config.get(section)
+            if section_config is not None:
+                selectors.update({key: section_config.get(key, default) for key, default in defaults.items()})
+        return selectors
+    
+    def _build_format_values(self) -> Dict[str, str]:
+        """
+        Flatten the configuration into the values used by the section templates.
+        
+        Returns:
+            Dict[str, str]: Template placeholder values
+        """
+        success_indicator = self.config.get("login", {}).get("success_indicator")
+        if success_indicator:
+            login_wait = f"    Wait For Elements State    {success_indicator}    visible    timeout=10s\n"
+            login_check = f"    Get Element    {success_indicator}\n"
+        else:
+            login_wait = ""
+            login_check = "    # Verify login success based on page content\n"
+        
+        return {"url": self.url, "login_wait": login_wait, "login_check": login_check}
     
     def generate_robot_suite(self, output_file: str) -> bool:
         """
@@ -127,19 +331,13 @@ class RobotWebGenerator:
             bool: True if generation was successful, False otherwise
         """
         try:
-            # Generate the suite
-            suite_header = self._generate_suite_header()
-            settings_section = self._generate_settings_section()
-            variables_section = self._generate_variables_section()
-            keywords_section = self._generate_keywords_section()
-            test_cases = self._generate_test_cases()
-            
-            # Combine all sections
-            robot_suite = f"{suite_header}\n\n{settings_section}\n\n{variables_section}\n\n{keywords_section}\n\n{test_cases}"
-            
-            # Write to file
-            with open(output_file, 'w') as f:
-                f.write(robot_suite)
+            with open(output_file, 'w', buffering=64 * 1024) as f:
+                if self.config_key is None:
+                    # Stream a custom configuration's suite straight to the file
+                    self._write_robot_suite(f)
+                else:
+                    # Shared configurations reuse the suite built for any URL
+                    f.write(_build_suite_template(self.config_key).replace(_URL_PLACEHOLDER, self.url))
             
             logger.info(f"Generated Robot Framework web test suite: {output_file}")
             return True
@@ -148,180 +346,93 @@ class RobotWebGenerator:
             logger.error(f"Error generating Robot Framework web test suite: {str(e)}")
             return False
     
-    def _generate_suite_header(self) -> str:
-        """Generate the suite header with documentation."""
-        header = f"# Robot Framework Web Tests for {self.url}\n"
-        header += f"# Generated by MCP Appium Robot Web Generator"
-        return header
+    def _write_robot_suite(self, out: TextIO) -> None:
+        """
+        Write all sections of the test suite to a text stream.
+        
+        Args:
+            out: Text stream to write the Robot Framework test suite to
+        """
+        self._write_suite_header(out)
+        out.write("\n\n")
+        self._write_settings_section(out)
+        out.write("\n\n")
+        self._write_variables_section(out)
+        out.write("\n\n")
+        self._write_keywords_section(out)
+        out.write("\n\n")
+        self._write_test_cases(out)
+    
+    def _write_suite_header(self, out: TextIO) -> None:
+        """Write the suite header with documentation."""
+        out.write(_SUITE_HEADER_TEMPLATE.format_map(self._fmt))
     
-    def _generate_settings_section(self) -> str:
-        """Generate the settings section."""
-        settings = "*** Settings ***\n"
-        settings += "Documentation     Automated web tests for " + self.url + "\n"
-        settings += "Library           Browser\n"
-        settings += "Suite Setup       Setup Browser\n"
-        settings += "Suite Teardown    Close Browser    ALL\n"
-        return settings
+    def _write_settings_section(self, out: TextIO) -> None:
+        """Write the settings section."""
+        out.write(_SETTINGS_TEMPLATE.format_map(self._fmt))
     
-    def _generate_variables_section(self) -> str:
-        """Generate the variables section."""
-        variables = "*** Variables ***\n"
-        variables += f"${'URL'}    {self.url}\n"
+    def _write_variables_section(self, out: TextIO) -> None:
+        """Write the variables section."""
+        out.write("*** Variables ***\n")
+        out.write(f"${{URL}}    {self.url}\n")
         
         # Add website-specific variables based on config
-        if "login" in self.config:
-            login_config = self.config["login"]
-            username_selector = login_config.get('username_selector', "input[type='text']")
-            password_selector = login_config.get('password_selector', "input[type='password']")
-            login_button_selector = login_config.get('login_button_selector', "button[type='submit']")
-            variables += f"${{'USERNAME_SELECTOR'}}    {username_selector}\n"
-            variables += f"${{'PASSWORD_SELECTOR'}}    {password_selector}\n"
-            variables += f"${{'LOGIN_BUTTON_SELECTOR'}}    {login_button_selector}\n"
+        for section, header, variables in _SELECTOR_VARS:
+            if section not in self.config:
+                continue
+            
+            out.write(header)
+            for name, key in variables:
+                out.write(f"${{{name}}}    {self._sel[key]}\n")
             
             # Add credentials if available
-            if "credentials" in login_config and login_config["credentials"]:
-                cred = login_config["credentials"][0]
-                username = cred.get('username', 'username')
-                password = cred.get('password', 'password')
-            else:
-                username = "username"
-                password = "password"
+            if section == "login":
+                login_config = self.config["login"]
+                if "credentials" in login_config and login_config["credentials"]:
+                    cred = login_config["credentials"][0]
+                    username = cred.get('username', 'username')
+                    password = cred.get('password', 'password')
+                else:
+                    username = "username"
+                    password = "password"
                 
-            variables += f"${{'USERNAME'}}    {username}\n"
-            variables += f"${{'PASSWORD'}}    {password}\n"
-        
-        # Add product page selectors if available
-        if "product_page" in self.config:
-            product_config = self.config["product_page"]
-            variables += f"\n# Product page selectors\n"
-            product_item = product_config.get('product_item_selector', '.product')
-            add_to_cart = product_config.get('add_to_cart_selector', 'button.add-to-cart')
-            product_name = product_config.get('product_name_selector', '.product-name')
-            cart_button = product_config.get('cart_button', 'a.cart')
-            
-            variables += f"${{'PRODUCT_ITEM_SELECTOR'}}    {product_item}\n"
-            variables += f"${{'ADD_TO_CART_SELECTOR'}}    {add_to_cart}\n"
-            variables += f"${{'PRODUCT_NAME_SELECTOR'}}    {product_name}\n"
-            variables += f"${{'CART_BUTTON'}}    {cart_button}\n"
-        
-        # Add checkout selectors if available
-        if "checkout" in self.config:
-            checkout_config = self.config["checkout"]
-            variables += f"\n# Checkout selectors\n"
-            checkout_button = checkout_config.get('checkout_button_selector', 'button.checkout')
-            first_name_selector = checkout_config.get('first_name_selector', "input[name='firstName']")
-            last_name_selector = checkout_config.get('last_name_selector', "input[name='lastName']")
-            postal_code_selector = checkout_config.get('postal_code_selector', "input[name='postalCode']")
-            continue_button = checkout_config.get('continue_button_selector', 'button.continue')
-            finish_button = checkout_config.get('finish_button_selector', 'button.finish')
-            success_message = checkout_config.get('success_message_selector', '.success-message')
-            
-            variables += f"${{'CHECKOUT_BUTTON_SELECTOR'}}    {checkout_button}\n"
-            variables += f"${{'FIRST_NAME_SELECTOR'}}    {first_name_selector}\n"
-            variables += f"${{'LAST_NAME_SELECTOR'}}    {last_name_selector}\n"
-            variables += f"${{'POSTAL_CODE_SELECTOR'}}    {postal_code_selector}\n"
-            variables += f"${{'CONTINUE_BUTTON_SELECTOR'}}    {continue_button}\n"
-            variables += f"${{'FINISH_BUTTON_SELECTOR'}}    {finish_button}\n"
-            variables += f"${{'SUCCESS_MESSAGE_SELECTOR'}}    {success_message}\n"
-        
-        return variables
+                out.write(f"${{USERNAME}}    {username}\n")
+                out.write(f"${{PASSWORD}}    {password}\n")
     
-    def _generate_keywords_section(self) -> str:
-        """Generate the keywords section with reusable keywords."""
-        keywords = "*** Keywords ***\n"
-        
-        # Setup keyword
-        keywords += "Setup Browser\n"
-        keywords += "    New Browser    chromium    headless=False\n"
-        keywords += "    New Context    viewport={'width': 1280, 'height': 720}\n"
-        keywords += f"    New Page    {self.url}\n\n"
-        
-        # Login keyword
-        if "login" in self.config:
-            keywords += "Login\n"
-            keywords += "    [Arguments]    ${username}=${USERNAME}    ${password}=${PASSWORD}\n"
-            keywords += "    Fill Text    ${USERNAME_SELECTOR}    ${username}\n"
-            keywords += "    Fill Text    ${PASSWORD_SELECTOR}    ${password}\n"
-            keywords += "    Click    ${LOGIN_BUTTON_SELECTOR}\n"
-            
-            # Add a wait for success indicator if available
-            if "success_indicator" in self.config["login"]:
-                success_selector = self.config["login"]["success_indicator"]
-                keywords += f"    Wait For Elements State    {success_selector}    visible    timeout=10s\n"
-            
-            keywords += "\n"
-        
-        # Add to cart keyword if product page config exists
-        if "product_page" in self.config:
-            keywords += "Add Product To Cart\n"
-            keywords += "    [Arguments]    ${index}=0\n"
-            keywords += "    ${products}=    Get Elements    ${PRODUCT_ITEM_SELECTOR}\n"
-            keywords += "    ${product}=    Get From List    ${products}    ${index}\n"
-            keywords += "    ${product_name}=    Get Text    ${product} >> ${PRODUCT_NAME_SELECTOR}\n"
-            keywords += "    Click    ${product} >> ${ADD_TO_CART_SELECTOR}\n"
-            keywords += "    [Return]    ${product_name}\n\n"
-            
-            keywords += "Go To Cart\n"
-            keywords += "    Click    ${CART_BUTTON}\n\n"
-        
-        # Checkout keywords if checkout config exists
-        if "checkout" in self.config:
-            keywords += "Complete Checkout\n"
-            keywords += "    [Arguments]    ${first_name}=John    ${last_name}=Doe    ${postal_code}=12345\n"
-            keywords += "    Click    ${CHECKOUT_BUTTON_SELECTOR}\n"
-            keywords += "    Fill Text    ${FIRST_NAME_SELECTOR}    ${first_name}\n"
-            keywords += "    Fill Text    ${LAST_NAME_SELECTOR}    ${last_name}\n"
-            keywords += "    Fill Text    ${POSTAL_CODE_SELECTOR}    ${postal_code}\n"
-            keywords += "    Click    ${CONTINUE_BUTTON_SELECTOR}\n"
-            keywords += "    Click    ${FINISH_BUTTON_SELECTOR}\n"
-            
-            # Add a wait for success message if available
-            keywords += f"    Wait For Elements State    ${{SUCCESS_MESSAGE_SELECTOR}}    visible    timeout=10s\n\n"
-        
-        return keywords
+    def _write_keywords_section(self, out: TextIO) -> None:
+        """Write the keywords section with reusable keywords."""
+        out.write("*** Keywords ***\n")
+        out.write(_SETUP_BROWSER_TEMPLATE.format_map(self._fmt))
+        for section, template in _KEYWORD_TEMPLATES.items():
+            if section in self.config:
+                out.write(template.format_map(self._fmt))
     
-    def _generate_test_cases(self) -> str:
-        """Generate test cases for the website."""
-        test_cases = "*** Test Cases ***\n"
+    def _write_test_cases(self, out: TextIO) -> None:
+        """Write test cases for the website."""
+        out.write("*** Test Cases ***\n")
+        for section, template in _TEST_CASE_TEMPLATES.items():
+            if section in self.config:
+                out.write(template.format_map(self._fmt))
         
-        # Login test
-        if "login" in self.config:
-            test_cases += "Verify Login\n"
-            test_cases += "    Login\n"
-            
-            # Add success verification if available
-            if "success_indicator" in self.config["login"]:
-                success_selector = self.config["login"]["success_indicator"]
-                test_cases += f"    Get Element    {success_selector}\n\n"
-            else:
-                test_cases += "    # Verify login success based on page content\n\n"
-        
-        # Product browsing and cart test
-        if "product_page" in self.config:
-            test_cases += "Add Product To Cart\n"
-            test_cases += "    Login\n"
-            test_cases += "    ${product_name}=    Add Product To Cart\n"
-            test_cases += "    Go To Cart\n"
-            test_cases += "    Get Text    ${PRODUCT_NAME_SELECTOR}    ==    ${product_name}\n\n"
-        
-        # Complete checkout test
-        if "checkout" in self.config:
-            test_cases += "Complete Checkout Process\n"
-            test_cases += "    Login\n"
-            test_cases += "    Add Product To Cart\n"
-            test_cases += "    Go To Cart\n"
-            test_cases += "    Complete Checkout\n"
-            test_cases += f"    Get Text    ${{SUCCESS_MESSAGE_SELECTOR}}\n\n"
-        
-        # Generic test for any website
-        test_cases += "Verify Page Title\n"
-        test_cases += "    ${title}=    Get Title\n"
-        test_cases += "    Log    Page title: ${title}\n\n"
-        
-        test_cases += "Take Screenshot of Homepage\n"
-        test_cases += "    Take Screenshot\n"
+        # Generic tests for any website
+        out.write(_GENERIC_TESTS)
+
+
+@functools.lru_cache(maxsize=32)
+def _build_suite_template(config_key: str) -> str:
+    """
+    Generate the suite for a predefined or generic configuration with a URL placeholder.
+    
+    Args:
+        config_key: Domain in WEBSITE_CONFIGS, or _GENERIC_CONFIG_KEY
         
-        return test_cases
+    Returns:
+        str: The complete test suite with _URL_PLACEHOLDER in place of the URL
+    """
+    config = _GENERIC_CONFIG if config_key == _GENERIC_CONFIG_KEY else WEBSITE_CONFIGS[config_key]
+    buf = io.StringIO()
+    RobotWebGenerator(_URL_PLACEHOLDER, config)._write_robot_suite(buf)
+    return buf.getvalue()
 
 
 def parse_args():
@@ -339,20 +450,21 @@ def main():
     
     url = args.url
     
+    # Create generator
+    generator = RobotWebGenerator(url)
+    
     # Determine output file path
     if args.output:
         output_file = args.output
     else:
-        # Extract domain for the filename
-        from urllib.parse import urlparse
-        domain = urlparse(url).netloc.replace(".", "_")
+        # Use the already parsed domain for the filename
+        domain = generator.domain.replace(".", "_")
         output_file = os.path.join(ROBOT_DIR, f"{domain}_web_tests.robot")
     
     # Ensure output directory exists
     os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
     
-    # Create generator and generate tests
-    generator = RobotWebGenerator(url)
+    # Generate tests
     success = generator.generate_robot_suite(output_file)
     
     if success:
@@ -29,6 +29,31 @@ from mcp_appium.config import configure_logging
 configure_logging("DEBUG")
 logger = logging.getLogger(__name__)
 
+# Directory for the demo screenshots, created once at import
+_SCREENSHOTS_DIR = Path("data/screenshots")
+_SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
+
+async def _save_screenshot_later(page: Page, path: Path) -> asyncio.Task:
+    """
+    Capture a full-page screenshot now and write it to disk in the background.
+    
+    Args:
+        page: The Page instance
+        path: Where to save the PNG
+        
+    Returns:
+        asyncio.Task: Task resolving to the saved path, or None if the capture failed
+    """
+    data = await page.get_screenshot(full_page=True)
+    
+    async def write():
+        if not data:
+            return None
+        await asyncio.to_thread(path.write_bytes, data)
+        return path
+    
+    return asyncio.create_task(write())
+
 async def demo_browser_navigation(page: Page):
     """
     Demonstrate browser navigation operations.
@@ -40,20 +65,17 @@ async def demo_browser_navigation(page: Page):
     
     # Navigate to a URL
     await page.goto("https://www.example.com")
-    logger.info(f"Navigated to {await page.get_url()}")
-    logger.info(f"Page title: {await page.get_title()}")
+    url, title = await asyncio.gather(page.get_url(), page.get_title())
+    logger.info(f"Navigated to {url}")
+    logger.info(f"Page title: {title}")
     
     # Wait for load state
     await page.wait_for_load_state("networkidle")
     logger.info("Page fully loaded")
     
-    # Take a screenshot
-    screenshots_dir = Path("data/screenshots")
-    screenshots_dir.mkdir(parents=True, exist_ok=True)
-    screenshot_path = str(screenshots_dir / "example_website.png")
-    
-    await page.get_screenshot(path=screenshot_path, full_page=True)
-    logger.info(f"Screenshot saved to {screenshot_path}")
+    # Take a screenshot; only the capture has to finish before navigating away,
+    # the PNG is written to disk in the background
+    pending = [await _save_screenshot_later(page, _SCREENSHOTS_DIR / "example_website.png")]
     
     # Navigate to another URL
     await page.goto("https://www.mozilla.org")
@@ -63,9 +85,7 @@ async def demo_browser_navigation(page: Page):
     await page.wait_for_load_state("networkidle")
     
     # Take another screenshot
-    screenshot_path = str(screenshots_dir / "mozilla_website.png")
-    await page.get_screenshot(path=screenshot_path, full_page=True)
-    logger.info(f"Screenshot saved to {screenshot_path}")
+    pending.append(await _save_screenshot_later(page, _SCREENSHOTS_DIR / "mozilla_website.png"))
     
     # Go back
     await page.back()
@@ -77,6 +97,11 @@ async def demo_browser_navigation(page: Page):
     # Go forward
     await page.forward()
     logger.info(f"Navigated forward to {await page.get_url()}")
+    
+    # Make sure the screenshots are on disk before the demo ends
+    for saved_path in await asyncio.gather(*pending):
+        if saved_path:
+            logger.info(f"Screenshot saved to {saved_path}")
 
 async def demo_element_interaction(page: Page):
     """
@@ -102,8 +127,7 @@ async def demo_element_interaction(page: Page):
         logger.info("Typed 'Appium' in the search box")
         
         # Take a screenshot
-        screenshots_dir = Path("data/screenshots")
-        screenshot_path = str(screenshots_dir / "wikipedia_search.png")
+        screenshot_path = _SCREENSHOTS_DIR / "wikipedia_search.png"
         await page.get_screenshot(path=screenshot_path)
         logger.info(f"Screenshot saved to {screenshot_path}")
         
@@ -117,7 +141,7 @@ async def demo_element_interaction(page: Page):
             await page.wait_for_load_state("networkidle")
             
             # Take a screenshot of the results
-            screenshot_path = str(screenshots_dir / "search_results.png")
+            screenshot_path = _SCREENSHOTS_DIR / "search_results.png"
             await page.get_screenshot(path=screenshot_path, full_page=True)
             logger.info(f"Screenshot saved to {screenshot_path}")
             
@@ -142,19 +166,22 @@ async def demo_multi_tab_browsing(browser_context: BrowserContext):
     if not current_page:
         current_page = await browser_context.new_page()
     
-    # Navigate to a URL
-    await current_page.goto("https://www.example.com")
-    logger.info(f"First tab - Navigated to {await current_page.get_url()}")
-    
-    # Create a second tab
+    # Open the second and third tabs up front so the tab order stays fixed
     second_page = await browser_context.new_page()
-    await second_page.goto("https://www.mozilla.org")
-    logger.info(f"Second tab - Navigated to {await second_page.get_url()}")
-    
-    # Create a third tab
     third_page = await browser_context.new_page()
-    await third_page.goto("https://www.wikipedia.org")
-    logger.info(f"Third tab - Navigated to {await third_page.get_url()}")
+    
+    # Navigate all three tabs concurrently
+    await asyncio.gather(
+        current_page.goto("https://www.example.com"),
+        second_page.goto("https://www.mozilla.org"),
+        third_page.goto("https://www.wikipedia.org")
+    )
+    first_url, second_url, third_url = await asyncio.gather(
+        current_page.get_url(), second_page.get_url(), third_page.get_url()
+    )
+    logger.info(f"First tab - Navigated to {first_url}")
+    logger.info(f"Second tab - Navigated to {second_url}")
+    logger.info(f"Third tab - Navigated to {third_url}")
     
     # Switch back to the first tab
     await browser_context.set_current_page(0)
@@ -212,11 +239,14 @@ async def demo_content_extraction(page: Page):
     links = await page.find_elements("a")
     logger.info(f"Found {len(links)} links on the page")
     
-    # Print the first few links
-    for i, link in enumerate(links[:3]):
-        href = await link.get_attribute("href")
-        text = await link.get_text()
-        logger.info(f"Link {i+1}: {text} - {href}")
+    # Read the first few links concurrently and log them in one record
+    async def link_pair(link: WebElement):
+        return await asyncio.gather(link.get_text(), link.get_attribute("href"))
+    
+    pairs = await asyncio.gather(*(link_pair(link) for link in links[:3]))
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("First %d links: %s", len(pairs),
+                    "; ".join(f"{text} - {href}" for text, href in pairs))
 
 async def main():
     """Run the web browser automation example."""
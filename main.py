@@ -14,27 +14,26 @@ import argparse
 import logging
 import os
 import sys
-import subprocess
 from pathlib import Path
 
-# Import the Flask app
-from app import app
+# Directories the application writes to
+_DIRS = (Path("data"), Path("data/logs"), Path("data/screenshots"), Path("data/generated_scripts"))
 
 def create_required_directories():
     """Create required directories for the application."""
-    # Create data directory if it doesn't exist
-    os.makedirs("data", exist_ok=True)
-    
-    # Create other required directories
-    required_dirs = ["logs", "screenshots", "generated_scripts"]
-    for dirname in required_dirs:
-        os.makedirs(os.path.join("data", dirname), exist_ok=True)
+    for path in _DIRS:
+        if not path.exists():
+            path.mkdir(parents=True, exist_ok=True)
 
-# Create required directories
-create_required_directories()
+# Environment defaults, read once at import
+_MCP_HOST = os.environ.get("MCP_HOST", "0.0.0.0")
+_MCP_PORT = int(os.environ.get("MCP_PORT", "5000"))
+_APPIUM_URL = os.environ.get("APPIUM_URL", "http://localhost:4723")
+_MCP_LOG_LEVEL = os.environ.get("MCP_LOG_LEVEL", "INFO")
+_WEB_PORT = int(os.environ.get("WEB_PORT", "8501"))
 
-def parse_args():
-    """Parse command line arguments."""
+def _build_parser():
+    """Build the full argument parser, used for help, errors and unusual input."""
     parser = argparse.ArgumentParser(description="MCP Appium Server and Web Interface")
     
     # Main mode selection
@@ -47,60 +46,130 @@ def parse_args():
     # Server-specific arguments
     parser.add_argument(
         "--host", 
-        default=os.environ.get("MCP_HOST", "0.0.0.0"),
+        default=_MCP_HOST,
         help="Host to bind to (default: 0.0.0.0)"
     )
     parser.add_argument(
         "--port", 
         type=int, 
-        default=int(os.environ.get("MCP_PORT", "5000")),
+        default=_MCP_PORT,
         help="Port to listen on (default: 5000)"
     )
     parser.add_argument(
         "--appium-url", 
-        default=os.environ.get("APPIUM_URL", "http://localhost:4723"),
+        default=_APPIUM_URL,
         help="URL of the Appium server (default: http://localhost:4723)"
     )
     parser.add_argument(
         "--log-level",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-        default=os.environ.get("MCP_LOG_LEVEL", "INFO"),
+        choices=_LOG_LEVELS,
+        default=_MCP_LOG_LEVEL,
         help="Log level (default: INFO, can be set with MCP_LOG_LEVEL env var)"
     )
     
     # Web interface arguments
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Run the web interface with the Flask debugger and reloader"
+    )
     parser.add_argument(
         "--web-port", 
         type=int, 
-        default=int(os.environ.get("WEB_PORT", "8501")),
+        default=_WEB_PORT,
         help="Port for the web interface (default: 8501, Streamlit default)"
     )
     
-    return parser.parse_args()
+    return parser
+
+# Option flags taking a value, mapped to their attribute and converter
+_VALUE_FLAGS = {
+    "--host": ("host", str),
+    "--port": ("port", int),
+    "--appium-url": ("appium_url", str),
+    "--log-level": ("log_level", str),
+    "--web-port": ("web_port", int)
+}
+
+# Log levels in display order for argparse, and as a set for validation
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_LOG_LEVEL_SET = frozenset(_LOG_LEVELS)
+
+def parse_args(argv=None):
+    """
+    Parse command line arguments.
+    
+    The usual invocations are handled by a single scan over the arguments;
+    anything else (help, unknown flags, invalid values) goes through argparse
+    so it reports usage and errors as before.
+    
+    Args:
+        argv: Arguments to parse (default: sys.argv[1:])
+        
+    Returns:
+        argparse.Namespace: The parsed arguments
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    args = argparse.Namespace(
+        server=False,
+        debug=False,
+        host=_MCP_HOST,
+        port=_MCP_PORT,
+        appium_url=_APPIUM_URL,
+        log_level=_MCP_LOG_LEVEL,
+        web_port=_WEB_PORT
+    )
+    
+    i = 0
+    try:
+        while i < len(argv):
+            flag, sep, value = argv[i].partition("=")
+            if flag == "--server" and not sep:
+                args.server = True
+            elif flag == "--debug" and not sep:
+                args.debug = True
+            elif flag in _VALUE_FLAGS:
+                if not sep:
+                    i += 1
+                    value = argv[i]
+                attr, convert = _VALUE_FLAGS[flag]
+                setattr(args, attr, convert(value))
+            else:
+                raise ValueError(flag)
+            i += 1
+    except (IndexError, ValueError):
+        return _build_parser().parse_args(argv)
+    
+    if args.log_level not in _LOG_LEVEL_SET:
+        return _build_parser().parse_args(argv)
+    
+    return args
+
+def _setup_logging(level_name):
+    """
+    Configure logging once for whichever mode is run.
+    
+    Args:
+        level_name: Log level name, e.g. "INFO"
+    """
+    logging.basicConfig(level=level_name)
 
 def run_server(args):
     """Run the MCP Appium server."""
-    import os
     import uvicorn
     
-    # Set environment variables for the MCP server
-    os.environ["APPIUM_URL"] = args.appium_url
-    os.environ["MCP_LOG_LEVEL"] = args.log_level
-    
-    # Configure logging
-    log_level = getattr(logging, args.log_level)
-    logging.basicConfig(level=log_level)
     logger = logging.getLogger(__name__)
     
     logger.info(f"Starting MCP Appium server on {args.host}:{args.port}")
     logger.info(f"Using Appium server at {args.appium_url}")
     
     try:
-        # Import and run the MCP server
-        from mcp_server import app
+        # Import and configure the MCP server
+        import mcp_server
+        mcp_server.configure(appium_url=args.appium_url, log_level=args.log_level)
         
         # Run the server using Uvicorn
-        uvicorn.run(app, host=args.host, port=args.port)
+        uvicorn.run(mcp_server.app, host=args.host, port=args.port)
     except KeyboardInterrupt:
         logger.info("Stopping server due to keyboard interrupt")
     except Exception as e:
@@ -108,17 +177,44 @@ def run_server(args):
         sys.exit(1)
 
 def run_web_interface(args):
-    """Run the MCP Appium web interface using Flask."""
-    # Configure logging
-    log_level = getattr(logging, args.log_level)
-    logging.basicConfig(level=log_level)
+    """
+    Run the MCP Appium web interface.
+    
+    With --debug the Flask development server runs with its debugger and
+    reloader; otherwise the Flask app is served by Gunicorn with WEB_WORKERS
+    worker processes (default: 1) of WEB_THREADS threads each (default: 4).
+    """
     logger = logging.getLogger(__name__)
     
     logger.info(f"Starting Flask web interface on {args.host}:{args.port}")
     
     try:
-        # Run the Flask app
-        app.run(host=args.host, port=args.port, debug=True)
+        if args.debug:
+            # Import the Flask app only when the web interface is selected
+            from app import app as flask_app
+            
+            # Run the Flask development server
+            flask_app.run(host=args.host, port=args.port, debug=True,
+                          use_reloader=True, threaded=True)
+        else:
+            from gunicorn.app.base import BaseApplication
+            
+            class WebApplication(BaseApplication):
+                """Gunicorn application serving the Flask app with the command line settings."""
+                
+                def load_config(self):
+                    self.cfg.set("bind", f"{args.host}:{args.port}")
+                    self.cfg.set("workers", int(os.environ.get("WEB_WORKERS", "1")))
+                    self.cfg.set("threads", int(os.environ.get("WEB_THREADS", "4")))
+                    self.cfg.set("loglevel", args.log_level.lower())
+                
+                def load(self):
+                    # Imported here so each worker process loads the app itself
+                    from app import app as flask_app
+                    return flask_app
+            
+            # Serve the Flask WSGI app with Gunicorn, a WSGI server
+            WebApplication().run()
     except KeyboardInterrupt:
         logger.info("Stopping web interface due to keyboard interrupt")
     except Exception as e:
@@ -128,6 +224,8 @@ def run_web_interface(args):
 def main():
     """Run either the server or the web interface based on command-line arguments."""
     args = parse_args()
+    create_required_directories()
+    _setup_logging(args.log_level)
     
     if args.server:
         run_server(args)
@@ -98,6 +98,30 @@ result = mcp_ai.interpret_command("Click the login button", context)
 ```
 """
 
-# Import integrations for easier access
-from mcp_appium.openai_integration import MCPOpenAIIntegration
-from mcp_appium.ai_integration import AIProvider, MCPAIIntegration
+import importlib
+from types import MappingProxyType
+
+__all__ = ("MCPOpenAIIntegration", "AIProvider", "MCPAIIntegration")
+
+# Integrations exposed for easier access, imported on first use so that the
+# AI client libraries are only loaded when an integration is needed (PEP 562)
+_LAZY = MappingProxyType({
+    "MCPOpenAIIntegration": "mcp_appium.openai_integration",
+    "AIProvider": "mcp_appium.ai_integration",
+    "MCPAIIntegration": "mcp_appium.ai_integration"
+})
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache in the module namespace so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -6,18 +6,24 @@ This module provides integration with various AI providers for the MCP Appium im
 It supports multiple AI providers including OpenAI, Google's Gemini, and direct API calls to Hugging Face.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
+import sqlite3
+import threading
 import time
 import re
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Union, Callable
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, Callable
 
 # OpenAI
 try:
-    from openai import OpenAI
+    from openai import OpenAI, AsyncOpenAI
     from openai.types.chat import ChatCompletion
     from openai import APIError, RateLimitError, APIConnectionError, AuthenticationError
     OPENAI_AVAILABLE = True
@@ -27,16 +33,33 @@ except ImportError:
 # Google GenerativeAI (Gemini)
 try:
     import google.generativeai as genai
+    from google.api_core.exceptions import DeadlineExceeded, ResourceExhausted, ServiceUnavailable
     GEMINI_AVAILABLE = True
 except ImportError:
     GEMINI_AVAILABLE = False
 
+# orjson (optional) speeds up parsing of AI responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# NumPy, used by the semantic response cache
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # Use direct REST API calls for Hugging Face
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, Timeout, RequestException
 
 # Ollama
 try:
+    import httpx
     import ollama
     OLLAMA_AVAILABLE = True
 except ImportError:
@@ -45,12 +68,132 @@ except ImportError:
 from mcp_appium.errors import (
     AppiumMCPError, AIProviderError, AIConnectionError, 
     AIAuthenticationError, AIQuotaExceededError, 
-    AIResponseParsingError, AIModelUnavailableError
+    AIResponseParsingError, AIModelUnavailableError, AIServiceUnavailableError
 )
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Provider errors by kind, used to pick the AI error a failed request raises
+_CONNECTION_ERRORS: Tuple[type, ...] = (ConnectionError, Timeout, AIConnectionError)
+_AUTHENTICATION_ERRORS: Tuple[type, ...] = (AIAuthenticationError,)
+_QUOTA_ERRORS: Tuple[type, ...] = (AIQuotaExceededError,)
+if OPENAI_AVAILABLE:
+    _CONNECTION_ERRORS += (APIConnectionError,)
+    _AUTHENTICATION_ERRORS += (AuthenticationError,)
+    _QUOTA_ERRORS += (RateLimitError,)
+if GEMINI_AVAILABLE:
+    _CONNECTION_ERRORS += (DeadlineExceeded,)
+    _QUOTA_ERRORS += (ResourceExhausted,)
+
+# Errors worth retrying: dropped connections, timeouts, rate limits and a
+# temporarily unavailable service. Anything else (bad credentials, malformed
+# requests) fails the same way again.
+_RETRYABLE_ERRORS: Tuple[type, ...] = _CONNECTION_ERRORS + _QUOTA_ERRORS + (AIServiceUnavailableError,)
+if GEMINI_AVAILABLE:
+    _RETRYABLE_ERRORS += (ServiceUnavailable,)
+if OLLAMA_AVAILABLE:
+    _RETRYABLE_ERRORS += (httpx.TransportError,)
+
+# HTTP statuses worth retrying: rate limited or temporarily unavailable
+_RETRYABLE_STATUS_CODES = (429, 502, 503, 504)
+
+# str.translate table deleting control characters, except tab, newline and carriage return
+_CONTROL_CHARS_TABLE = dict.fromkeys([i for i in range(0x20) if i not in (0x09, 0x0A, 0x0D)] + [0x7F])
+
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON response."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize a JSON request body."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _sanitize_text(text: str) -> str:
+    """
+    Sanitize text to prevent common issues with AI providers.
+    Removes control characters, excessive whitespace, etc.
+    
+    Args:
+        text: Text to sanitize
+        
+    Returns:
+        str: Sanitized text
+    """
+    if not text:
+        return ""
+    
+    # Ensure text is a string
+    text = str(text)
+    
+    # Remove control characters except newlines and tabs
+    text = text.translate(_CONTROL_CHARS_TABLE)
+    
+    # Replace lone surrogates, which cannot be encoded as UTF-8 for transport
+    if not text.isascii():
+        text = text.encode('utf-8', errors='replace').decode('utf-8')
+    
+    # Replace sequences of whitespace with a single space and trim the ends
+    return " ".join(text.split())
+
+
+@lru_cache(maxsize=64)
+def _sanitize_system_prompt(system_prompt: str) -> str:
+    """
+    Sanitize a system prompt, caching the result.
+    
+    Args:
+        system_prompt: System instructions
+        
+    Returns:
+        str: Sanitized system prompt
+    """
+    return _sanitize_text(system_prompt)
+
+
+# Appium actions a command can be interpreted as, shared by the prompts
+_APPIUM_ACTIONS_PROMPT = """
+Available actions and their parameters:
+1. find_element: {"by": "<locator_strategy>", "value": "<locator_value>"}
+2. find_elements: {"by": "<locator_strategy>", "value": "<locator_value>"}
+3. click_element: {"element_id": "<element_id>"}
+4. send_keys: {"element_id": "<element_id>", "text": "<text_to_send>"}
+5. get_text: {"element_id": "<element_id>"}
+6. back: {}
+7. screenshot: {}
+8. get_contexts: {}
+9. switch_to_context: {"context_name": "<context_name>"}
+10. execute_script: {"script": "<javascript_code>", "args": [<arg1>, <arg2>, ...]}
+
+Locator strategies include: "id", "accessibility id", "class name", "xpath", "css selector" (for web contexts), 
+"ios predicate string" (for iOS), "android uiautomator" (for Android).
+"""
+
+# System prompt for interpreting a command, sanitized once up front
+_INTERPRET_SYSTEM_PROMPT = _sanitize_text("""
+You are an expert in mobile app testing with Appium.
+Your job is to interpret natural language commands and convert them into structured Appium commands.
+
+Return a JSON object with the following structure:
+{
+  "action": "<appium_action>",
+  "parameters": {
+    "<param_name>": "<param_value>",
+    ...
+  }
+}
+""" + _APPIUM_ACTIONS_PROMPT + """
+Before responding, analyze the current app state from the provided context (if available).
+""")
+
 class AIProvider(Enum):
     """
     Enumeration of supported AI providers.
@@ -142,6 +285,69 @@ class AIModelInterface(ABC):
         """
         pass
     
+    async def chat_completion_async(self, system_prompt: str, user_prompt: str, json_response: bool = False) -> str:
+        """
+        Generate a chat completion without blocking the event loop.
+        
+        The default implementation runs chat_completion in a worker thread;
+        providers with a native async client override it.
+        
+        Args:
+            system_prompt: System instructions
+            user_prompt: User's message
+            json_response: Whether to request a JSON-formatted response
+            
+        Returns:
+            str: The generated response
+        """
+        return await asyncio.to_thread(self.chat_completion, system_prompt, user_prompt, json_response)
+    
+    def chat_completion_stream(self, system_prompt: str, user_prompt: str, json_response: bool = False) -> Iterator[str]:
+        """
+        Generate a chat completion, yielding the text as it arrives.
+        
+        The default implementation yields the whole completion at once;
+        providers that support streaming override it.
+        
+        Args:
+            system_prompt: System instructions
+            user_prompt: User's message
+            json_response: Whether to request a JSON-formatted response
+            
+        Yields:
+            str: Successive pieces of the generated response
+        """
+        yield self.chat_completion(system_prompt, user_prompt, json_response)
+    
+    async def batch_chat_completion(
+        self,
+        prompts: List[Tuple[str, str]],
+        json_response: bool = False,
+        max_concurrency: int = 8
+    ) -> List[Union[str, Exception]]:
+        """
+        Generate chat completions for several prompts concurrently.
+        
+        Args:
+            prompts: (system_prompt, user_prompt) pairs
+            json_response: Whether to request JSON-formatted responses
+            max_concurrency: Maximum number of requests in flight, to stay within rate limits
+            
+        Returns:
+            List[Union[str, Exception]]: The generated responses in prompt order;
+            a failed request yields its exception instead of a response
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def _one(system_prompt: str, user_prompt: str) -> str:
+            async with semaphore:
+                return await self.chat_completion_async(system_prompt, user_prompt, json_response)
+        
+        return await asyncio.gather(
+            *(_one(system_prompt, user_prompt) for system_prompt, user_prompt in prompts),
+            return_exceptions=True
+        )
+    
     def _retry_with_backoff(self, func: Callable, *args, **kwargs) -> Any:
         """
         Execute a function with retry logic and exponential backoff.
@@ -157,30 +363,105 @@ class AIModelInterface(ABC):
         Raises:
             AIProviderError: If all retries fail
         """
-        last_error = None
         for attempt in range(self.config.max_retries):
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                last_error = e
                 logger.warning(f"Attempt {attempt + 1}/{self.config.max_retries} failed: {str(e)}")
                 
-                # If it's the last attempt, don't sleep
-                if attempt < self.config.max_retries - 1:
-                    # Calculate delay with exponential backoff
-                    delay = self.config.retry_delay * (self.config.retry_backoff_factor ** attempt)
-                    logger.info(f"Retrying in {delay:.1f} seconds...")
-                    time.sleep(delay)
-        
-        # Convert the last error to an appropriate AI error
-        if isinstance(last_error, (ConnectionError, Timeout, APIConnectionError)):
-            raise AIConnectionError(f"Failed to connect to AI provider after {self.config.max_retries} attempts: {str(last_error)}")
-        elif isinstance(last_error, (AuthenticationError)):
-            raise AIAuthenticationError(f"Authentication failed with AI provider: {str(last_error)}")
-        elif isinstance(last_error, (RateLimitError)):
-            raise AIQuotaExceededError(f"AI provider quota exceeded: {str(last_error)}")
+                # Fail fast on errors that a retry cannot fix, and after the last attempt
+                if attempt == self.config.max_retries - 1 or not self._is_retryable(e):
+                    self._raise_retry_error(e, attempt + 1)
+                
+                # Calculate delay with exponential backoff
+                delay = self.config.retry_delay * (self.config.retry_backoff_factor ** attempt)
+                logger.info(f"Retrying in {delay:.1f} seconds...")
+                time.sleep(delay)
+        
+        raise AIProviderError(f"No attempts made: max_retries is {self.config.max_retries}")
+    
+    async def _retry_with_backoff_async(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Await a coroutine function with retry logic and exponential backoff.
+        
+        Args:
+            func: Coroutine function to execute
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+            
+        Returns:
+            Any: Result of the function
+            
+        Raises:
+            AIProviderError: If all retries fail
+        """
+        for attempt in range(self.config.max_retries):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                logger.warning(f"Attempt {attempt + 1}/{self.config.max_retries} failed: {str(e)}")
+                
+                # Fail fast on errors that a retry cannot fix, and after the last attempt
+                if attempt == self.config.max_retries - 1 or not self._is_retryable(e):
+                    self._raise_retry_error(e, attempt + 1)
+                
+                # Calculate delay with exponential backoff
+                delay = self.config.retry_delay * (self.config.retry_backoff_factor ** attempt)
+                logger.info(f"Retrying in {delay:.1f} seconds...")
+                await asyncio.sleep(delay)
+        
+        raise AIProviderError(f"No attempts made: max_retries is {self.config.max_retries}")
+    
+    def _is_retryable(self, error: Exception) -> bool:
+        """
+        Check whether a failed attempt is worth retrying.
+        
+        Connection errors, timeouts, rate limits and 429/502/503/504 responses
+        are retried. Provider errors wrapping one of these (via ``raise ... from``
+        or an implicit exception context) are retried too.
+        
+        Args:
+            error: The error raised by the attempt
+            
+        Returns:
+            bool: True if the request should be retried
+        """
+        for e in (error, error.__cause__ or error.__context__):
+            if e is None:
+                continue
+            if isinstance(e, _RETRYABLE_ERRORS):
+                return True
+            
+            # OpenAI and Hugging Face errors carry status_code, google.api_core ones code
+            status_code = getattr(e, "status_code", None)
+            if status_code is None:
+                status_code = getattr(getattr(e, "response", None), "status_code", None)
+            if status_code is None:
+                status_code = getattr(e, "code", None)
+            if status_code in _RETRYABLE_STATUS_CODES:
+                return True
+        
+        return False
+    
+    def _raise_retry_error(self, last_error: Exception, attempts: int):
+        """
+        Convert the last error of a failed retry loop to an appropriate AI error.
+        
+        Args:
+            last_error: The error raised by the last attempt
+            attempts: Number of attempts made
+            
+        Raises:
+            AIProviderError: Always
+        """
+        if isinstance(last_error, _AUTHENTICATION_ERRORS):
+            raise AIAuthenticationError(f"Authentication failed with AI provider: {str(last_error)}") from last_error
+        elif isinstance(last_error, _QUOTA_ERRORS):
+            raise AIQuotaExceededError(f"AI provider quota exceeded: {str(last_error)}") from last_error
+        elif isinstance(last_error, _CONNECTION_ERRORS):
+            raise AIConnectionError(f"Failed to connect to AI provider after {attempts} attempts: {str(last_error)}") from last_error
         else:
-            raise AIProviderError(f"Failed after {self.config.max_retries} attempts: {str(last_error)}")
+            raise AIProviderError(f"Failed after {attempts} attempts: {str(last_error)}") from last_error
 
     def _sanitize_text(self, text: str) -> str:
         """
@@ -193,22 +474,22 @@ class AIModelInterface(ABC):
         Returns:
             str: Sanitized text
         """
-        if not text:
-            return ""
-        
-        # Ensure text is a string
-        text = str(text)
-        
-        # Remove control characters except newlines and tabs
-        text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
-        
-        # Replace sequences of whitespace with a single space
-        text = re.sub(r'\s+', ' ', text)
+        return _sanitize_text(text)
+    
+    def _sanitize_system_prompt(self, system_prompt: str) -> str:
+        """
+        Sanitize a system prompt, reusing the result for a prompt seen before.
         
-        # Trim leading/trailing whitespace
-        text = text.strip()
+        System prompts are a handful of templates, so each is sanitized once
+        rather than on every request.
         
-        return text
+        Args:
+            system_prompt: System instructions
+            
+        Returns:
+            str: Sanitized system prompt
+        """
+        return _sanitize_system_prompt(system_prompt)
 
 
 class OpenAIModel(AIModelInterface):
@@ -229,6 +510,8 @@ class OpenAIModel(AIModelInterface):
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
         self.model = model
         self.client = None
+        self._async_client = None
+        self._async_client_loop = None
     
     def initialize(self):
         """
@@ -268,31 +551,9 @@ class OpenAIModel(AIModelInterface):
             self.initialize()
             
         def _execute_chat_completion() -> str:
-            # Ensure all strings are properly encoded as UTF-8
-            system_prompt_encoded = self._sanitize_text(system_prompt).encode('utf-8', errors='replace').decode('utf-8')
-            user_prompt_encoded = self._sanitize_text(user_prompt).encode('utf-8', errors='replace').decode('utf-8')
-            
-            kwargs = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": system_prompt_encoded},
-                    {"role": "user", "content": user_prompt_encoded}
-                ],
-                "temperature": self.config.temperature,
-                "max_tokens": self.config.max_tokens
-            }
-            
-            if json_response:
-                kwargs["response_format"] = {"type": "json_object"}
-                
+            kwargs = self._build_request(system_prompt, user_prompt, json_response)
             response = self.client.chat.completions.create(**kwargs)
-            if not isinstance(response, ChatCompletion):
-                raise AIResponseParsingError("Unexpected response type from OpenAI")
-                
-            if not response.choices or len(response.choices) == 0:
-                raise AIResponseParsingError("No choices in OpenAI response")
-                
-            return response.choices[0].message.content
+            return self._response_text(response)
         
         try:
             return self._retry_with_backoff(_execute_chat_completion)
@@ -301,6 +562,126 @@ class OpenAIModel(AIModelInterface):
             if isinstance(e, AIProviderError):
                 raise e
             raise AIProviderError(f"OpenAI generation failed: {str(e)}")
+    
+    async def chat_completion_async(self, system_prompt: str, user_prompt: str, json_response: bool = False) -> str:
+        """
+        Generate a chat completion using OpenAI's async client.
+        
+        Args:
+            system_prompt: System instructions
+            user_prompt: User's message
+            json_response: Whether to request a JSON-formatted response
+            
+        Returns:
+            str: The generated response
+            
+        Raises:
+            AIProviderError: If OpenAI client is not initialized or generation fails
+        """
+        if not self.client:
+            self.initialize()
+        
+        # The async client is bound to the event loop it was first used on
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = AsyncOpenAI(api_key=self.api_key, timeout=self.config.timeout)
+            self._async_client_loop = loop
+        
+        async def _execute_chat_completion() -> str:
+            kwargs = self._build_request(system_prompt, user_prompt, json_response)
+            response = await self._async_client.chat.completions.create(**kwargs)
+            return self._response_text(response)
+        
+        try:
+            return await self._retry_with_backoff_async(_execute_chat_completion)
+        except Exception as e:
+            logger.error(f"Error generating response with OpenAI: {str(e)}")
+            if isinstance(e, AIProviderError):
+                raise e
+            raise AIProviderError(f"OpenAI generation failed: {str(e)}")
+    
+    def chat_completion_stream(self, system_prompt: str, user_prompt: str, json_response: bool = False) -> Iterator[str]:
+        """
+        Generate a chat completion using OpenAI, yielding the text as it arrives.
+        
+        Only opening the stream is retried; an error while reading it is raised.
+        
+        Args:
+            system_prompt: System instructions
+            user_prompt: User's message
+            json_response: Whether to request a JSON-formatted response
+            
+        Yields:
+            str: Successive pieces of the generated response
+            
+        Raises:
+            AIProviderError: If OpenAI client is not initialized or generation fails
+        """
+        if not self.client:
+            self.initialize()
+        
+        kwargs = self._build_request(system_prompt, user_prompt, json_response)
+        try:
+            stream = self._retry_with_backoff(self.client.chat.completions.create, stream=True, **kwargs)
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            logger.error(f"Error streaming response with OpenAI: {str(e)}")
+            if isinstance(e, AIProviderError):
+                raise e
+            raise AIProviderError(f"OpenAI generation failed: {str(e)}")
+    
+    def _build_request(self, system_prompt: str, user_prompt: str, json_response: bool) -> Dict[str, Any]:
+        """
+        Build the arguments of an OpenAI chat completion request.
+        
+        Args:
+            system_prompt: System instructions
+            user_prompt: User's message
+            json_response: Whether to request a JSON-formatted response
+            
+        Returns:
+            Dict[str, Any]: Keyword arguments for ``chat.completions.create``
+        """
+        system_prompt_clean = self._sanitize_system_prompt(system_prompt)
+        user_prompt_clean = self._sanitize_text(user_prompt)
+        
+        kwargs = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt_clean},
+                {"role": "user", "content": user_prompt_clean}
+            ],
+            "temperature": self.config.temperature,
+            "max_tokens": self.config.max_tokens
+        }
+        
+        if json_response:
+            kwargs["response_format"] = {"type": "json_object"}
+        
+        return kwargs
+    
+    def _response_text(self, response: Any) -> str:
+        """
+        Extract the generated text from an OpenAI chat completion.
+        
+        Args:
+            response: Chat completion returned by the client
+            
+        Returns:
+            str: The generated response
+            
+        Raises:
+            AIResponseParsingError: If the response has an unexpected shape
+        """
+        if not isinstance(response, ChatCompletion):
+            raise AIResponseParsingError("Unexpected response type from OpenAI")
+            
+        if not response.choices or len(response.choices) == 0:
+            raise AIResponseParsingError("No choices in OpenAI response")
+            
+        return response.choices[0].message.content
 
 
 class GeminiModel(AIModelInterface):
@@ -321,6 +702,7 @@ class GeminiModel(AIModelInterface):
         self.api_key = api_key or os.environ.get("GOOGLE_API_KEY")
         self.model = model
         self.initialized = False
+        self._gmodel = None
     
     def initialize(self):
         """
@@ -337,6 +719,14 @@ class GeminiModel(AIModelInterface):
             
         try:
             genai.configure(api_key=self.api_key)
+            # Built once and reused, the generation config does not change between requests
+            self._gmodel = genai.GenerativeModel(
+                self.model,
+                generation_config={
+                    "temperature": self.config.temperature,
+                    "max_output_tokens": self.config.max_tokens,
+                }
+            )
             self.initialized = True
             logger.info(f"Initialized Gemini with model {self.model}")
         except Exception as e:
@@ -361,30 +751,8 @@ class GeminiModel(AIModelInterface):
             self.initialize()
             
         def _execute_chat_completion() -> str:
-            # Ensure all strings are properly encoded as UTF-8
-            system_prompt_encoded = self._sanitize_text(system_prompt).encode('utf-8', errors='replace').decode('utf-8')
-            user_prompt_encoded = self._sanitize_text(user_prompt).encode('utf-8', errors='replace').decode('utf-8')
-            
-            # Combine system prompt and user prompt for Gemini (different structure than OpenAI)
-            prompt = f"{system_prompt_encoded}\n\n{user_prompt_encoded}"
-            
-            if json_response:
-                prompt += "\n\nPlease provide your response as a valid JSON object."
-                
-            model = genai.GenerativeModel(
-                self.model,
-                generation_config={
-                    "temperature": self.config.temperature,
-                    "max_output_tokens": self.config.max_tokens,
-                }
-            )
-            
-            response = model.generate_content(prompt)
-            
-            if not hasattr(response, 'text'):
-                raise AIResponseParsingError("Unexpected response format from Gemini")
-                
-            return response.text
+            response = self._gmodel.generate_content(self._build_prompt(system_prompt, user_prompt, json_response))
+            return self._response_text(response)
             
         try:
             return self._retry_with_backoff(_execute_chat_completion)
@@ -393,43 +761,10 @@ class GeminiModel(AIModelInterface):
             if isinstance(e, AIProviderError):
                 raise e
             raise AIProviderError(f"Gemini generation failed: {str(e)}")
-
-
-class HuggingFaceModel(AIModelInterface):
-    """
-    Implementation of the AIModelInterface for Hugging Face models via API.
-    Uses direct API calls instead of a Python client.
-    """
-    
-    def __init__(self, api_key: Optional[str] = None, model: str = "meta-llama/Llama-2-70b-chat-hf", config: Optional[AIModelConfig] = None):
-        """
-        Initialize the Hugging Face model.
-        
-        Args:
-            api_key: Hugging Face API token (defaults to environment variable)
-            model: Model to use (default: meta-llama/Llama-2-70b-chat-hf)
-            config: AI model configuration
-        """
-        super().__init__(config)
-        self.api_key = api_key or os.environ.get("HUGGINGFACE_API_KEY")
-        self.model = model
-        self.api_url = f"https://api-inference.huggingface.co/models/{model}"
-    
-    def initialize(self):
-        """
-        Check that Hugging Face API key is available.
-        
-        Raises:
-            AIProviderError: If API key is missing
-        """
-        if not self.api_key:
-            raise AIAuthenticationError("Hugging Face API key not found. Set HUGGINGFACE_API_KEY environment variable")
-            
-        logger.info(f"Initialized Hugging Face with model {self.model}")
     
-    def chat_completion(self, system_prompt: str, user_prompt: str, json_response: bool = False) -> str:
+    async def chat_completion_async(self, system_prompt: str, user_prompt: str, json_response: bool = False) -> str:
         """
-        Generate a chat completion using Hugging Face API.
+        Generate a chat completion using Gemini's async API.
         
         Args:
             system_prompt: System instructions
@@ -440,26 +775,166 @@ class HuggingFaceModel(AIModelInterface):
             str: The generated response
             
         Raises:
-            AIProviderError: If the API call fails
+            AIProviderError: If Gemini is not initialized or generation fails
         """
-        self.initialize()
-            
-        def _execute_chat_completion() -> str:
-            # Ensure all strings are properly encoded as UTF-8
-            system_prompt_encoded = self._sanitize_text(system_prompt).encode('utf-8', errors='replace').decode('utf-8')
-            user_prompt_encoded = self._sanitize_text(user_prompt).encode('utf-8', errors='replace').decode('utf-8')
+        if not self.initialized:
+            self.initialize()
             
-            # Format prompt based on common Hugging Face text generation format
-            prompt = f"<system>\n{system_prompt_encoded}\n</system>\n\n<user>\n{user_prompt_encoded}\n</user>\n\n<assistant>"
+        async def _execute_chat_completion() -> str:
+            response = await self._gmodel.generate_content_async(self._build_prompt(system_prompt, user_prompt, json_response))
+            return self._response_text(response)
+            
+        try:
+            return await self._retry_with_backoff_async(_execute_chat_completion)
+        except Exception as e:
+            logger.error(f"Error generating response with Gemini: {str(e)}")
+            if isinstance(e, AIProviderError):
+                raise e
+            raise AIProviderError(f"Gemini generation failed: {str(e)}")
+    
+    def chat_completion_stream(self, system_prompt: str, user_prompt: str, json_response: bool = False) -> Iterator[str]:
+        """
+        Generate a chat completion using Gemini, yielding the text as it arrives.
+        
+        Only opening the stream is retried; an error while reading it is raised.
+        
+        Args:
+            system_prompt: System instructions
+            user_prompt: User's message
+            json_response: Whether to request a JSON-formatted response
+            
+        Yields:
+            str: Successive pieces of the generated response
+            
+        Raises:
+            AIProviderError: If Gemini is not initialized or generation fails
+        """
+        if not self.initialized:
+            self.initialize()
+        
+        prompt = self._build_prompt(system_prompt, user_prompt, json_response)
+        try:
+            stream = self._retry_with_backoff(self._gmodel.generate_content, prompt, stream=True)
+            for chunk in stream:
+                yield self._response_text(chunk)
+        except Exception as e:
+            logger.error(f"Error streaming response with Gemini: {str(e)}")
+            if isinstance(e, AIProviderError):
+                raise e
+            raise AIProviderError(f"Gemini generation failed: {str(e)}")
+    
+    def _build_prompt(self, system_prompt: str, user_prompt: str, json_response: bool) -> str:
+        """
+        Build the prompt of a Gemini request.
+        
+        Args:
+            system_prompt: System instructions
+            user_prompt: User's message
+            json_response: Whether to request a JSON-formatted response
+            
+        Returns:
+            str: The combined prompt
+        """
+        system_prompt_clean = self._sanitize_system_prompt(system_prompt)
+        user_prompt_clean = self._sanitize_text(user_prompt)
+        
+        # Combine system prompt and user prompt for Gemini (different structure than OpenAI)
+        prompt = f"{system_prompt_clean}\n\n{user_prompt_clean}"
+        
+        if json_response:
+            prompt += "\n\nPlease provide your response as a valid JSON object."
+        
+        return prompt
+    
+    def _response_text(self, response: Any) -> str:
+        """
+        Extract the generated text from a Gemini response.
+        
+        Args:
+            response: Response returned by the model
+            
+        Returns:
+            str: The generated response
+            
+        Raises:
+            AIResponseParsingError: If the response has an unexpected shape
+        """
+        if not hasattr(response, 'text'):
+            raise AIResponseParsingError("Unexpected response format from Gemini")
+            
+        return response.text
+
+
+class HuggingFaceModel(AIModelInterface):
+    """
+    Implementation of the AIModelInterface for Hugging Face models via API.
+    Uses direct API calls instead of a Python client.
+    """
+    
+    def __init__(self, api_key: Optional[str] = None, model: str = "meta-llama/Llama-2-70b-chat-hf", config: Optional[AIModelConfig] = None):
+        """
+        Initialize the Hugging Face model.
+        
+        Args:
+            api_key: Hugging Face API token (defaults to environment variable)
+            model: Model to use (default: meta-llama/Llama-2-70b-chat-hf)
+            config: AI model configuration
+        """
+        super().__init__(config)
+        self.api_key = api_key or os.environ.get("HUGGINGFACE_API_KEY")
+        self.model = model
+        self.api_url = f"https://api-inference.huggingface.co/models/{model}"
+        
+        # One session per model so every request reuses its pooled keep-alive
+        # connections; retries are left to _retry_with_backoff
+        max_connections = self.config.additional_params.get("max_connections", 8)
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_maxsize=max_connections, max_retries=0))
+        self._initialized = False
+    
+    def initialize(self):
+        """
+        Check that Hugging Face API key is available.
+        
+        Raises:
+            AIProviderError: If API key is missing
+        """
+        if not self.api_key:
+            raise AIAuthenticationError("Hugging Face API key not found. Set HUGGINGFACE_API_KEY environment variable")
+        
+        self._session.headers["Authorization"] = f"Bearer {self.api_key}"
+        self._session.headers["Content-Type"] = "application/json"
+        self._initialized = True
+        logger.info(f"Initialized Hugging Face with model {self.model}")
+    
+    def chat_completion(self, system_prompt: str, user_prompt: str, json_response: bool = False) -> str:
+        """
+        Generate a chat completion using Hugging Face API.
+        
+        Args:
+            system_prompt: System instructions
+            user_prompt: User's message
+            json_response: Whether to request a JSON-formatted response
+            
+        Returns:
+            str: The generated response
+            
+        Raises:
+            AIProviderError: If the API call fails
+        """
+        if not self._initialized:
+            self.initialize()
+            
+        def _execute_chat_completion() -> str:
+            system_prompt_clean = self._sanitize_system_prompt(system_prompt)
+            user_prompt_clean = self._sanitize_text(user_prompt)
+            
+            # Format prompt based on common Hugging Face text generation format
+            prompt = f"<system>\n{system_prompt_clean}\n</system>\n\n<user>\n{user_prompt_clean}\n</user>\n\n<assistant>"
             
             if json_response:
                 prompt += "\nI'll provide my response as a valid JSON object.\n"
                 
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
             payload = {
                 "inputs": prompt,
                 "parameters": {
@@ -469,10 +944,9 @@ class HuggingFaceModel(AIModelInterface):
                 }
             }
             
-            response = requests.post(
+            response = self._session.post(
                 self.api_url, 
-                headers=headers, 
-                json=payload,
+                data=_json_dumps(payload),
                 timeout=self.config.timeout
             )
             
@@ -480,10 +954,16 @@ class HuggingFaceModel(AIModelInterface):
                 raise AIAuthenticationError(f"Authentication failed with Hugging Face API: {response.text}")
             elif response.status_code == 429:
                 raise AIQuotaExceededError(f"Hugging Face API rate limit exceeded: {response.text}")
+            elif response.status_code in _RETRYABLE_STATUS_CODES:
+                # e.g. 503 while the model is loading
+                raise AIServiceUnavailableError(
+                    f"Hugging Face API unavailable: {response.status_code} - {response.text}",
+                    status_code=response.status_code
+                )
             elif response.status_code != 200:
                 raise AIProviderError(f"Hugging Face API error: {response.status_code} - {response.text}")
                 
-            result = response.json()
+            result = _json_loads(response.content)
             
             # Extract the generated text from the response
             if isinstance(result, list) and len(result) > 0:
@@ -499,6 +979,12 @@ class HuggingFaceModel(AIModelInterface):
             if isinstance(e, AIProviderError):
                 raise e
             raise AIProviderError(f"Hugging Face API call failed: {str(e)}")
+    
+    def close(self):
+        """
+        Close the HTTP session and its pooled connections.
+        """
+        self._session.close()
 
 
 class OllamaModel(AIModelInterface):
@@ -519,6 +1005,9 @@ class OllamaModel(AIModelInterface):
         super().__init__(config)
         self.model = model
         self.ollama_host = ollama_host or os.environ.get("OLLAMA_BASE_URL", "http://ollama:11434")
+        self._client = None
+        self._async_client = None
+        self._async_client_loop = None
     
     def initialize(self):
         """
@@ -531,21 +1020,21 @@ class OllamaModel(AIModelInterface):
             raise AIProviderError("Ollama package is not installed. Install it with 'pip install ollama'")
             
         try:
-            # Set the host
-            ollama.host = self.ollama_host
+            # One client per model so every request reuses its pooled connections
+            self._client = ollama.Client(host=self.ollama_host, **self._client_kwargs())
             
             # List available models to verify connection
-            models = ollama.list()
+            models = self._client.list()
             logger.info(f"Connected to Ollama at {self.ollama_host}")
             
             # Check if the model is already available
-            model_available = any(m.get('name') == self.model for m in models.get('models', []))
+            model_names = {m.get('name') for m in models.get('models', ())}
             
-            if not model_available:
+            if self.model not in model_names:
                 logger.info(f"Model {self.model} not found locally, attempting to pull...")
                 try:
                     # This will pull the model if it's not available
-                    ollama.pull(self.model)
+                    self._client.pull(self.model)
                     logger.info(f"Successfully pulled model {self.model}")
                 except Exception as e:
                     raise AIModelUnavailableError(f"Failed to pull model {self.model}: {str(e)}")
@@ -569,29 +1058,68 @@ class OllamaModel(AIModelInterface):
         Raises:
             AIProviderError: If Ollama model is not accessible or generation fails
         """
-        def _execute_chat_completion() -> str:
-            # Ensure all strings are properly encoded as UTF-8
-            system_prompt_encoded = self._sanitize_text(system_prompt).encode('utf-8', errors='replace').decode('utf-8')
-            user_prompt_encoded = self._sanitize_text(user_prompt).encode('utf-8', errors='replace').decode('utf-8')
+        if self._client is None:
+            self.initialize()
             
-            # Format message for json response if needed
-            messages = [
-                {"role": "system", "content": system_prompt_encoded}
-            ]
+        def _execute_chat_completion() -> str:
+            messages = self._build_messages(system_prompt, user_prompt, json_response)
             
-            if json_response:
-                user_prompt_encoded += "\n\nPlease format your response as a valid JSON object."
+            try:
+                response = self._client.chat(
+                    model=self.model,
+                    messages=messages,
+                    options=self._options(),
+                    **self._keep_alive()
+                )
                 
-            messages.append({"role": "user", "content": user_prompt_encoded})
+                if not response or "message" not in response:
+                    raise AIResponseParsingError("No valid message in Ollama response")
+                    
+                return response["message"]["content"]
+            except Exception as e:
+                raise AIProviderError(f"Ollama generation failed: {str(e)}")
+        
+        try:
+            return self._retry_with_backoff(_execute_chat_completion)
+        except Exception as e:
+            logger.error(f"Error generating response with Ollama: {str(e)}")
+            if isinstance(e, AIProviderError):
+                raise e
+            raise AIProviderError(f"Ollama generation failed: {str(e)}")
+    
+    async def chat_completion_async(self, system_prompt: str, user_prompt: str, json_response: bool = False) -> str:
+        """
+        Generate a chat completion using Ollama's async client.
+        
+        Args:
+            system_prompt: System instructions
+            user_prompt: User's message
+            json_response: Whether to request a JSON-formatted response
+            
+        Returns:
+            str: The generated response
+            
+        Raises:
+            AIProviderError: If Ollama model is not accessible or generation fails
+        """
+        if not OLLAMA_AVAILABLE:
+            raise AIProviderError("Ollama package is not installed. Install it with 'pip install ollama'")
+            
+        # The async client is bound to the event loop it was first used on
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = ollama.AsyncClient(host=self.ollama_host, **self._client_kwargs())
+            self._async_client_loop = loop
+        
+        async def _execute_chat_completion() -> str:
+            messages = self._build_messages(system_prompt, user_prompt, json_response)
             
             try:
-                response = ollama.chat(
+                response = await self._async_client.chat(
                     model=self.model,
                     messages=messages,
-                    options={
-                        "temperature": self.config.temperature,
-                        "num_predict": self.config.max_tokens
-                    }
+                    options=self._options(),
+                    **self._keep_alive()
                 )
                 
                 if not response or "message" not in response:
@@ -602,12 +1130,142 @@ class OllamaModel(AIModelInterface):
                 raise AIProviderError(f"Ollama generation failed: {str(e)}")
         
         try:
-            return self._retry_with_backoff(_execute_chat_completion)
+            return await self._retry_with_backoff_async(_execute_chat_completion)
         except Exception as e:
             logger.error(f"Error generating response with Ollama: {str(e)}")
             if isinstance(e, AIProviderError):
                 raise e
             raise AIProviderError(f"Ollama generation failed: {str(e)}")
+    
+    def chat_completion_stream(self, system_prompt: str, user_prompt: str, json_response: bool = False) -> Iterator[str]:
+        """
+        Generate a chat completion using Ollama, yielding the text as it arrives.
+        
+        Only opening the stream is retried; an error while reading it is raised.
+        
+        Args:
+            system_prompt: System instructions
+            user_prompt: User's message
+            json_response: Whether to request a JSON-formatted response
+            
+        Yields:
+            str: Successive pieces of the generated response
+            
+        Raises:
+            AIProviderError: If Ollama model is not accessible or generation fails
+        """
+        if self._client is None:
+            self.initialize()
+        
+        messages = self._build_messages(system_prompt, user_prompt, json_response)
+        try:
+            stream = self._retry_with_backoff(
+                self._client.chat,
+                model=self.model,
+                messages=messages,
+                options=self._options(),
+                stream=True,
+                **self._keep_alive()
+            )
+            for chunk in stream:
+                content = chunk["message"]["content"]
+                if content:
+                    yield content
+        except Exception as e:
+            logger.error(f"Error streaming response with Ollama: {str(e)}")
+            if isinstance(e, AIProviderError):
+                raise e
+            raise AIProviderError(f"Ollama generation failed: {str(e)}")
+    
+    def warm_up(self):
+        """
+        Load the model into memory ahead of the first real request.
+        
+        Sends an empty prompt, which makes Ollama load the model (and keep it
+        loaded for the configured ``keep_alive``) without generating anything.
+        
+        Raises:
+            AIProviderError: If the model cannot be loaded
+        """
+        if self._client is None:
+            self.initialize()
+        
+        try:
+            self._client.generate(model=self.model, prompt="", **self._keep_alive())
+            logger.info(f"Warmed up Ollama model {self.model}")
+        except Exception as e:
+            raise AIProviderError(f"Failed to warm up Ollama model {self.model}: {str(e)}")
+    
+    def _build_messages(self, system_prompt: str, user_prompt: str, json_response: bool) -> List[Dict[str, str]]:
+        """
+        Build the chat messages for an Ollama request.
+        
+        Args:
+            system_prompt: System instructions
+            user_prompt: User's message
+            json_response: Whether to request a JSON-formatted response
+            
+        Returns:
+            List[Dict[str, str]]: Chat messages
+        """
+        system_prompt_clean = self._sanitize_system_prompt(system_prompt)
+        user_prompt_clean = self._sanitize_text(user_prompt)
+        
+        # Format message for json response if needed
+        messages = [
+            {"role": "system", "content": system_prompt_clean}
+        ]
+        
+        if json_response:
+            user_prompt_clean += "\n\nPlease format your response as a valid JSON object."
+            
+        messages.append({"role": "user", "content": user_prompt_clean})
+        return messages
+    
+    def _client_kwargs(self) -> Dict[str, Any]:
+        """
+        Get the HTTP transport settings shared by the sync and async clients.
+        
+        Connections are kept alive and reused across requests, so only the
+        first call pays for the TCP handshake. Set ``max_connections`` in the
+        AIModelConfig to size the pool for concurrent requests.
+        
+        Returns:
+            Dict[str, Any]: Keyword arguments for ``ollama.Client``/``ollama.AsyncClient``
+        """
+        max_connections = self.config.additional_params.get("max_connections", 8)
+        return {
+            "timeout": self.config.timeout,
+            "limits": httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            )
+        }
+    
+    def _keep_alive(self) -> Dict[str, Any]:
+        """
+        Get the keep_alive argument for an Ollama request.
+        
+        Set ``keep_alive`` in the AIModelConfig to keep the model (and its
+        prompt cache) resident between requests.
+        
+        Returns:
+            Dict[str, Any]: ``{"keep_alive": ...}`` if configured, otherwise empty
+        """
+        keep_alive = self.config.additional_params.get("keep_alive")
+        return {"keep_alive": keep_alive} if keep_alive is not None else {}
+    
+    def _options(self) -> Dict[str, Any]:
+        """
+        Get the generation options for an Ollama request.
+        
+        Returns:
+            Dict[str, Any]: Ollama generation options
+        """
+        return {
+            "temperature": self.config.temperature,
+            "num_predict": self.config.max_tokens
+        }
 
 
 class AIModelFactory:
@@ -653,47 +1311,367 @@ class AIModelFactory:
             raise AIProviderError(f"Unsupported AI provider: {provider}")
 
 
-class MCPAIIntegration:
+class LLMCache:
     """
-    Main class for AI integration with MCP Appium.
-    Provides a unified interface for different AI providers.
+    Exact-match cache of AI responses.
+    
+    Entries are keyed on everything that determines a completion (provider,
+    model, temperature, prompts and response format) and expire after a TTL.
+    Only deterministic requests (temperature 0) are cached, since any other
+    temperature is expected to give a different answer each time.
     """
     
-    def __init__(
-        self,
-        provider: Union[str, AIProvider] = AIProvider.OPENAI, 
-        api_key: Optional[str] = None,
-        model: Optional[str] = None,
-        config: Optional[AIModelConfig] = None
-    ):
+    def __init__(self, max_size: int = 1024, ttl: float = 3600):
         """
-        Initialize the AI integration.
+        Initialize the cache.
         
         Args:
-            provider: AI provider to use (default: OpenAI)
-            api_key: Optional API key (defaults to environment variable)
-            model: Optional model name (defaults to provider's default)
-            config: Optional AI model configuration
+            max_size: Maximum number of responses kept; the least recently used is evicted first
+            ttl: Time in seconds before a cached response expires
         """
-        # Convert string to enum if needed
-        if isinstance(provider, str):
-            try:
-                provider = AIProvider(provider.lower())
-            except ValueError:
-                raise AIProviderError(f"Unknown AI provider: {provider}. Supported providers: {[p.value for p in AIProvider]}")
-                
-        self.provider = provider
-        self.config = config or AIModelConfig()
-        self.model = AIModelFactory.create_model(provider, api_key, model, self.config)
-        
-        # Initialize the model
-        try:
-            self.model.initialize()
-        except Exception as e:
-            logger.error(f"Failed to initialize AI model: {str(e)}")
-            if isinstance(e, AIProviderError):
-                raise e
-            raise AIProviderError(f"AI model initialization failed: {str(e)}")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+    
+    @staticmethod
+    def make_key(
+        provider: AIProvider,
+        model: str,
+        temperature: float,
+        system_prompt: str,
+        user_prompt: str,
+        json_response: bool
+    ) -> str:
+        """
+        Build the cache key for a chat completion request.
+        
+        Args:
+            provider: AI provider
+            model: Model name
+            temperature: Sampling temperature
+            system_prompt: System instructions
+            user_prompt: User's message
+            json_response: Whether a JSON-formatted response was requested
+            
+        Returns:
+            str: A digest of the request
+        """
+        request = json.dumps({
+            "provider": provider.value,
+            "model": model,
+            "temperature": temperature,
+            "system_prompt": system_prompt,
+            "user_prompt": user_prompt,
+            "json_response": json_response
+        }, sort_keys=True)
+        return hashlib.blake2b(request.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response, marking it as recently used.
+        
+        Args:
+            key: Key from make_key
+            
+        Returns:
+            Optional[str]: The cached response, or None on a miss or if it expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, response = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return response
+    
+    def put(self, key: str, response: str) -> None:
+        """
+        Store a response, evicting the least recently used entry when full.
+        
+        Args:
+            key: Key from make_key
+            response: Response to cache
+        """
+        self._entries[key] = (time.monotonic() + self.ttl, response)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Discard all cached responses."""
+        self._entries.clear()
+
+
+class DiskLLMCache(LLMCache):
+    """
+    Exact-match cache of AI responses stored in an SQLite file.
+    
+    Unlike LLMCache, cached responses survive the process, so re-running a
+    script or test suite reuses the answers of the previous run, and several
+    processes can share one cache file.
+    """
+    
+    DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".cache", "mcp_appium", "llm_cache.sqlite3")
+    
+    # Seconds to wait for another process holding the cache file lock
+    DB_TIMEOUT = 10
+    
+    def __init__(self, path: Optional[str] = None, max_size: int = 10000, ttl: float = 7 * 24 * 3600):
+        """
+        Initialize the cache, creating the cache file if needed.
+        
+        Args:
+            path: Cache file path (default: ~/.cache/mcp_appium/llm_cache.sqlite3)
+            max_size: Maximum number of responses kept; the oldest is evicted first
+            ttl: Time in seconds before a cached response expires
+        """
+        super().__init__(max_size=max_size, ttl=ttl)
+        self.path = path or self.DEFAULT_PATH
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        
+        # One connection shared by the threads of this process
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, timeout=self.DB_TIMEOUT, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key: Key from make_key
+            
+        Returns:
+            Optional[str]: The cached response, or None on a miss or if it expired
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT response FROM responses WHERE key = ? AND expires_at >= ?",
+                (key, time.time())
+            ).fetchone()
+        return row[0] if row else None
+    
+    def put(self, key: str, response: str) -> None:
+        """
+        Store a response, evicting expired entries and the oldest ones when full.
+        
+        Args:
+            key: Key from make_key
+            response: Response to cache
+        """
+        now = time.time()
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, response, expires_at) VALUES (?, ?, ?)",
+                (key, response, now + self.ttl)
+            )
+            self._db.execute("DELETE FROM responses WHERE expires_at < ?", (now,))
+            self._db.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_size,)
+            )
+    
+    def clear(self) -> None:
+        """Discard all cached responses."""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM responses")
+    
+    def close(self) -> None:
+        """Close the cache file."""
+        with self._lock:
+            self._db.close()
+
+
+class SemanticCache:
+    """
+    Similarity-based cache of AI responses.
+    
+    Matches paraphrases of an earlier request ("top 5 items" vs "top five
+    items") that the exact-match LLMCache misses. Each query is embedded once
+    and compared against the earlier queries of its bucket with a single
+    matrix-vector product over their normalized embeddings.
+    
+    The embedding function is supplied by the caller, e.g. the ``encode``
+    method of a sentence-transformers model or a provider embeddings endpoint.
+    """
+    
+    def __init__(
+        self,
+        embed: Callable[[str], Any],
+        threshold: float = 0.92,
+        max_size: int = 256
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            embed: Function returning the embedding vector of a text
+            threshold: Minimum cosine similarity for a cached response to be reused
+            max_size: Maximum number of responses kept per bucket; the oldest is evicted first
+            
+        Raises:
+            AIProviderError: If NumPy is not available
+        """
+        if not NUMPY_AVAILABLE:
+            raise AIProviderError("NumPy is not installed. Install it with 'pip install numpy'")
+        
+        self.embed = embed
+        self.threshold = threshold
+        self.max_size = max_size
+        # bucket -> (embeddings matrix of shape (N, d), responses)
+        self._buckets: Dict[str, Tuple["np.ndarray", List[str]]] = {}
+    
+    @staticmethod
+    def make_bucket(
+        provider: AIProvider,
+        model: str,
+        temperature: float,
+        system_prompt: str,
+        context: str
+    ) -> str:
+        """
+        Build the bucket key for requests whose queries may be compared.
+        
+        Args:
+            provider: AI provider
+            model: Model name
+            temperature: Sampling temperature
+            system_prompt: System instructions
+            context: Serialized context the query is asked in
+            
+        Returns:
+            str: A digest of the bucket
+        """
+        bucket = json.dumps([provider.value, model, temperature, system_prompt, context])
+        return hashlib.blake2b(bucket.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def embed_text(self, text: str) -> "np.ndarray":
+        """
+        Embed a query as a normalized float32 vector.
+        
+        Args:
+            text: Query text
+            
+        Returns:
+            np.ndarray: Unit-length embedding of the text
+        """
+        vector = np.asarray(self.embed(text), dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+    
+    def get(self, bucket: str, vector: "np.ndarray") -> Optional[str]:
+        """
+        Look up the response to the most similar earlier query.
+        
+        Args:
+            bucket: Key from make_bucket
+            vector: Query embedding from embed_text
+            
+        Returns:
+            Optional[str]: The cached response, or None if no earlier query is similar enough
+        """
+        entry = self._buckets.get(bucket)
+        if entry is None:
+            return None
+        
+        embeddings, responses = entry
+        similarities = embeddings @ vector
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            return None
+        return responses[best]
+    
+    def put(self, bucket: str, vector: "np.ndarray", response: str) -> None:
+        """
+        Store a response, evicting the oldest entry of the bucket when full.
+        
+        Args:
+            bucket: Key from make_bucket
+            vector: Query embedding from embed_text
+            response: Response to cache
+        """
+        entry = self._buckets.get(bucket)
+        if entry is None:
+            self._buckets[bucket] = (vector[np.newaxis, :], [response])
+            return
+        
+        embeddings, responses = entry
+        embeddings = np.vstack((embeddings, vector))
+        responses.append(response)
+        if len(responses) > self.max_size:
+            embeddings = embeddings[1:]
+            del responses[0]
+        self._buckets[bucket] = (embeddings, responses)
+    
+    def clear(self) -> None:
+        """Discard all cached responses."""
+        self._buckets.clear()
+
+
+class MCPAIIntegration:
+    """
+    Main class for AI integration with MCP Appium.
+    Provides a unified interface for different AI providers.
+    """
+    
+    # Maximum number of screen descriptions/suggestions kept in memory
+    SCREEN_CACHE_SIZE = 256
+    
+    def __init__(
+        self,
+        provider: Union[str, AIProvider] = AIProvider.OPENAI, 
+        api_key: Optional[str] = None,
+        model: Optional[str] = None,
+        config: Optional[AIModelConfig] = None,
+        cache: Optional[LLMCache] = None,
+        semantic_cache: Optional[SemanticCache] = None
+    ):
+        """
+        Initialize the AI integration.
+        
+        Args:
+            provider: AI provider to use (default: OpenAI)
+            api_key: Optional API key (defaults to environment variable)
+            model: Optional model name (defaults to provider's default)
+            config: Optional AI model configuration
+            cache: Optional cache of interpreted commands (only used at temperature 0),
+                either an in-memory LLMCache or a DiskLLMCache shared across runs
+            semantic_cache: Optional cache matching paraphrased commands (only used at temperature 0)
+        """
+        # Convert string to enum if needed
+        if isinstance(provider, str):
+            try:
+                provider = AIProvider(provider.lower())
+            except ValueError:
+                raise AIProviderError(f"Unknown AI provider: {provider}. Supported providers: {[p.value for p in AIProvider]}")
+                
+        self.provider = provider
+        self.config = config or AIModelConfig()
+        self.model = AIModelFactory.create_model(provider, api_key, model, self.config)
+        self.cache = cache
+        self.semantic_cache = semantic_cache
+        
+        # LRU cache of describe/suggest results keyed by a page source hash,
+        # so revisiting a screen does not repeat the AI round-trip
+        self._screen_cache: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        
+        # Initialize the model
+        try:
+            self.model.initialize()
+        except Exception as e:
+            logger.error(f"Failed to initialize AI model: {str(e)}")
+            if isinstance(e, AIProviderError):
+                raise e
+            raise AIProviderError(f"AI model initialization failed: {str(e)}")
         
     def interpret_command(self, command: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -709,90 +1687,220 @@ class MCPAIIntegration:
         if not command:
             return {"status": "error", "message": "Command cannot be empty"}
             
-        # Default context if none provided
-        if context is None:
-            context = {}
-            
         try:
-            # Prepare the prompt
-            system_prompt = """
-            You are an expert in mobile app testing with Appium.
-            Your job is to interpret natural language commands and convert them into structured Appium commands.
+            system_prompt, user_prompt = self._build_interpret_prompts(command, context)
             
-            Return a JSON object with the following structure:
-            {
-              "action": "<appium_action>",
-              "parameters": {
-                "<param_name>": "<param_value>",
-                ...
-              }
-            }
+            # Reuse the answer to an identical or similar command if it is cached
+            result_text, cache_entry = self._interpret_cache_get(command, context, system_prompt, user_prompt)
+            if result_text is None:
+                # Get the completion from the AI model
+                result_text = self.model.chat_completion(system_prompt, user_prompt, json_response=True)
+                self._interpret_cache_put(cache_entry, result_text)
             
-            Available actions and their parameters:
-            1. find_element: {"by": "<locator_strategy>", "value": "<locator_value>"}
-            2. find_elements: {"by": "<locator_strategy>", "value": "<locator_value>"}
-            3. click_element: {"element_id": "<element_id>"}
-            4. send_keys: {"element_id": "<element_id>", "text": "<text_to_send>"}
-            5. get_text: {"element_id": "<element_id>"}
-            6. back: {}
-            7. screenshot: {}
-            8. get_contexts: {}
-            9. switch_to_context: {"context_name": "<context_name>"}
-            10. execute_script: {"script": "<javascript_code>", "args": [<arg1>, <arg2>, ...]}
-            
-            Locator strategies include: "id", "accessibility id", "class name", "xpath", "css selector" (for web contexts), 
-            "ios predicate string" (for iOS), "android uiautomator" (for Android).
-            
-            Before responding, analyze the current app state from the provided context (if available).
-            """
-            
-            # Add context information to the user prompt
-            context_info = ""
-            if context.get("page_source"):
-                context_info += "\nCurrent page source:\n"
-                context_info += context["page_source"]
-            
-            if context.get("current_context"):
-                context_info += f"\nCurrent context: {context['current_context']}\n"
-            
-            if context.get("has_screenshot"):
-                context_info += "\nA screenshot is available for reference.\n"
-            
-            if context.get("platform_name"):
-                context_info += f"\nPlatform: {context['platform_name']}\n"
+            return self._parse_interpret_response(result_text)
                 
-            if context.get("device_info"):
-                context_info += f"\nDevice info: {context['device_info']}\n"
+        except Exception as e:
+            logger.error(f"Error interpreting command: {str(e)}")
+            return {"status": "error", "message": f"Error interpreting command: {str(e)}"}
+    
+    async def ainterpret_command(self, command: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Interpret a natural language command without blocking the event loop.
+        
+        Several commands can be interpreted concurrently with asyncio.gather.
+        
+        Args:
+            command: Natural language command
+            context: Optional context information
             
-            user_prompt = f"App state context:{context_info}\n\nCommand to interpret: {command}"
+        Returns:
+            Dict: Structured command with action and parameters
+        """
+        if not command:
+            return {"status": "error", "message": "Command cannot be empty"}
             
-            # Get the completion from the AI model
-            result_text = self.model.chat_completion(system_prompt, user_prompt, json_response=True)
+        try:
+            system_prompt, user_prompt = self._build_interpret_prompts(command, context)
             
-            # Parse the response
-            try:
-                result = json.loads(result_text)
-                
-                # Basic validation
-                if "action" not in result:
-                    return {"status": "error", "message": "Missing 'action' in response", "raw_response": result_text}
-                
-                if "parameters" not in result:
-                    result["parameters"] = {}
-                
-                return {
-                    "status": "success",
-                    "action": result["action"],
-                    "parameters": result["parameters"]
-                }
-                
-            except json.JSONDecodeError:
-                logger.error(f"Failed to parse JSON response: {result_text}")
-                return {"status": "error", "message": "Could not parse JSON response", "raw_response": result_text}
+            # Reuse the answer to an identical or similar command if it is cached
+            result_text, cache_entry = self._interpret_cache_get(command, context, system_prompt, user_prompt)
+            if result_text is None:
+                # Get the completion from the AI model
+                result_text = await self.model.chat_completion_async(system_prompt, user_prompt, json_response=True)
+                self._interpret_cache_put(cache_entry, result_text)
+            
+            return self._parse_interpret_response(result_text)
                 
         except Exception as e:
             logger.error(f"Error interpreting command: {str(e)}")
             return {"status": "error", "message": f"Error interpreting command: {str(e)}"}
+    
+    async def interpret_commands(
+        self,
+        commands: List[str],
+        context: Optional[Dict[str, Any]] = None,
+        max_concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Interpret several natural language commands concurrently.
+        
+        Args:
+            commands: Natural language commands
+            context: Optional context information shared by all commands
+            max_concurrency: Maximum number of AI requests in flight, to stay within rate limits
+            
+        Returns:
+            List[Dict]: Structured commands in the order of the input commands
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def _one(command: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.ainterpret_command(command, context)
+        
+        return await asyncio.gather(*(_one(command) for command in commands))
+    
+    def _interpret_cache_get(
+        self,
+        command: str,
+        context: Optional[Dict[str, Any]],
+        system_prompt: str,
+        user_prompt: str
+    ) -> Tuple[Optional[str], Dict[str, Any]]:
+        """
+        Look up the answer to an interpret-command request in the response caches.
+        
+        The exact-match cache is checked first, then the semantic cache for a
+        similar command on the same context. Nothing is cached unless the
+        request is deterministic (temperature 0).
+        
+        Args:
+            command: Natural language command
+            context: Optional context information
+            system_prompt: System instructions
+            user_prompt: User's message
+            
+        Returns:
+            Tuple[Optional[str], Dict[str, Any]]: The cached response (or None on
+            a miss) and the cache entry to pass to _interpret_cache_put
+        """
+        entry: Dict[str, Any] = {}
+        if self.config.temperature != 0:
+            return None, entry
+        
+        if self.cache is not None:
+            entry["key"] = LLMCache.make_key(
+                self.provider, self.model.model, self.config.temperature,
+                system_prompt, user_prompt, True
+            )
+            result_text = self.cache.get(entry["key"])
+            if result_text is not None:
+                return result_text, entry
+        
+        if self.semantic_cache is not None:
+            # Only commands on the same context are comparable, so the context
+            # selects the bucket and the command alone is embedded
+            entry["bucket"] = SemanticCache.make_bucket(
+                self.provider, self.model.model, self.config.temperature,
+                system_prompt, json.dumps(context or {}, sort_keys=True, default=str)
+            )
+            entry["vector"] = self.semantic_cache.embed_text(command)
+            result_text = self.semantic_cache.get(entry["bucket"], entry["vector"])
+            if result_text is not None:
+                logger.debug(f"Semantic cache hit for command: {command}")
+                return result_text, entry
+        
+        return None, entry
+    
+    def _interpret_cache_put(self, entry: Dict[str, Any], result_text: str) -> None:
+        """
+        Store the answer to an interpret-command request in the response caches.
+        
+        Args:
+            entry: Cache entry from _interpret_cache_get
+            result_text: Raw response text from the AI model
+        """
+        if "key" in entry:
+            self.cache.put(entry["key"], result_text)
+        if "bucket" in entry:
+            self.semantic_cache.put(entry["bucket"], entry["vector"], result_text)
+    
+    def _build_interpret_prompts(self, command: str, context: Optional[Dict[str, Any]] = None) -> Tuple[str, str]:
+        """
+        Build the system and user prompts for interpreting a command.
+        
+        Args:
+            command: Natural language command
+            context: Optional context information
+            
+        Returns:
+            Tuple[str, str]: The system prompt and the user prompt
+        """
+        # Default context if none provided
+        if context is None:
+            context = {}
+            
+        # Add context information to the user prompt
+        parts = ["App state context:"]
+        if context.get("page_source"):
+            parts.append("\nCurrent page source:\n")
+            parts.append(context["page_source"])
+        
+        if context.get("current_context"):
+            parts.append(f"\nCurrent context: {context['current_context']}\n")
+        
+        if context.get("has_screenshot"):
+            parts.append("\nA screenshot is available for reference.\n")
+        
+        if context.get("platform_name"):
+            parts.append(f"\nPlatform: {context['platform_name']}\n")
+        
+        if context.get("device_info"):
+            parts.append(f"\nDevice info: {context['device_info']}\n")
+        
+        parts.append(f"\n\nCommand to interpret: {command}")
+        
+        return _INTERPRET_SYSTEM_PROMPT, "".join(parts)
+    
+    def _parse_interpret_response(self, result_text: str) -> Dict[str, Any]:
+        """
+        Parse the AI response to an interpret-command request.
+        
+        Args:
+            result_text: Raw response text from the AI model
+            
+        Returns:
+            Dict: Structured command with action and parameters
+        """
+        # Parse the response
+        try:
+            result = _json_loads(result_text)
+        except json.JSONDecodeError:
+            logger.error(f"Failed to parse JSON response: {result_text}")
+            return {"status": "error", "message": "Could not parse JSON response", "raw_response": result_text}
+        
+        return self._interpretation_from_result(result, result_text)
+    
+    def _interpretation_from_result(self, result: Any, raw_response: str) -> Dict[str, Any]:
+        """
+        Validate a decoded interpretation and convert it to a command result.
+        
+        Args:
+            result: Decoded interpretation, expected to hold "action" and "parameters"
+            raw_response: Raw response text, included in error results
+            
+        Returns:
+            Dict: Structured command with action and parameters
+        """
+        # Basic validation
+        if not isinstance(result, dict) or "action" not in result:
+            return {"status": "error", "message": "Missing 'action' in response", "raw_response": raw_response}
+        
+        return {
+            "status": "success",
+            "action": result["action"],
+            "parameters": result.get("parameters") or {}
+        }
         
     def describe_screen(self, page_source: str) -> str:
         """
@@ -806,30 +1914,127 @@ class MCPAIIntegration:
         """
         if not page_source:
             return "No page source provided"
+        
+        key = self._screen_cache_key("describe", page_source)
+        cached = self._screen_cache_get(key)
+        if cached is not None:
+            return cached
             
         try:
-            system_prompt = """
-            You are an expert in mobile app testing and user interfaces.
-            Your job is to analyze the XML/HTML representation of a mobile app screen and provide a detailed description.
+            system_prompt, user_prompt = self._build_describe_prompts(page_source)
             
-            Focus on:
-            1. The overall purpose of this screen (e.g., login, settings, profile)
-            2. Key UI elements present (text fields, buttons, labels)
-            3. The layout and structure of the screen
-            4. Any notable accessibility features or issues
+            # Get the completion from the AI model
+            result = self.model.chat_completion(system_prompt, user_prompt)
+            self._screen_cache_put(key, result)
+            return result
             
-            Provide a comprehensive but concise description that would help someone understand what is displayed without seeing it.
-            """
+        except Exception as e:
+            logger.error(f"Error describing screen: {str(e)}")
+            return f"Error describing screen: {str(e)}"
+    
+    async def adescribe_screen(self, page_source: str) -> str:
+        """
+        Generate a description of the current screen without blocking the event loop.
+        
+        Args:
+            page_source: XML/HTML representation of the screen
+            
+        Returns:
+            str: Description of the screen
+        """
+        if not page_source:
+            return "No page source provided"
+        
+        key = self._screen_cache_key("describe", page_source)
+        cached = self._screen_cache_get(key)
+        if cached is not None:
+            return cached
             
-            user_prompt = f"Please describe this mobile app screen based on its source:\n\n{page_source}"
+        try:
+            system_prompt, user_prompt = self._build_describe_prompts(page_source)
             
             # Get the completion from the AI model
-            result = self.model.chat_completion(system_prompt, user_prompt)
+            result = await self.model.chat_completion_async(system_prompt, user_prompt)
+            self._screen_cache_put(key, result)
             return result
             
         except Exception as e:
             logger.error(f"Error describing screen: {str(e)}")
             return f"Error describing screen: {str(e)}"
+    
+    def _screen_cache_key(self, kind: str, page_source: str) -> Tuple[str, str]:
+        """
+        Build the screen cache key for a request on a page source.
+        
+        Args:
+            kind: Request kind ("describe" or "suggest")
+            page_source: XML/HTML representation of the screen
+            
+        Returns:
+            Tuple[str, str]: The request kind and a digest of the page source
+        """
+        digest = hashlib.blake2b(page_source.encode("utf-8"), digest_size=16).hexdigest()
+        return kind, digest
+    
+    def _screen_cache_get(self, key: Tuple[str, str]) -> Any:
+        """
+        Look up a cached screen result, marking it as recently used.
+        
+        Args:
+            key: Key from _screen_cache_key
+            
+        Returns:
+            Any: The cached result, or None on a miss
+        """
+        result = self._screen_cache.get(key)
+        if result is not None:
+            self._screen_cache.move_to_end(key)
+            logger.debug(f"Screen cache hit for {key[0]} ({key[1]})")
+        return result
+    
+    def _screen_cache_put(self, key: Tuple[str, str], result: Any) -> None:
+        """
+        Store a screen result, evicting the least recently used entry when full.
+        
+        Args:
+            key: Key from _screen_cache_key
+            result: Result to cache
+        """
+        self._screen_cache[key] = result
+        self._screen_cache.move_to_end(key)
+        if len(self._screen_cache) > self.SCREEN_CACHE_SIZE:
+            self._screen_cache.popitem(last=False)
+    
+    def clear_screen_cache(self) -> None:
+        """Discard all cached screen descriptions and test suggestions."""
+        self._screen_cache.clear()
+    
+    def _build_describe_prompts(self, page_source: str) -> Tuple[str, str]:
+        """
+        Build the system and user prompts for describing a screen.
+        
+        Args:
+            page_source: XML/HTML representation of the screen
+            
+        Returns:
+            Tuple[str, str]: The system prompt and the user prompt
+        """
+        system_prompt = """
+        You are an expert in mobile app testing and user interfaces.
+        Your job is to analyze the XML/HTML representation of a mobile app screen and provide a detailed description.
+        
+        Focus on:
+        1. The overall purpose of this screen (e.g., login, settings, profile)
+        2. Key UI elements present (text fields, buttons, labels)
+        3. The layout and structure of the screen
+        4. Any notable accessibility features or issues
+        
+        Provide a comprehensive but concise description that would help someone understand what is displayed without seeing it.
+        """
+        
+        user_prompt = f"Please describe this mobile app screen based on its source:\n\n{page_source}"
+        
+        return system_prompt, user_prompt
         
     def suggest_test_actions(self, page_source: str) -> List[str]:
         """
@@ -843,51 +2048,271 @@ class MCPAIIntegration:
         """
         if not page_source:
             return ["No page source provided for generating suggestions"]
+        
+        key = self._screen_cache_key("suggest", page_source)
+        cached = self._screen_cache_get(key)
+        if cached is not None:
+            return list(cached)
             
         try:
-            system_prompt = """
-            You are an expert in mobile app testing with Appium.
-            Your job is to analyze the XML/HTML representation of a mobile app screen and suggest test actions.
-            
-            Provide a list of 5-10 natural language test commands that would be useful for testing this screen.
-            Format your response as a JSON array of strings.
-            
-            Examples of test commands:
-            - "Click the login button"
-            - "Enter 'test@example.com' in the email field"
-            - "Verify the error message is displayed"
-            - "Check if the username label shows the correct value"
-            - "Swipe down to refresh the feed"
-            
-            Focus on:
-            1. Testing important functionality visible on this screen
-            2. Validating user flows
-            3. Checking error states and edge cases
-            4. Verifying correct display of dynamic content
-            """
-            
-            user_prompt = f"Please suggest test actions for this mobile app screen:\n\n{page_source}"
+            system_prompt, user_prompt = self._build_suggest_prompts(page_source)
             
             # Get the completion from the AI model
             result_text = self.model.chat_completion(system_prompt, user_prompt, json_response=True)
             
-            # Parse the response
-            try:
-                result = json.loads(result_text)
-                if isinstance(result, list):
-                    return result
-                elif isinstance(result, dict) and "suggestions" in result:
-                    return result["suggestions"]
-                else:
-                    return [str(result)]
+            suggestions = self._parse_suggestions(result_text)
+            self._screen_cache_put(key, list(suggestions))
+            return suggestions
                 
-            except json.JSONDecodeError:
-                # If JSON parsing fails, try to extract a list from the text
-                return [line.strip() for line in result_text.split("\n") if line.strip()]
+        except Exception as e:
+            logger.error(f"Error suggesting test actions: {str(e)}")
+            return [f"Error suggesting test actions: {str(e)}"]
+    
+    async def asuggest_test_actions(self, page_source: str) -> List[str]:
+        """
+        Generate suggested test actions without blocking the event loop.
+        
+        Args:
+            page_source: XML/HTML representation of the screen
+            
+        Returns:
+            List[str]: List of suggested test actions
+        """
+        if not page_source:
+            return ["No page source provided for generating suggestions"]
+        
+        key = self._screen_cache_key("suggest", page_source)
+        cached = self._screen_cache_get(key)
+        if cached is not None:
+            return list(cached)
+            
+        try:
+            system_prompt, user_prompt = self._build_suggest_prompts(page_source)
+            
+            # Get the completion from the AI model
+            result_text = await self.model.chat_completion_async(system_prompt, user_prompt, json_response=True)
+            
+            suggestions = self._parse_suggestions(result_text)
+            self._screen_cache_put(key, list(suggestions))
+            return suggestions
                 
         except Exception as e:
             logger.error(f"Error suggesting test actions: {str(e)}")
             return [f"Error suggesting test actions: {str(e)}"]
+    
+    def _build_suggest_prompts(self, page_source: str) -> Tuple[str, str]:
+        """
+        Build the system and user prompts for suggesting test actions.
+        
+        Args:
+            page_source: XML/HTML representation of the screen
+            
+        Returns:
+            Tuple[str, str]: The system prompt and the user prompt
+        """
+        system_prompt = """
+        You are an expert in mobile app testing with Appium.
+        Your job is to analyze the XML/HTML representation of a mobile app screen and suggest test actions.
+        
+        Provide a list of 5-10 natural language test commands that would be useful for testing this screen.
+        Format your response as a JSON array of strings.
+        
+        Examples of test commands:
+        - "Click the login button"
+        - "Enter 'test@example.com' in the email field"
+        - "Verify the error message is displayed"
+        - "Check if the username label shows the correct value"
+        - "Swipe down to refresh the feed"
+        
+        Focus on:
+        1. Testing important functionality visible on this screen
+        2. Validating user flows
+        3. Checking error states and edge cases
+        4. Verifying correct display of dynamic content
+        """
+        
+        user_prompt = f"Please suggest test actions for this mobile app screen:\n\n{page_source}"
+        
+        return system_prompt, user_prompt
+    
+    def _parse_suggestions(self, result_text: str) -> List[str]:
+        """
+        Parse the AI response to a suggest-test-actions request.
+        
+        Args:
+            result_text: Raw response text from the AI model
+            
+        Returns:
+            List[str]: List of suggested test actions
+        """
+        try:
+            result = _json_loads(result_text)
+            if isinstance(result, list):
+                return result
+            elif isinstance(result, dict) and "suggestions" in result:
+                return result["suggestions"]
+            else:
+                return [str(result)]
+            
+        except json.JSONDecodeError:
+            # If JSON parsing fails, try to extract a list from the text
+            return [line.strip() for line in result_text.split("\n") if line.strip()]
+            
+    def describe_suggest_and_interpret(self, page_source: str, commands: List[str]) -> Dict[str, Any]:
+        """
+        Describe a screen, suggest test actions and interpret commands in one request.
+        
+        The page source is sent to the model once instead of once per task,
+        so its prompt is processed a single time.
+        
+        Args:
+            page_source: XML/HTML representation of the screen
+            commands: Natural language commands to interpret against the screen
+            
+        Returns:
+            Dict: "description" (str), "suggestions" (List[str]) and
+            "interpretations" (Dict mapping each command to its structured command)
+        """
+        if not page_source:
+            return self._fused_error(commands, "No page source provided")
+        
+        try:
+            system_prompt, user_prompt = self._build_fused_prompts(page_source, commands)
+            
+            # Get the completion from the AI model
+            result_text = self.model.chat_completion(system_prompt, user_prompt, json_response=True)
+            
+            return self._parse_fused_response(result_text, commands)
+            
+        except Exception as e:
+            logger.error(f"Error analyzing screen: {str(e)}")
+            return self._fused_error(commands, f"Error analyzing screen: {str(e)}")
+    
+    async def adescribe_suggest_and_interpret(self, page_source: str, commands: List[str]) -> Dict[str, Any]:
+        """
+        Describe a screen, suggest test actions and interpret commands in one
+        request without blocking the event loop.
+        
+        Args:
+            page_source: XML/HTML representation of the screen
+            commands: Natural language commands to interpret against the screen
+            
+        Returns:
+            Dict: "description" (str), "suggestions" (List[str]) and
+            "interpretations" (Dict mapping each command to its structured command)
+        """
+        if not page_source:
+            return self._fused_error(commands, "No page source provided")
+        
+        try:
+            system_prompt, user_prompt = self._build_fused_prompts(page_source, commands)
+            
+            # Get the completion from the AI model
+            result_text = await self.model.chat_completion_async(system_prompt, user_prompt, json_response=True)
+            
+            return self._parse_fused_response(result_text, commands)
+            
+        except Exception as e:
+            logger.error(f"Error analyzing screen: {str(e)}")
+            return self._fused_error(commands, f"Error analyzing screen: {str(e)}")
+    
+    def _build_fused_prompts(self, page_source: str, commands: List[str]) -> Tuple[str, str]:
+        """
+        Build the system and user prompts for a combined describe/suggest/interpret request.
+        
+        Args:
+            page_source: XML/HTML representation of the screen
+            commands: Natural language commands to interpret
+            
+        Returns:
+            Tuple[str, str]: The system prompt and the user prompt
+        """
+        system_prompt = """
+        You are an expert in mobile app testing with Appium.
+        Your job is to analyze the XML/HTML representation of a mobile app screen and complete three tasks at once.
+        
+        Return a single JSON object with the following structure:
+        {
+          "description": "<description of the screen>",
+          "suggestions": ["<test command>", ...],
+          "interpretations": [
+            {"action": "<appium_action>", "parameters": {"<param_name>": "<param_value>", ...}},
+            ...
+          ]
+        }
+        
+        "description": a comprehensive but concise description of the screen covering its purpose,
+        its key UI elements, its layout and any notable accessibility features or issues.
+        
+        "suggestions": 5-10 natural language test commands that would be useful for testing this screen,
+        e.g. "Click the login button" or "Verify the error message is displayed".
+        
+        "interpretations": one structured Appium command for each numbered command in the request,
+        in the same order.
+        """ + _APPIUM_ACTIONS_PROMPT
+        
+        numbered = "\n".join(f"{i}. {command}" for i, command in enumerate(commands, 1))
+        user_prompt = f"Screen source:\n\n{page_source}\n\nCommands to interpret:\n{numbered}"
+        
+        return system_prompt, user_prompt
+    
+    def _parse_fused_response(self, result_text: str, commands: List[str]) -> Dict[str, Any]:
+        """
+        Parse the AI response to a combined describe/suggest/interpret request.
+        
+        Args:
+            result_text: Raw response text from the AI model
+            commands: The commands that were interpreted, in request order
+            
+        Returns:
+            Dict: "description", "suggestions" and "interpretations"
+        """
+        try:
+            result = _json_loads(result_text)
+        except json.JSONDecodeError:
+            logger.error(f"Failed to parse JSON response: {result_text}")
+            return self._fused_error(commands, "Could not parse JSON response")
+        
+        if not isinstance(result, dict):
+            return self._fused_error(commands, "Unexpected response format")
+        
+        suggestions = result.get("suggestions", [])
+        if not isinstance(suggestions, list):
+            suggestions = [str(suggestions)]
+        
+        items = result.get("interpretations", [])
+        if not isinstance(items, list):
+            items = []
+        
+        interpretations = {}
+        for i, command in enumerate(commands):
+            if i < len(items):
+                interpretations[command] = self._interpretation_from_result(items[i], result_text)
+            else:
+                interpretations[command] = {"status": "error", "message": "No interpretation returned", "raw_response": result_text}
+        
+        return {
+            "description": str(result.get("description", "")),
+            "suggestions": suggestions,
+            "interpretations": interpretations
+        }
+    
+    def _fused_error(self, commands: List[str], message: str) -> Dict[str, Any]:
+        """
+        Build a combined describe/suggest/interpret result reporting an error.
+        
+        Args:
+            commands: The commands that were to be interpreted
+            message: Error message
+            
+        Returns:
+            Dict: "description", "suggestions" and "interpretations" carrying the error
+        """
+        return {
+            "description": message,
+            "suggestions": [message],
+            "interpretations": {command: {"status": "error", "message": message} for command in commands}
+        }
             
     def analyze_app_structure(self, page_sources: List[str]) -> Dict[str, Any]:
         """
@@ -939,7 +2364,7 @@ class MCPAIIntegration:
             
             # Parse the response
             try:
-                result = json.loads(result_text)
+                result = _json_loads(result_text)
                 return result
             except json.JSONDecodeError:
                 logger.error(f"Failed to parse JSON response: {result_text}")
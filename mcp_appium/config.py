@@ -24,7 +24,10 @@ def configure_logging(level: str = DEFAULT_LOG_LEVEL) -> None:
     Args:
         level: The log level (default: INFO)
     """
-    numeric_level = getattr(logging, level.upper(), logging.INFO)
+    # getLevelName maps a registered name to its number and returns a string otherwise
+    numeric_level = logging.getLevelName(level.upper())
+    if not isinstance(numeric_level, int):
+        numeric_level = logging.INFO
     logging.basicConfig(
         level=numeric_level,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
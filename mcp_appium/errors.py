@@ -50,6 +50,14 @@ class AIQuotaExceededError(AIProviderError):
     pass
 
 
+class AIServiceUnavailableError(AIProviderError):
+    """Exception raised when the AI provider is temporarily unavailable."""
+    
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
 class AIResponseParsingError(AIProviderError):
     """Exception raised when unable to parse the AI provider response."""
     pass
@@ -7,6 +7,7 @@ It provides functionality to interpret natural language commands
 and convert them into Appium actions.
 """
 
+import hashlib
 import json
 import logging
 import os
@@ -15,8 +16,9 @@ from typing import Any, Dict, List, Optional
 from openai import OpenAI
 
 from mcp_appium.client import AppiumClient
-from mcp_appium.errors import AppiumMCPError, InvalidArgumentError
+from mcp_appium.errors import AppiumMCPError, InvalidArgumentError, TimeoutError
 from mcp_appium.models import Session
+from mcp_appium.utils import wait_for
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -447,6 +449,42 @@ Limit your suggestions to 5-7 specific actions.
             logger.error(f"Error generating test suggestions: {str(e)}")
             raise AppiumMCPError(f"Could not generate test suggestions: {str(e)}")
     
+    def wait_for_idle(self, timeout: float = 1.0, poll_frequency: float = 0.05) -> bool:
+        """
+        Wait until the screen stops changing after an action.
+        
+        Polls the page source and returns as soon as two consecutive polls
+        match, rather than sleeping for a fixed time.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            poll_frequency: How often to poll the page source in seconds
+            
+        Returns:
+            bool: True if the screen settled, False if it was still changing at the
+            timeout or the page source could not be read
+        """
+        if not self.session:
+            return False
+        
+        last_digest = None
+        
+        def _settled() -> bool:
+            nonlocal last_digest
+            digest = hashlib.blake2b(self.session.get_page_source().encode("utf-8"), digest_size=16).digest()
+            settled = digest == last_digest
+            last_digest = digest
+            return settled
+        
+        try:
+            return wait_for(_settled, timeout=timeout, poll_frequency=poll_frequency)
+        except TimeoutError:
+            logger.debug(f"Screen still changing after {timeout}s")
+            return False
+        except AppiumMCPError as e:
+            logger.warning(f"Could not poll the page source while waiting for the screen to settle: {str(e)}")
+            return False
+    
     def quit(self):
         """
         Quit the session and clean up resources.
@@ -6,9 +6,14 @@ This module provides utility functions and classes for the MCP Appium implementa
 """
 
 import base64
+import io
+import json
 import logging
 import os
+import re
 import time
+import xml.etree.ElementTree as ET
+from xml.parsers import expat
 from typing import Callable, Any, Optional, List, Dict, Union, Tuple
 
 from .errors import TimeoutError
@@ -145,3 +150,136 @@ def parse_desired_capabilities(capabilities_str: str) -> Dict[str, Any]:
                 capabilities[key] = value
     
     return capabilities
+
+# Integers in an Appium bounds attribute such as "[43,66][402,156]"
+_BOUNDS_PATTERN = re.compile(r"-?\d+")
+
+# Page source attributes kept in the compact UI tree, with their short keys
+_COMPACT_ATTRIBUTES = (
+    ("text", "x"),
+    ("content-desc", "d"),
+    ("hint", "h"),
+    ("resource-id", "id"),
+    ("checked", "c")
+)
+
+# Start/end tags of Android layout containers, which carry no meaning for an
+# AI model beyond nesting. Matched in a single linear scan of the page source.
+_STRIP_RE = re.compile(
+    r"</?android\.(?:widget\.FrameLayout|widget\.LinearLayout|view\.ViewGroup)"
+    r"(?=[\s/>])[^>]*>"
+)
+
+def strip_layout(page_source: str) -> str:
+    """
+    Remove Android layout container tags from page source XML.
+    
+    Only the ``FrameLayout``/``LinearLayout``/``ViewGroup`` tags are removed;
+    their children are kept in place. The result is meant for AI prompts and
+    is not necessarily well-formed XML.
+    
+    Args:
+        page_source: Page source XML
+        
+    Returns:
+        str: Page source without layout container tags
+    """
+    return _STRIP_RE.sub("", page_source)
+
+def _iter_page_source(page_source: str):
+    """
+    Stream the elements of an Appium page source with ``iterparse``.
+    
+    Each element is yielded once its subtree has been parsed and is cleared
+    afterwards, so memory stays flat regardless of the page size.
+    
+    Args:
+        page_source: Page source XML
+        
+    Yields:
+        Element: Parsed elements in document (end-tag) order
+    """
+    source = io.BytesIO(page_source.strip().encode("utf-8"))
+    
+    for _, elem in ET.iterparse(source, events=("end",)):
+        yield elem
+        
+        # Children have already been visited, so free them
+        elem.clear()
+
+def _short_class_name(tag: str, attributes: Dict[str, str]) -> str:
+    """Return the unqualified widget class of an element, e.g. ``TextView``."""
+    return (attributes.get("class") or tag).rsplit(".", 1)[-1]
+
+def _parse_bounds(bounds: str) -> List[int]:
+    """Return the integers of a bounds attribute such as ``[43,66][402,156]``."""
+    return [int(n) for n in _BOUNDS_PATTERN.findall(bounds)]
+
+def xml_to_compact_json(page_source: str) -> str:
+    """
+    Convert Appium page source XML to a compact JSON UI tree.
+    
+    Layout containers are dropped and each leaf element becomes one entry,
+    e.g. ``{"t":"TextView","x":"Products","b":[43,66,402,156]}``, which
+    keeps the information an AI model needs in far fewer prompt tokens.
+    The XML is parsed incrementally with ``iterparse``.
+    
+    Args:
+        page_source: Page source XML
+        
+    Returns:
+        str: JSON array of leaf elements
+    """
+    nodes = []
+    
+    for elem in _iter_page_source(page_source):
+        if len(elem) == 0 and elem.tag != "hierarchy":
+            node = {"t": _short_class_name(elem.tag, elem.attrib)}
+            
+            for attribute, key in _COMPACT_ATTRIBUTES:
+                value = elem.get(attribute)
+                if value:
+                    node[key] = value
+            
+            bounds = elem.get("bounds")
+            if bounds:
+                node["b"] = _parse_bounds(bounds)
+            
+            nodes.append(node)
+    
+    return json.dumps(nodes, separators=(",", ":"))
+
+def summarize_page_source(page_source: str) -> str:
+    """
+    Summarize Appium page source XML as one line per labelled element.
+    
+    Only elements with a ``text`` or ``content-desc`` (or, for empty input
+    fields, a ``hint``) are kept, each as a line like
+    ``TextView 'Products' [43,66,402,156]``. Only start tags are needed, so
+    the XML is scanned with expat callbacks without building any elements.
+    
+    Args:
+        page_source: Page source XML
+        
+    Returns:
+        str: Newline-separated element summaries
+    """
+    lines = []
+    
+    def start_element(tag: str, attributes: Dict[str, str]):
+        label = attributes.get("text") or attributes.get("content-desc") or attributes.get("hint")
+        if not label:
+            return
+        
+        line = f"{_short_class_name(tag, attributes)} {label!r}"
+        bounds = attributes.get("bounds")
+        if bounds:
+            line += " [" + ",".join(map(str, _parse_bounds(bounds))) + "]"
+        
+        lines.append(line)
+    
+    parser = expat.ParserCreate()
+    parser.StartElementHandler = start_element
+    parser.Parse(page_source.strip().encode("utf-8"), True)
+    
+    return "\n".join(lines)
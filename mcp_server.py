@@ -19,6 +19,7 @@ import os
 import logging
 import json
 import base64
+from types import SimpleNamespace
 from typing import Any, Dict, List, Optional
 
 from mcp.server.fastmcp import FastMCP
@@ -29,6 +30,7 @@ from mcp_appium.ai_integration import (
     MCPAIIntegration, AIProvider, AIModelConfig, AIProviderError
 )
 from mcp_appium.browser import server_integration as browser_server
+from mcp_appium.utils import strip_layout
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -51,14 +53,41 @@ app = FastMCP(
     """
 )
 
+# Server settings, read from the environment once and overridable via configure()
+settings = SimpleNamespace(
+    appium_url=os.environ.get("APPIUM_URL", "http://localhost:4723"),
+    log_level=os.environ.get("MCP_LOG_LEVEL", "INFO")
+)
+
+def _apply_log_level() -> None:
+    """Set this module's logger to settings.log_level, falling back to INFO for unknown names."""
+    level = logging.getLevelName(settings.log_level.upper())
+    logger.setLevel(level if isinstance(level, int) else logging.INFO)
+
+_apply_log_level()
+
 # Initialize Appium client and browser
 client = None
 ai_integration = None
 
+def configure(appium_url: Optional[str] = None, log_level: Optional[str] = None) -> None:
+    """
+    Override the server settings before the services are initialized.
+    
+    Args:
+        appium_url: URL of the Appium server
+        log_level: Log level name for this module's logger, e.g. "DEBUG"
+    """
+    if appium_url is not None:
+        settings.appium_url = appium_url
+    if log_level is not None:
+        settings.log_level = log_level
+        _apply_log_level()
+
 def initialize_appium():
     """Initialize the Appium client."""
     global client
-    appium_url = os.environ.get("APPIUM_URL", "http://localhost:4723")
+    appium_url = settings.appium_url
     
     try:
         client = AppiumClient(base_url=appium_url)
@@ -327,7 +356,7 @@ def describe_screen() -> Dict[str, Any]:
             return {"status": "error", "message": "Failed to initialize AI integration"}
     
     try:
-        source = client.session.get_page_source()
+        source = strip_layout(client.session.get_page_source())
         description = ai_integration.describe_screen(source)
         return {
             "status": "success",
@@ -353,7 +382,7 @@ def suggest_test_actions() -> Dict[str, Any]:
             return {"status": "error", "message": "Failed to initialize AI integration"}
     
     try:
-        source = client.session.get_page_source()
+        source = strip_layout(client.session.get_page_source())
         suggestions = ai_integration.suggest_test_actions(source)
         return {
             "status": "success",
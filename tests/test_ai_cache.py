@@ -0,0 +1,327 @@
+"""
+Tests for the AI response caches
+================================
+
+This module contains tests for the LLMCache, DiskLLMCache and SemanticCache
+classes and the caches of MCPAIIntegration.
+"""
+
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from mcp_appium import ai_integration
+from mcp_appium.ai_integration import AIProvider, DiskLLMCache, LLMCache, MCPAIIntegration, SemanticCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the wall clock used by the caches with a controllable one."""
+    now = [1_000_000.0]
+    monkeypatch.setattr(ai_integration.time, "time", lambda: now[0])
+    monkeypatch.setattr(ai_integration.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    """Create a disk cache in a temporary directory."""
+    cache = DiskLLMCache(path=str(tmp_path / "cache" / "llm.sqlite3"))
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def integration():
+    """Create an AI integration backed by a mock model."""
+    with patch.object(ai_integration.AIModelFactory, "create_model", return_value=MagicMock()):
+        return MCPAIIntegration(provider=AIProvider.OPENAI)
+
+
+def test_make_key():
+    """Test that cache keys depend on every part of the request."""
+    args = (AIProvider.OPENAI, "gpt-4", 0.0, "system", "user", True)
+    key = LLMCache.make_key(*args)
+
+    assert key == LLMCache.make_key(*args)
+    assert len(key) == 32
+    assert key != LLMCache.make_key(AIProvider.GEMINI, "gpt-4", 0.0, "system", "user", True)
+    assert key != LLMCache.make_key(AIProvider.OPENAI, "gpt-4", 0.0, "system", "other", True)
+    assert key != LLMCache.make_key(AIProvider.OPENAI, "gpt-4", 0.0, "system", "user", False)
+
+
+def test_memory_cache_expiry(clock):
+    """Test that in-memory entries expire after the TTL."""
+    cache = LLMCache(ttl=10)
+    cache.put("key", "response")
+
+    clock[0] += 10
+    assert cache.get("key") == "response"
+
+    clock[0] += 1
+    assert cache.get("key") is None
+
+
+def test_memory_cache_eviction():
+    """Test that the least recently used entry is evicted first."""
+    cache = LLMCache(max_size=2)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    assert cache.get("a") == "1"
+
+    cache.put("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+def test_disk_cache_round_trip(disk_cache):
+    """Test storing, replacing and clearing responses."""
+    assert disk_cache.get("key") is None
+
+    disk_cache.put("key", '{"action": "tap"}')
+    assert disk_cache.get("key") == '{"action": "tap"}'
+
+    disk_cache.put("key", '{"action": "swipe"}')
+    assert disk_cache.get("key") == '{"action": "swipe"}'
+
+    disk_cache.clear()
+    assert disk_cache.get("key") is None
+
+
+def test_disk_cache_persists_across_instances(tmp_path):
+    """Test that a new cache on the same file sees earlier responses."""
+    path = str(tmp_path / "llm.sqlite3")
+
+    first = DiskLLMCache(path=path)
+    first.put("key", "response")
+    first.close()
+
+    second = DiskLLMCache(path=path)
+    try:
+        assert second.get("key") == "response"
+    finally:
+        second.close()
+
+
+def test_disk_cache_expiry(tmp_path, clock):
+    """Test that responses expire after the TTL and are purged on write."""
+    cache = DiskLLMCache(path=str(tmp_path / "llm.sqlite3"), ttl=10)
+    try:
+        cache.put("old", "1")
+
+        clock[0] += 10
+        assert cache.get("old") == "1"
+
+        clock[0] += 1
+        assert cache.get("old") is None
+
+        cache.put("new", "2")
+        rows = cache._db.execute("SELECT key FROM responses").fetchall()
+        assert rows == [("new",)]
+    finally:
+        cache.close()
+
+
+def test_disk_cache_eviction(tmp_path, clock):
+    """Test that the oldest responses are evicted beyond max_size."""
+    cache = DiskLLMCache(path=str(tmp_path / "llm.sqlite3"), max_size=2)
+    try:
+        for key in ("a", "b", "c"):
+            cache.put(key, key.upper())
+            clock[0] += 1
+
+        assert cache.get("a") is None
+        assert cache.get("b") == "B"
+        assert cache.get("c") == "C"
+    finally:
+        cache.close()
+
+
+def test_disk_cache_concurrent_access(disk_cache):
+    """Test that threads sharing one cache can read and write concurrently."""
+    def worker(n):
+        key = f"key{n}"
+        disk_cache.put(key, f"response{n}")
+        return disk_cache.get(key)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(worker, range(200)))
+
+    assert results == [f"response{n}" for n in range(200)]
+    count = disk_cache._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+    assert count == 200
+
+
+def test_disk_cache_shared_between_connections(tmp_path):
+    """Test that two caches on one file see each other's writes."""
+    path = str(tmp_path / "llm.sqlite3")
+    writer = DiskLLMCache(path=path)
+    reader = DiskLLMCache(path=path)
+    try:
+        writer.put("key", "response")
+        assert reader.get("key") == "response"
+    finally:
+        writer.close()
+        reader.close()
+
+
+def test_screen_cache_key(integration):
+    """Test that screen cache keys depend on the request kind and page source."""
+    key = integration._screen_cache_key("describe", "<hierarchy/>")
+
+    assert key == integration._screen_cache_key("describe", "<hierarchy/>")
+    assert key[0] == "describe"
+    assert key != integration._screen_cache_key("suggest", "<hierarchy/>")
+    assert key != integration._screen_cache_key("describe", "<hierarchy></hierarchy>")
+
+
+def test_screen_cache_eviction(integration):
+    """Test that the least recently used screen is evicted first."""
+    integration.SCREEN_CACHE_SIZE = 2
+    keys = [integration._screen_cache_key("describe", f"<screen{n}/>") for n in range(3)]
+
+    integration._screen_cache_put(keys[0], "first")
+    integration._screen_cache_put(keys[1], "second")
+    assert integration._screen_cache_get(keys[0]) == "first"
+
+    integration._screen_cache_put(keys[2], "third")
+
+    assert integration._screen_cache_get(keys[1]) is None
+    assert integration._screen_cache_get(keys[0]) == "first"
+    assert integration._screen_cache_get(keys[2]) == "third"
+
+    integration.clear_screen_cache()
+    assert integration._screen_cache_get(keys[0]) is None
+
+
+def test_describe_screen_uses_cache(integration):
+    """Test that describing the same screen twice calls the model once."""
+    integration.model.chat_completion.return_value = "A login screen"
+
+    assert integration.describe_screen("<hierarchy/>") == "A login screen"
+    assert integration.describe_screen("<hierarchy/>") == "A login screen"
+    integration.model.chat_completion.assert_called_once()
+
+    integration.describe_screen("<other/>")
+    assert integration.model.chat_completion.call_count == 2
+
+
+# Embeddings of the test queries: the first two are paraphrases (cosine 0.98),
+# the third is unrelated (cosine 0 to the first)
+_EMBEDDINGS = {
+    "tap login": [1.0, 0.0, 0.0],
+    "press the login button": [0.98, 0.199, 0.0],
+    "open the cart": [0.0, 0.0, 2.0],
+}
+
+
+@pytest.fixture
+def semantic_cache():
+    """Create a semantic cache over the test embeddings."""
+    pytest.importorskip("numpy")
+    return SemanticCache(_EMBEDDINGS.__getitem__, threshold=0.95, max_size=2)
+
+
+def test_semantic_cache_hit_and_miss(semantic_cache):
+    """Test that only queries above the similarity threshold hit."""
+    bucket = SemanticCache.make_bucket(AIProvider.OPENAI, "gpt-4", 0.0, "system", "{}")
+    semantic_cache.put(bucket, semantic_cache.embed_text("tap login"), "login response")
+
+    assert semantic_cache.get(bucket, semantic_cache.embed_text("tap login")) == "login response"
+    assert semantic_cache.get(bucket, semantic_cache.embed_text("press the login button")) == "login response"
+    assert semantic_cache.get(bucket, semantic_cache.embed_text("open the cart")) is None
+
+
+def test_semantic_cache_threshold(semantic_cache):
+    """Test that a stricter threshold rejects the paraphrase."""
+    semantic_cache.threshold = 0.99
+    semantic_cache.put("bucket", semantic_cache.embed_text("tap login"), "login response")
+
+    assert semantic_cache.get("bucket", semantic_cache.embed_text("press the login button")) is None
+
+
+def test_semantic_cache_buckets(semantic_cache):
+    """Test that queries are only compared within their bucket."""
+    login_screen = SemanticCache.make_bucket(AIProvider.OPENAI, "gpt-4", 0.0, "system", '{"screen": "login"}')
+    cart_screen = SemanticCache.make_bucket(AIProvider.OPENAI, "gpt-4", 0.0, "system", '{"screen": "cart"}')
+    assert login_screen != cart_screen
+
+    semantic_cache.put(login_screen, semantic_cache.embed_text("tap login"), "login response")
+
+    assert semantic_cache.get(cart_screen, semantic_cache.embed_text("tap login")) is None
+
+
+def test_semantic_cache_eviction(semantic_cache):
+    """Test that the oldest entry of a full bucket is evicted first."""
+    for text in ("tap login", "open the cart"):
+        semantic_cache.put("bucket", semantic_cache.embed_text(text), text)
+    semantic_cache.put("bucket", semantic_cache.embed_text("press the login button"), "paraphrase")
+
+    assert semantic_cache.get("bucket", semantic_cache.embed_text("tap login")) == "paraphrase"
+    assert semantic_cache.get("bucket", semantic_cache.embed_text("open the cart")) == "open the cart"
+
+
+def test_embed_text_normalizes(semantic_cache):
+    """Test that embeddings are scaled to unit length."""
+    vector = semantic_cache.embed_text("open the cart")
+
+    assert vector.tolist() == [0.0, 0.0, 1.0]
+
+
+def _cached_integration(temperature, cache):
+    """Create an AI integration with a response cache and a mock model."""
+    model = MagicMock()
+    model.model = "gpt-4o"
+    model.chat_completion.return_value = '{"action": "back", "parameters": {}}'
+    with patch.object(ai_integration.AIModelFactory, "create_model", return_value=model):
+        return MCPAIIntegration(
+            provider=AIProvider.OPENAI,
+            config=ai_integration.AIModelConfig(temperature=temperature),
+            cache=cache
+        )
+
+
+def test_interpret_command_cached_at_temperature_zero():
+    """Test that a repeated command is answered from the cache at temperature 0."""
+    cache = LLMCache()
+    integration = _cached_integration(0, cache)
+
+    first = integration.interpret_command("go back")
+    second = integration.interpret_command("go back")
+
+    assert first == second == {"status": "success", "action": "back", "parameters": {}}
+    integration.model.chat_completion.assert_called_once()
+    assert len(cache._entries) == 1
+
+    integration.interpret_command("go back", {"platform_name": "iOS"})
+    assert integration.model.chat_completion.call_count == 2
+
+
+def test_interpret_command_not_cached_above_temperature_zero():
+    """Test that sampled responses are neither cached nor read from the cache."""
+    cache = LLMCache()
+    integration = _cached_integration(0.7, cache)
+
+    integration.interpret_command("go back")
+    integration.interpret_command("go back")
+
+    assert integration.model.chat_completion.call_count == 2
+    assert not cache._entries
+
+
+def test_interpret_command_shares_disk_cache(tmp_path):
+    """Test that a disk cache answers a command interpreted by an earlier integration."""
+    path = str(tmp_path / "llm.sqlite3")
+
+    first = _cached_integration(0, DiskLLMCache(path=path))
+    first.interpret_command("go back")
+    first.cache.close()
+
+    second = _cached_integration(0, DiskLLMCache(path=path))
+    try:
+        assert second.interpret_command("go back")["action"] == "back"
+        second.model.chat_completion.assert_not_called()
+    finally:
+        second.cache.close()
@@ -0,0 +1,106 @@
+"""
+Tests for the AI integration
+============================
+
+This module contains tests for the MCPAIIntegration class.
+"""
+
+import json
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from mcp_appium import ai_integration
+from mcp_appium.ai_integration import AIProvider, MCPAIIntegration
+
+
+COMMANDS = ["tap login", "go back"]
+
+
+@pytest.fixture
+def integration():
+    """Create an AI integration backed by a mock model."""
+    with patch.object(ai_integration.AIModelFactory, "create_model", return_value=MagicMock()):
+        return MCPAIIntegration(provider=AIProvider.OPENAI)
+
+
+def _analyze(integration, response):
+    """Run a combined describe/suggest/interpret request answered with the given text."""
+    integration.model.chat_completion.return_value = response
+    return integration.describe_suggest_and_interpret("<hierarchy/>", COMMANDS)
+
+
+def test_fused_response(integration):
+    """Test that a complete response is split into its three parts."""
+    result = _analyze(integration, json.dumps({
+        "description": "A login screen",
+        "suggestions": ["Tap login"],
+        "interpretations": [
+            {"action": "click_element", "parameters": {"element_id": "login"}},
+            {"action": "back"}
+        ]
+    }))
+
+    assert result["description"] == "A login screen"
+    assert result["suggestions"] == ["Tap login"]
+    assert result["interpretations"] == {
+        "tap login": {"status": "success", "action": "click_element", "parameters": {"element_id": "login"}},
+        "go back": {"status": "success", "action": "back", "parameters": {}}
+    }
+    integration.model.chat_completion.assert_called_once()
+
+
+def test_fused_response_short_interpretations(integration):
+    """Test that commands without an interpretation are reported as errors."""
+    result = _analyze(integration, json.dumps({
+        "description": "A login screen",
+        "suggestions": [],
+        "interpretations": [{"action": "click_element", "parameters": {"element_id": "login"}}]
+    }))
+
+    assert result["interpretations"]["tap login"]["status"] == "success"
+    assert result["interpretations"]["go back"]["status"] == "error"
+    assert result["interpretations"]["go back"]["message"] == "No interpretation returned"
+
+
+def test_fused_response_malformed_interpretations(integration):
+    """Test that interpretations that are not a list of commands are reported as errors."""
+    result = _analyze(integration, json.dumps({
+        "description": "A login screen",
+        "suggestions": "Tap login",
+        "interpretations": {"tap login": {"action": "click_element"}}
+    }))
+
+    assert result["suggestions"] == ["Tap login"]
+    assert all(item["status"] == "error" for item in result["interpretations"].values())
+
+
+def test_fused_response_missing_action(integration):
+    """Test that an interpretation without an action is reported as an error."""
+    result = _analyze(integration, json.dumps({
+        "interpretations": [{"parameters": {}}, "back"]
+    }))
+
+    assert result["description"] == ""
+    assert result["interpretations"]["tap login"]["message"] == "Missing 'action' in response"
+    assert result["interpretations"]["go back"]["status"] == "error"
+
+
+@pytest.mark.parametrize("response", ["not json", "[1, 2]"])
+def test_fused_response_invalid(integration, response):
+    """Test that a response that is not a JSON object fails every part."""
+    result = _analyze(integration, response)
+
+    assert set(result["interpretations"]) == set(COMMANDS)
+    assert all(item["status"] == "error" for item in result["interpretations"].values())
+    assert result["suggestions"] == [result["description"]]
+
+
+def test_fused_request_error(integration):
+    """Test that a failed request is reported for every part."""
+    integration.model.chat_completion.side_effect = ai_integration.AIProviderError("offline")
+
+    result = integration.describe_suggest_and_interpret("<hierarchy/>", COMMANDS)
+
+    assert "offline" in result["description"]
+    assert all("offline" in item["message"] for item in result["interpretations"].values())
@@ -0,0 +1,180 @@
+"""
+Tests for the AI retry logic
+============================
+
+This module contains tests for the retry classification and backoff of
+AIModelInterface and the Hugging Face model.
+"""
+
+import importlib.util
+import sys
+
+import pytest
+import requests
+from unittest.mock import MagicMock, patch
+
+from mcp_appium import ai_integration
+from mcp_appium.ai_integration import AIModelConfig, HuggingFaceModel
+from mcp_appium.errors import (
+    AIAuthenticationError, AIConnectionError, AIProviderError,
+    AIQuotaExceededError, AIServiceUnavailableError
+)
+
+
+class _StatusError(Exception):
+    """Error carrying an HTTP status, like the OpenAI API errors."""
+
+    def __init__(self, status_code):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+
+
+class _GoogleAPIError(Exception):
+    """Error carrying an HTTP status as ``code``, like google.api_core errors."""
+
+    def __init__(self, code):
+        super().__init__(f"code {code}")
+        self.code = code
+
+
+@pytest.fixture
+def model():
+    """Create a Hugging Face model that retries three times without sleeping."""
+    model = HuggingFaceModel(api_key="hf_test", config=AIModelConfig(max_retries=3, retry_delay=0))
+    yield model
+    model.close()
+
+
+def _response(status_code, content=b""):
+    """Create a mock HTTP response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = content
+    response.text = content.decode("utf-8")
+    return response
+
+
+@pytest.mark.parametrize("error", [
+    requests.exceptions.ConnectionError("reset"),
+    requests.exceptions.Timeout("slow"),
+    AIConnectionError("down"),
+    AIQuotaExceededError("rate limited"),
+    AIServiceUnavailableError("loading", status_code=503),
+    _StatusError(429),
+    _StatusError(502),
+    _GoogleAPIError(503),
+    _GoogleAPIError(504),
+])
+def test_is_retryable(model, error):
+    """Test that transient errors are retried."""
+    assert model._is_retryable(error)
+
+
+@pytest.mark.parametrize("error", [
+    AIAuthenticationError("bad key"),
+    AIProviderError("bad request"),
+    ValueError("bad value"),
+    _StatusError(400),
+    _GoogleAPIError(401),
+])
+def test_is_not_retryable(model, error):
+    """Test that errors a retry cannot fix are not retried."""
+    assert not model._is_retryable(error)
+
+
+def test_is_retryable_wrapped_error(model):
+    """Test that a provider error caused by a transient error is retried."""
+    try:
+        try:
+            raise requests.exceptions.Timeout("slow")
+        except requests.exceptions.Timeout as e:
+            raise AIProviderError("request failed") from e
+    except AIProviderError as e:
+        assert model._is_retryable(e)
+
+
+def test_gemini_errors_retryable(model):
+    """Test that transient google.api_core errors are retried."""
+    exceptions = pytest.importorskip("google.api_core.exceptions")
+
+    assert model._is_retryable(exceptions.ServiceUnavailable("unavailable"))
+    assert model._is_retryable(exceptions.ResourceExhausted("quota"))
+    assert model._is_retryable(exceptions.DeadlineExceeded("deadline"))
+    assert not model._is_retryable(exceptions.PermissionDenied("denied"))
+
+
+def test_retry_with_backoff_recovers(model):
+    """Test that a transient failure is retried until it succeeds."""
+    func = MagicMock(side_effect=[AIServiceUnavailableError("loading", status_code=503), "ok"])
+
+    with patch.object(ai_integration.time, "sleep") as sleep:
+        assert model._retry_with_backoff(func) == "ok"
+
+    assert func.call_count == 2
+    sleep.assert_called_once()
+
+
+def test_retry_with_backoff_gives_up(model):
+    """Test that the last transient failure is raised after max_retries attempts."""
+    func = MagicMock(side_effect=requests.exceptions.ConnectionError("reset"))
+
+    with patch.object(ai_integration.time, "sleep"):
+        with pytest.raises(AIConnectionError, match="after 3 attempts"):
+            model._retry_with_backoff(func)
+
+    assert func.call_count == 3
+
+
+def test_retry_with_backoff_fails_fast(model):
+    """Test that a non-retryable error is raised from the first attempt."""
+    func = MagicMock(side_effect=AIAuthenticationError("bad key"))
+
+    with patch.object(ai_integration.time, "sleep") as sleep:
+        with pytest.raises(AIAuthenticationError):
+            model._retry_with_backoff(func)
+
+    assert func.call_count == 1
+    sleep.assert_not_called()
+
+
+@pytest.mark.parametrize("status_code", [502, 503, 504])
+def test_huggingface_retries_unavailable(model, status_code):
+    """Test that Hugging Face 502/503/504 responses are retried."""
+    responses = [_response(status_code, b"Model is loading"), _response(200, b'[{"generated_text": "hi"}]')]
+
+    with patch.object(model._session, "post", side_effect=responses) as post, \
+            patch.object(ai_integration.time, "sleep"):
+        assert model.chat_completion("system", "user") == "hi"
+
+    assert post.call_count == 2
+
+
+def test_huggingface_does_not_retry_client_error(model):
+    """Test that other Hugging Face error statuses fail on the first attempt."""
+    with patch.object(model._session, "post", return_value=_response(400, b"Bad input")) as post:
+        with pytest.raises(AIProviderError, match="400"):
+            model.chat_completion("system", "user")
+
+    assert post.call_count == 1
+
+
+def test_retry_without_openai():
+    """Test that the retry logic works when the openai package is not installed."""
+    spec = importlib.util.spec_from_file_location("_ai_integration_without_openai", ai_integration.__file__)
+    module = importlib.util.module_from_spec(spec)
+    with patch.dict(sys.modules, {"openai": None, "openai.types.chat": None}):
+        spec.loader.exec_module(module)
+
+    assert not module.OPENAI_AVAILABLE
+
+    model = module.HuggingFaceModel(api_key="hf_test", config=module.AIModelConfig(max_retries=2, retry_delay=0))
+    try:
+        assert model._is_retryable(requests.exceptions.Timeout("slow"))
+        assert not model._is_retryable(ValueError("bad value"))
+
+        func = MagicMock(side_effect=requests.exceptions.ConnectionError("reset"))
+        with patch.object(module.time, "sleep"):
+            with pytest.raises(AIConnectionError):
+                model._retry_with_backoff(func)
+    finally:
+        model.close()
@@ -0,0 +1,98 @@
+"""
+Tests for the shared example helpers
+====================================
+
+This module contains tests for the minimal command line parser and JSON
+helpers of the examples.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples"))
+
+from example_utils import format_json, json_dumps, json_loads, parse_options
+
+
+USAGE = "usage: example.py [--provider {openai,gemini}] [--model MODEL]\n\noptions:\n  -h, --help\n"
+OPTIONS = {"--provider": "provider", "--model": "model"}
+DEFAULTS = {"provider": "openai", "model": None}
+CHOICES = {"provider": ("openai", "gemini")}
+
+
+def _parse(argv):
+    """Parse arguments with the test options."""
+    return parse_options(argv, USAGE, OPTIONS, DEFAULTS, CHOICES)
+
+
+def test_parse_options_defaults():
+    """Test that unset options keep their defaults."""
+    args = _parse([])
+
+    assert args.provider == "openai"
+    assert args.model is None
+
+
+@pytest.mark.parametrize("argv", [
+    ["--provider", "gemini", "--model", "gemini-pro"],
+    ["--provider=gemini", "--model=gemini-pro"],
+    ["--model", "other", "--provider=gemini", "--model", "gemini-pro"],
+])
+def test_parse_options_values(argv):
+    """Test both option forms, with the last occurrence winning."""
+    args = _parse(argv)
+
+    assert args.provider == "gemini"
+    assert args.model == "gemini-pro"
+
+
+def test_parse_options_value_with_equals():
+    """Test that only the first "=" separates the flag from its value."""
+    assert _parse(["--model=a=b"]).model == "a=b"
+
+
+@pytest.mark.parametrize("argv, message", [
+    (["--bogus"], "unrecognized arguments: --bogus"),
+    (["extra"], "unrecognized arguments: extra"),
+    (["--model"], "argument --model: expected one argument"),
+    (["--provider", "ollama"], "argument --provider: invalid choice: 'ollama' (choose from 'openai', 'gemini')"),
+])
+def test_parse_options_errors(argv, message, capsys):
+    """Test that invalid arguments exit with status 2 and an argparse-style error."""
+    with pytest.raises(SystemExit) as exc_info:
+        _parse(argv)
+
+    assert exc_info.value.code == 2
+    err = capsys.readouterr().err
+    assert err.startswith("usage: example.py")
+    assert f"example.py: error: {message}" in err
+
+
+@pytest.mark.parametrize("flag", ["-h", "--help"])
+def test_parse_options_help(flag, capsys):
+    """Test that help prints the usage and exits with status 0."""
+    with pytest.raises(SystemExit) as exc_info:
+        _parse([flag])
+
+    assert exc_info.value.code == 0
+    assert capsys.readouterr().out == USAGE
+
+
+def test_parse_options_reads_sys_argv(monkeypatch):
+    """Test that sys.argv is parsed when no arguments are given."""
+    monkeypatch.setattr(sys, "argv", ["example.py", "--model", "m"])
+
+    assert parse_options(None, USAGE, OPTIONS, DEFAULTS).model == "m"
+
+
+def test_json_helpers():
+    """Test that the JSON helpers round-trip and pretty-print."""
+    obj = {"name": "tap", "arguments": {"x": 1, "labels": ["a", "é"]}}
+
+    assert isinstance(json_dumps(obj), bytes)
+    assert json_loads(json_dumps(obj)) == obj
+    assert json_loads(json_dumps(obj).decode("utf-8")) == obj
+    assert json_loads(format_json(obj)) == obj
+    assert format_json(obj).startswith('{\n  "name"')
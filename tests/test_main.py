@@ -0,0 +1,77 @@
+"""
+Tests for the command line entry point
+======================================
+
+This module contains tests checking that main.parse_args matches argparse.
+"""
+
+import pytest
+
+import main
+
+
+@pytest.mark.parametrize("argv", [
+    [],
+    ["--server"],
+    ["--debug"],
+    ["--server", "--host", "127.0.0.1", "--port", "6000"],
+    ["--host=localhost", "--port=6001", "--log-level=DEBUG"],
+    ["--appium-url", "http://appium:4723", "--web-port", "9000"],
+    ["--log-level", "WARNING", "--debug", "--web-port=9001"],
+    ["--port", "6000", "--port", "7000"],
+])
+def test_parse_args_matches_argparse(argv):
+    """Test that valid arguments parse the same as with argparse."""
+    assert vars(main.parse_args(argv)) == vars(main._build_parser().parse_args(argv))
+
+
+@pytest.mark.parametrize("argv", [
+    ["--port", "abc"],
+    ["--web-port=1.5"],
+    ["--log-level", "LOUD"],
+    ["--log-level=debug"],
+    ["--bogus"],
+    ["--server=yes"],
+    ["--port"],
+    ["extra"],
+])
+def test_parse_args_rejects_invalid(argv, capsys):
+    """Test that invalid arguments exit with the argparse usage error."""
+    with pytest.raises(SystemExit) as exc_info:
+        main.parse_args(argv)
+
+    assert exc_info.value.code == 2
+    assert "error:" in capsys.readouterr().err
+
+
+def test_parse_args_help(capsys):
+    """Test that --help prints the argparse help."""
+    with pytest.raises(SystemExit) as exc_info:
+        main.parse_args(["--help"])
+
+    assert exc_info.value.code == 0
+    assert "--appium-url" in capsys.readouterr().out
+
+
+def test_main_help_creates_no_directories(tmp_path, monkeypatch):
+    """Test that --help exits before the data directories are created."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(main.sys, "argv", ["main.py", "--help"])
+
+    with pytest.raises(SystemExit):
+        main.main()
+
+    assert not (tmp_path / "data").exists()
+
+
+def test_main_creates_directories(tmp_path, monkeypatch):
+    """Test that a valid invocation creates the data directories."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(main.sys, "argv", ["main.py", "--server"])
+    monkeypatch.setattr(main, "_setup_logging", lambda level_name: None)
+    monkeypatch.setattr(main, "run_server", lambda args: None)
+
+    main.main()
+
+    for path in main._DIRS:
+        assert (tmp_path / path).is_dir()
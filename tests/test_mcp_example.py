@@ -0,0 +1,74 @@
+"""
+Tests for the MCP client example
+================================
+
+This module contains tests for the helpers of the mcp_example script.
+"""
+
+import base64
+import os
+import sys
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples"))
+
+import mcp_example
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty tool result cache."""
+    mcp_example._CACHE.clear()
+    yield
+    mcp_example._CACHE.clear()
+
+
+def _response(content, status_code=200):
+    """Create a mock HTTP response with the given body."""
+    response = MagicMock()
+    response.content = content
+    response.status_code = status_code
+    return response
+
+
+@pytest.mark.parametrize("content", [b"<html>Bad Gateway</html>", b""])
+def test_call_mcp_tool_non_json_body(content):
+    """Test that a body that is not JSON is reported as an error."""
+    with patch.object(mcp_example._SESSION, "post", return_value=_response(content)):
+        result = mcp_example.call_mcp_tool("http://server", "get_page_source")
+
+    assert "error" in result
+
+
+def test_call_mcp_tool_json_body():
+    """Test that a JSON body is returned as the tool result."""
+    content = b'{"status": "success", "page_source": "<hierarchy/>"}'
+    with patch.object(mcp_example._SESSION, "post", return_value=_response(content)):
+        result = mcp_example.call_mcp_tool("http://server", "get_page_source")
+
+    assert result == {"status": "success", "page_source": "<hierarchy/>"}
+
+
+@pytest.mark.parametrize("wrap", [None, 76, 64])
+def test_save_screenshot_result(tmp_path, wrap):
+    """Test that plain and line-wrapped base64 screenshots are decoded intact."""
+    data = bytes(range(256)) * 1000
+    encoded = base64.b64encode(data).decode("ascii")
+    if wrap:
+        encoded = "\n".join(encoded[i:i + wrap] for i in range(0, len(encoded), wrap)) + "\n"
+    filename = tmp_path / "screenshot.png"
+
+    with patch.object(mcp_example, "SCREENSHOT_CHUNK_SIZE", 1024):
+        assert mcp_example.save_screenshot_result({"status": "success", "screenshot": encoded}, str(filename))
+
+    assert filename.read_bytes() == data
+
+
+def test_save_screenshot_result_failure(tmp_path):
+    """Test that a failed screenshot is not written."""
+    filename = tmp_path / "screenshot.png"
+
+    assert not mcp_example.save_screenshot_result({"status": "error", "message": "no session"}, str(filename))
+    assert not filename.exists()
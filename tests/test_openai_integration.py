@@ -0,0 +1,62 @@
+"""
+Tests for the OpenAI integration
+================================
+
+This module contains tests for the MCPOpenAIIntegration class.
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from mcp_appium import openai_integration
+from mcp_appium.errors import SessionError
+from mcp_appium.openai_integration import MCPOpenAIIntegration
+
+
+@pytest.fixture
+def integration(monkeypatch):
+    """Create an OpenAI integration with a mock Appium client and session."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    with patch.object(openai_integration, "OpenAI"):
+        integration = MCPOpenAIIntegration(appium_client=MagicMock())
+    integration.session = MagicMock()
+    return integration
+
+
+def test_wait_for_idle_settled(integration):
+    """Test that two identical page sources in a row count as settled."""
+    integration.session.get_page_source.side_effect = ["<a/>", "<b/>", "<b/>", "<c/>"]
+
+    assert integration.wait_for_idle(timeout=1.0, poll_frequency=0)
+    assert integration.session.get_page_source.call_count == 3
+
+
+def test_wait_for_idle_still_changing(integration):
+    """Test that a screen changing until the timeout is reported as not settled."""
+    sources = (f"<screen{n}/>" for n in range(1000000))
+    integration.session.get_page_source.side_effect = lambda: next(sources)
+
+    assert not integration.wait_for_idle(timeout=0.05, poll_frequency=0.01)
+
+
+def test_wait_for_idle_polling_error(integration):
+    """Test that a failure to read the page source is reported as not settled."""
+    integration.session.get_page_source.side_effect = SessionError("session closed")
+
+    assert not integration.wait_for_idle(timeout=1.0, poll_frequency=0)
+
+
+def test_wait_for_idle_unexpected_error(integration):
+    """Test that errors other than Appium MCP errors are not swallowed."""
+    integration.session.get_page_source.side_effect = RuntimeError("bug")
+
+    with pytest.raises(RuntimeError):
+        integration.wait_for_idle(timeout=1.0, poll_frequency=0)
+
+
+def test_wait_for_idle_without_session(integration):
+    """Test that there is nothing to wait for without a session."""
+    integration.session = None
+
+    assert not integration.wait_for_idle()
+
@@ -0,0 +1,270 @@
+"""
+Tests for the Robot Framework generators
+========================================
+
+This module contains tests for the variables emitted by the
+RobotMobileGenerator and RobotWebGenerator examples.
+"""
+
+import io
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples"))
+
+import robot_mobile_generator
+from robot_mobile_generator import RobotMobileGenerator
+from robot_web_generator import RobotWebGenerator
+
+
+def _variables(text):
+    """Parse ``${NAME}    value`` lines into a dict."""
+    variables = {}
+    for line in text.splitlines():
+        if line.startswith("${"):
+            name, _, value = line.partition("    ")
+            variables[name] = value
+    return variables
+
+
+def _web_variables(generator):
+    """Get the variables written by a web generator."""
+    out = io.StringIO()
+    generator._write_variables_section(out)
+    return out.getvalue()
+
+
+def test_mobile_custom_config_variables():
+    """Test that custom mobile selectors override the defaults."""
+    generator = RobotMobileGenerator("apps/custom.apk", {
+        "login": {"username_field": "username-input"},
+        "checkout": {}
+    })
+    text = generator._generate_variables_section()
+    variables = _variables(text)
+
+    assert text.startswith("*** Variables ***\n")
+    assert variables["${APP_PATH}"] == "apps/custom.apk"
+    assert variables["${PLATFORM_NAME}"] == "Android"
+    assert variables["${AUTOMATION_NAME}"] == "UiAutomator2"
+    assert variables["${USERNAME_FIELD}"] == "username-input"
+    assert variables["${PASSWORD_FIELD}"] == "//android.widget.EditText[2]"
+    assert variables["${USERNAME}"] == "username"
+    assert variables["${PASSWORD}"] == "password"
+    assert variables["${CHECKOUT_BUTTON}"] == '//android.widget.Button[contains(@text,"Checkout")]'
+    assert "${PRODUCT_ITEM}" not in variables
+    assert "# Product page selectors" not in text
+
+
+def test_mobile_predefined_config_variables():
+    """Test the variables of an app with a predefined configuration."""
+    generator = RobotMobileGenerator("apps/sauce_labs_demo.apk")
+    variables = _variables(generator._generate_variables_section())
+
+    assert variables["${USERNAME_FIELD}"] == "test-Username"
+    assert variables["${USERNAME}"] == "standard_user"
+    assert variables["${PASSWORD}"] == "secret_sauce"
+    assert variables["${PRODUCTS_CONTAINER}"] == "accessibility_id=test-PRODUCTS"
+    assert variables["${SUCCESS_MESSAGE}"] == "//android.widget.TextView[@text='THANK YOU FOR YOU ORDER']"
+
+
+def test_mobile_ios_capabilities():
+    """Test that the iOS platform emits XCUITest capabilities."""
+    generator = RobotMobileGenerator("apps/custom.apk", platform="ios")
+    variables = _variables(generator._generate_variables_section())
+
+    assert variables["${PLATFORM_NAME}"] == "iOS"
+    assert variables["${AUTOMATION_NAME}"] == "XCUITest"
+    assert variables["${DEVICE_NAME}"] == "iPhone Simulator"
+
+
+def test_mobile_unsupported_platform():
+    """Test that an unknown platform is rejected."""
+    with pytest.raises(ValueError):
+        RobotMobileGenerator("apps/custom.apk", platform="windows")
+
+
+def test_mobile_suite_contains_variables(tmp_path):
+    """Test that the written suite contains the variables section."""
+    generator = RobotMobileGenerator("apps/custom.apk", {"login": {"username_field": "u"}})
+    output_file = tmp_path / "mobile.robot"
+
+    assert generator.generate_robot_suite(str(output_file))
+    assert generator._generate_variables_section() in output_file.read_text(encoding="utf-8")
+
+
+def test_web_custom_config_variables():
+    """Test that custom web selectors and credentials are emitted."""
+    generator = RobotWebGenerator("https://shop.example", {
+        "login": {
+            "username_selector": "#user",
+            "credentials": [{"username": "bob", "password": "hunter2"}]
+        },
+        "checkout": {}
+    })
+    text = _web_variables(generator)
+    variables = _variables(text)
+
+    assert text.startswith("*** Variables ***\n")
+    assert variables["${URL}"] == "https://shop.example"
+    assert variables["${USERNAME_SELECTOR}"] == "#user"
+    assert variables["${PASSWORD_SELECTOR}"] == "input[type='password']"
+    assert variables["${USERNAME}"] == "bob"
+    assert variables["${PASSWORD}"] == "hunter2"
+    assert variables["${CHECKOUT_BUTTON_SELECTOR}"] == "button.checkout"
+    assert "${PRODUCT_ITEM_SELECTOR}" not in variables
+
+
+def test_web_predefined_config_variables():
+    """Test the variables of a website with a predefined configuration."""
+    generator = RobotWebGenerator("https://www.saucedemo.com")
+    variables = _variables(_web_variables(generator))
+
+    assert variables["${USERNAME_SELECTOR}"] == "input[data-test='username']"
+    assert variables["${USERNAME}"] == "standard_user"
+    assert variables["${PASSWORD}"] == "secret_sauce"
+    assert variables["${PRODUCT_ITEM_SELECTOR}"] == ".inventory_item"
+    assert variables["${CART_BUTTON}"] == ".shopping_cart_link"
+
+
+def test_web_suite_contains_variables(tmp_path):
+    """Test that the written suite contains the variables section."""
+    generator = RobotWebGenerator("https://shop.example", {"login": {}})
+    output_file = tmp_path / "web.robot"
+
+    assert generator.generate_robot_suite(str(output_file))
+    assert _web_variables(generator) in output_file.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("url", [
+    "https://saucedemo.com",
+    "https://www.saucedemo.com",
+    "https://www.saucedemo.com:443/",
+    "https://user@saucedemo.com/",
+    "https://WWW.SauceDemo.com/inventory.html",
+])
+def test_web_predefined_config_match(url):
+    """Test that predefined configs match the host name exactly or as a subdomain."""
+    assert RobotWebGenerator(url).config_key == "saucedemo.com"
+
+
+@pytest.mark.parametrize("url", [
+    "https://notsaucedemo.com",
+    "https://saucedemo.com.evil.example",
+])
+def test_web_predefined_config_no_match(url):
+    """Test that other hosts ending in a configured name get the generic config."""
+    assert RobotWebGenerator(url).config_key != "saucedemo.com"
+
+
+@pytest.mark.parametrize("locator, expected", [
+    ("//android.widget.Button[@content-desc='test-LOGIN']", "accessibility_id=test-LOGIN"),
+    ('//android.view.ViewGroup[@content-desc="test-Item title"]', "accessibility_id=test-Item title"),
+    ("//android.widget.EditText[@resource-id='com.example:id/user']", "id=com.example:id/user"),
+    ("//android.widget.TextView[@text='Products']", "//android.widget.TextView[@text='Products']"),
+    ("//android.widget.Button[@content-desc='a' and @enabled='true']",
+     "//android.widget.Button[@content-desc='a' and @enabled='true']"),
+    ("//android.widget.Button[@content-desc='a\"]", "//android.widget.Button[@content-desc='a\"]"),
+    ("//android.widget.EditText[@resource-id='u' or @resource-id='v']",
+     "//android.widget.EditText[@resource-id='u' or @resource-id='v']"),
+    ("accessibility_id=test-Cart", "accessibility_id=test-Cart"),
+    ("test-Username", "test-Username"),
+])
+def test_optimize_locator(locator, expected):
+    """Test that only single-attribute content-desc/resource-id XPaths are rewritten."""
+    assert robot_mobile_generator._optimize_locator(locator) == expected
+
+
+
+def test_predefined_configs_are_read_only():
+    """Test that shared predefined configurations cannot be modified."""
+    config = RobotMobileGenerator("apps/sauce_labs_demo.apk").config
+
+    with pytest.raises(TypeError):
+        config["login"]["username_field"] = "changed"
+    with pytest.raises(TypeError):
+        config["login"]["credentials"][0]["username"] = "changed"
+
+
+def test_custom_config_used_as_given():
+    """Test that a custom configuration is used without copying or freezing it."""
+    config = {"login": {"username_field": "u"}}
+
+    assert RobotMobileGenerator("apps/custom.apk", config).config is config
+
+
+def test_predefined_config_suite_cached():
+    """Test that apps sharing a predefined configuration reuse the generated suite."""
+    first = RobotMobileGenerator("apps/sauce_labs_demo.apk")
+    second = RobotMobileGenerator("apps/sauce_labs_demo.apk")
+
+    assert first.config_key == "sauce_labs_demo"
+    assert first._suite_text() is second._suite_text()
+
+
+def _product_steps(product_page, platform="android"):
+    """Get the steps adding the indexed product for a product page config."""
+    generator = RobotMobileGenerator("apps/custom.apk", {"product_page": product_page}, platform=platform)
+    return generator._product_in_list_steps()
+
+
+_ACCESSIBILITY_PRODUCT_PAGE = {
+    "product_item": "accessibility_id=test-Item",
+    "product_name": "//android.widget.TextView[@content-desc='test-Item title']",
+    "add_to_cart_button": "accessibility_id=test-ADD TO CART"
+}
+
+
+def test_product_steps_android_accessibility_ids():
+    """Test that Android accessibility IDs are indexed in one UiAutomator query."""
+    assert _product_steps(_ACCESSIBILITY_PRODUCT_PAGE) == [
+        '    ${item}=    Set Variable    android=new UiSelector().description("test-Item").instance(${index})',
+        '    ${product_name}=    Get Text    ${item}.childSelector(new UiSelector().description("test-Item title"))',
+        '    Click Element    ${item}.childSelector(new UiSelector().description("test-ADD TO CART"))'
+    ]
+
+
+def test_product_steps_ios_accessibility_ids():
+    """Test that iOS accessibility IDs are indexed (1-based) in one class chain query."""
+    assert _product_steps(_ACCESSIBILITY_PRODUCT_PAGE, platform="ios") == [
+        "    ${position}=    Evaluate    ${index} + 1",
+        '    ${item}=    Set Variable    chain=**/*[`name == "test-Item"`][${position}]',
+        '    ${product_name}=    Get Text    ${item}/**/*[`name == "test-Item title"`]',
+        '    Click Element    ${item}/**/*[`name == "test-ADD TO CART"`]'
+    ]
+
+
+def test_product_steps_xpath():
+    """Test that XPath selectors are indexed (1-based) in the XPath itself."""
+    steps = _product_steps({})
+
+    assert steps == [
+        "    ${position}=    Evaluate    ${index} + 1",
+        "    ${item}=    Set Variable    xpath=(${PRODUCT_ITEM})[${position}]",
+        "    ${product_name}=    Get Text    ${item}${PRODUCT_NAME}",
+        "    Click Element    ${item}${ADD_TO_CART_BUTTON}"
+    ]
+    assert not any("Get WebElements" in step for step in steps)
+
+
+def test_product_steps_other_locators():
+    """Test that other locator strategies fall back to indexing every item in Robot."""
+    steps = _product_steps({
+        "product_item": "class=android.view.ViewGroup",
+        "product_name": "//android.widget.TextView",
+        "add_to_cart_button": "accessibility_id=test-ADD TO CART"
+    })
+
+    assert steps[0] == "    ${product_elements}=    Get WebElements    ${PRODUCT_ITEM}"
+    assert steps[1] == "    ${product}=    Get From List    ${product_elements}    ${index}"
+
+
+def test_product_steps_in_keyword():
+    """Test that the Add Product To Cart keyword uses the indexed steps."""
+    generator = RobotMobileGenerator("apps/custom.apk", {"product_page": _ACCESSIBILITY_PRODUCT_PAGE})
+    keywords = generator._generate_keywords_section()
+
+    assert "\n".join(generator._product_in_list_steps()) in keywords
+    assert "    [Return]    ${product_name}" in keywords
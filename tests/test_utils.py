@@ -0,0 +1,100 @@
+"""
+Tests for the utils module
+=========================
+
+This module contains tests for the page source helpers.
+"""
+
+import json
+import xml.etree.ElementTree as ET
+from xml.parsers import expat
+
+import pytest
+
+from mcp_appium.utils import strip_layout, summarize_page_source, xml_to_compact_json
+
+
+PAGE_SOURCE = """
+<hierarchy rotation="0">
+  <android.widget.FrameLayout class="android.widget.FrameLayout" bounds="[0,0][1080,2220]">
+    <android.widget.LinearLayout class="android.widget.LinearLayout" bounds="[0,0][1080,2220]">
+      <android.widget.TextView class="android.widget.TextView" text="Products" bounds="[43,66][402,156]"/>
+      <android.view.ViewGroup class="android.view.ViewGroup" content-desc="test-Item" bounds="[0,200][540,800]">
+        <android.widget.ImageView class="android.widget.ImageView" bounds="[10,210][530,600]"/>
+      </android.view.ViewGroup>
+      <android.widget.EditText class="android.widget.EditText" text="" hint="Username" resource-id="com.example:id/user" bounds="[40,900][1040,1000]"/>
+      <android.widget.Button class="android.widget.Button" text="Login" checked="false" bounds="[40,1100][1040,1200]"/>
+    </android.widget.LinearLayout>
+  </android.widget.FrameLayout>
+</hierarchy>
+"""
+
+
+def test_strip_layout():
+    """Test that layout container tags are removed and their children kept."""
+    stripped = strip_layout(PAGE_SOURCE)
+
+    assert "FrameLayout" not in stripped
+    assert "LinearLayout" not in stripped
+    assert "ViewGroup" not in stripped
+    assert '<android.widget.TextView class="android.widget.TextView" text="Products"' in stripped
+    assert "<android.widget.ImageView" in stripped
+    assert stripped.count("<android.widget.") == 4
+
+
+def test_strip_layout_keeps_similar_tags():
+    """Test that tags only starting with a layout class name are kept."""
+    source = '<android.widget.FrameLayoutCompat text="a"/><android.view.ViewGroup/>'
+
+    assert strip_layout(source) == '<android.widget.FrameLayoutCompat text="a"/>'
+
+
+def test_xml_to_compact_json():
+    """Test that leaf elements become compact JSON entries."""
+    nodes = json.loads(xml_to_compact_json(PAGE_SOURCE))
+
+    assert nodes == [
+        {"t": "TextView", "x": "Products", "b": [43, 66, 402, 156]},
+        {"t": "ImageView", "b": [10, 210, 530, 600]},
+        {"t": "EditText", "h": "Username", "id": "com.example:id/user", "b": [40, 900, 1040, 1000]},
+        {"t": "Button", "x": "Login", "c": "false", "b": [40, 1100, 1040, 1200]}
+    ]
+
+
+def test_xml_to_compact_json_empty_hierarchy():
+    """Test that a page without elements becomes an empty array."""
+    assert xml_to_compact_json("<hierarchy/>") == "[]"
+
+
+def test_xml_to_compact_json_invalid():
+    """Test that malformed XML is rejected."""
+    with pytest.raises(ET.ParseError):
+        xml_to_compact_json("<hierarchy>")
+
+
+def test_summarize_page_source():
+    """Test that labelled elements are summarized one per line."""
+    assert summarize_page_source(PAGE_SOURCE).splitlines() == [
+        "TextView 'Products' [43,66,402,156]",
+        "ViewGroup 'test-Item' [0,200,540,800]",
+        "EditText 'Username' [40,900,1040,1000]",
+        "Button 'Login' [40,1100,1040,1200]"
+    ]
+
+
+def test_summarize_page_source_without_bounds():
+    """Test that elements without bounds are summarized without coordinates."""
+    source = '<hierarchy><node class="android.widget.TextView" text="Hello"/></hierarchy>'
+
+    assert summarize_page_source(source) == "TextView 'Hello'"
+
+
+def test_summarize_page_source_unlabelled():
+    """Test that a page without labelled elements gives an empty summary."""
+    assert summarize_page_source("<hierarchy><node bounds='[0,0][1,1]'/></hierarchy>") == ""
+
+
+def test_summarize_page_source_invalid():
+    """Test that malformed XML is rejected."""
+    with pytest.raises(expat.ExpatError):
+        summarize_page_source("<hierarchy><node>")